@@ -1,3 +1,3 @@
-#!/bin/bash
-
+#!/bin/bash
+
 $PWD/env/Scripts/python -m unittest discover -v tests/unit
\ No newline at end of file
@@ -1,33 +1,58 @@
-from flask import Flask
-import os
-import logging
-from portfolio.db import mydb
-from portfolio.mysql_db import (
-    Hobbies,
-    Projects,
-    Timeline,
-)
-from peewee import DatabaseError
-
-
-def create_app():
-    """Construct the core application."""
-    app = Flask(__name__, template_folder="templates")
-    print(os.getenv("TEST"))
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    )
-    logger = logging.getLogger(__name__)
-
-    with app.app_context():
-        from portfolio import routes
-
-        try:
-            mydb.connect()
-            mydb.create_tables([Hobbies, Projects, Timeline])
-            logger.info("Tables created successfully")
-            mydb.close()
-        except DatabaseError as e:
-            logger.error("Database error: %s", e)
-        return app
+from flask import Flask
+import os
+import logging
+from portfolio.db import mydb
+from portfolio import timeline
+from portfolio.migrations import migrate_models
+from portfolio.mysql_db import (
+    Hobbies,
+    Projects,
+    Timeline,
+    Tombstone,
+)
+from peewee import DatabaseError
+
+
+def create_app():
+    """Construct the core application."""
+    app = Flask(__name__, template_folder="templates")
+    print(os.getenv("TEST"))
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    logger = logging.getLogger(__name__)
+
+    with app.app_context():
+        from portfolio import routes
+        from portfolio.commands import register_commands
+
+        register_commands(app)
+
+        try:
+            mydb.connect()
+            mydb.create_tables([Hobbies, Projects, Timeline, Tombstone])
+            logger.info("Tables created successfully")
+            added = migrate_models(mydb, [Hobbies, Projects, Timeline, Tombstone])
+            logger.info("Migrations applied successfully")
+            # Once, when the derived columns are added; `flask backfill-timeline`
+            # reruns it.
+            if "display_date" in added[Timeline._meta.table_name]:
+                enriched = timeline.backfill(Timeline)
+                logger.info("Enriched %s timeline events", enriched)
+            mydb.close()
+        except DatabaseError as e:
+            logger.error("Database error: %s", e)
+
+        from portfolio.compression import init_compression
+        from portfolio.export import init_export
+        from portfolio.filters import init_filters
+        from portfolio.templating import init_templating
+        from portfolio.warmup import init_warmup
+
+        init_compression(app)
+        init_filters(app)
+        init_templating(app)
+        init_warmup(app)
+        init_export(app)
+        return app
@@ -1,241 +1,572 @@
-import json
-from portfolio.mysql_db import Timeline, Hobbies, Projects
-from flask import request, jsonify
-from typing import Tuple, Type, Optional, List
-from peewee import Model, DatabaseError, DoesNotExist
-import logging
-
-from portfolio.constants import StatusCodeLiteral
-
-logger = logging.getLogger(__name__)
-
-
-class APIBase:
-    model: Type[Model]
-
-    @classmethod
-    def get_all(cls) -> Tuple[str, StatusCodeLiteral]:
-        try:
-            data = list(cls.model.select().dicts())
-            return jsonify(data).get_data(as_text=True), 200
-        except DatabaseError as e:
-            logger.error("Database error on GET: %s", e)
-            return jsonify({"error": str(e)}).get_data(as_text=True), 500
-
-    @classmethod
-    def get_by_id(cls, item_id: int) -> Tuple[str, StatusCodeLiteral]:
-        try:
-            item = cls.model.get_by_id(item_id)
-            if item:
-                return jsonify(item.__data__).get_data(as_text=True), 200
-            else:
-                return jsonify({"error": "Item not found"}).get_data(as_text=True), 404
-        except DatabaseError as e:
-            logger.error("Database error on GET by ID: %s", e)
-            return jsonify({"error": str(e)}).get_data(as_text=True), 500
-
-    @classmethod
-    def create(cls) -> Tuple[str, StatusCodeLiteral]:
-        try:
-            data = request.get_json(force=True)
-            logger.debug("POST Data: %s", data)
-
-            def get_expected_keys(model_name: str) -> dict:
-                match model_name:
-                    case "Timeline":
-                        return {
-                            "timeline_id": "<int>",
-                            "title": "<str>",
-                            "description": "<str>",
-                            "date": "<datetime>",
-                            "image": "<str>",
-                            "url": "<str>",
-                        }
-                    case "Hobbies":
-                        return {
-                            "hobbies_id": "<int>",
-                            "name": "<str>",
-                            "description": "<str>",
-                            "image": "<str>",
-                        }
-                    case "Projects":
-                        return {
-                            "projects_id": "<int>",
-                            "name": "<str>",
-                            "description": "<str>",
-                            "url": "<str>",
-                            "language": "<str>",
-                        }
-                    case _:
-                        return {}
-
-            if isinstance(data, list):
-                for item in data:
-                    if not isinstance(item, dict):
-                        expected_keys = get_expected_keys(cls.model.__name__)
-                        return (
-                            jsonify(
-                                {
-                                    "error": f"Invalid data format: expected {expected_keys}"
-                                }
-                            ).get_data(as_text=True),
-                            400,
-                        )
-                    cls.model.create(**item)
-            elif isinstance(data, dict):
-                cls.model.create(**data)
-            else:
-                expected_keys = get_expected_keys(cls.model.__name__)
-                return (
-                    jsonify(
-                        {"error": f"Invalid data format: expected {expected_keys}"}
-                    ).get_data(as_text=True),
-                    400,
-                )
-
-            return (
-                jsonify({"message": "Item(s) created successfully"}).get_data(
-                    as_text=True
-                ),
-                201,
-            )
-        except DatabaseError as e:
-            logger.error("Database error on POST: %s", e)
-            return jsonify({"error": str(e)}).get_data(as_text=True), 500
-
-    @classmethod
-    def update(cls, item_id: int) -> Tuple[str, StatusCodeLiteral]:
-        try:
-            data = request.get_json(force=True)
-            if not isinstance(data, dict):
-                return (
-                    jsonify({"error": "Invalid data format"}).get_data(as_text=True),
-                    400,
-                )
-            cls.model.set_by_id(item_id, data)
-            return (
-                jsonify({"message": "Item updated successfully"}).get_data(
-                    as_text=True
-                ),
-                200,
-            )
-        except DatabaseError as e:
-            logger.error("Database error on PUT: %s", e)
-            return jsonify({"error": str(e)}).get_data(as_text=True), 500
-
-    @classmethod
-    def delete(cls, item_id: int) -> Tuple[str, StatusCodeLiteral]:
-        try:
-            cls.model.delete_by_id(item_id)
-            return (
-                jsonify({"message": "Item deleted successfully"}).get_data(
-                    as_text=True
-                ),
-                200,
-            )
-        except DatabaseError as e:
-            logger.error("Database error on DELETE: %s", e)
-            return jsonify({"error": str(e)}).get_data(as_text=True), 500
-
-    @classmethod
-    def delete_range(cls) -> Tuple[str, StatusCodeLiteral]:
-        print(cls.model.__name__)
-        try:
-            start_string: Optional[str] = request.args.get("start")
-            end_string: Optional[str] = request.args.get("end")
-
-            if not all([start_string, end_string]):
-                return (
-                    jsonify({"error": "Missing required parameters"}).get_data(
-                        as_text=True
-                    ),
-                    400,
-                )
-
-            start: int = int(start_string) if start_string else 0
-            end: int = int(end_string) if end_string else 0
-            deleted_count: int = 0
-            errors: List[str] = []
-
-            for i in range(start, end + 1):
-                try:
-                    item = cls.model.get_by_id(i)
-                    if item:
-                        item.delete_instance()
-                        deleted_count += 1
-                    else:
-                        errors.append(f"Item with id {i} not found")
-                except DoesNotExist as e:
-                    errors.append(f"Item with id {i} does not exist: {str(e)}")
-                except DatabaseError as e:
-                    errors.append(f"Error deleting item with id {i}: {str(e)}")
-
-            if deleted_count > 0:
-                return (
-                    jsonify(
-                        {
-                            "message": f"{deleted_count} items deleted successfully",
-                            "errors": errors,
-                        }
-                    ).get_data(as_text=True),
-                    200,
-                )
-            else:
-                return (
-                    jsonify({"error": "No items deleted", "errors": errors}).get_data(
-                        as_text=True
-                    ),
-                    404,
-                )
-        except Exception as e:
-            logger.error("Error in delete_range: %s", str(e))
-            return jsonify({"error": str(e)}).get_data(as_text=True), 500
-
-
-class APITimeline(APIBase):
-    model = Timeline
-
-    @classmethod
-    def create(cls):
-        try:
-            data = request.get_json(force=True)
-            required_fields = ["title", "description", "date"]
-            if not all(field in data for field in required_fields):
-                return jsonify({"error": "Missing required fields"}), 400
-
-            instance = cls.model.create(**data)
-            return (
-                jsonify(
-                    {"message": "Timeline item created successfully", "id": instance.id}
-                ),
-                201,
-            )
-        except Exception as e:
-            return jsonify({"error": str(e)}), 400
-
-    @classmethod
-    def delete_range(cls):
-        try:
-            start = request.args.get("start", type=int)
-            end = request.args.get("end", type=int)
-            if start is None or end is None:
-                return jsonify({"error": "Missing start or end parameter"}), 400
-            deleted = (
-                cls.model.delete()
-                .where(
-                    (cls.model.get_by_id(end) >= start)
-                    & (cls.model.get_by_id(start) <= end)
-                )
-                .execute()
-            )
-            return jsonify({"message": f"{deleted} items deleted successfully"}), 200
-        except Exception as e:
-            return jsonify({"error": str(e)}), 500
-
-
-class APIHobbies(APIBase):
-    model = Hobbies
-
-
-class APIProjects(APIBase):
-    model = Projects
+import json
+from datetime import datetime, timedelta
+from portfolio.mysql_db import Timeline, Hobbies, Projects, Tombstone
+from flask import request
+from typing import Any, Dict, Iterable, Iterator, Type, Optional, List
+from peewee import Model, ModelSelect, DatabaseError, DoesNotExist, fn
+from werkzeug.datastructures import MultiDict
+import logging
+
+from portfolio import timeline
+from portfolio.cache import invalidate_tags, register_tag_loader
+from portfolio.db import TOMBSTONE_RETENTION, current_timestamp
+from portfolio.responses import JSONResponse, json_response, stream_json_array
+from portfolio.schemas import SchemaType, validate_rows
+
+logger = logging.getLogger(__name__)
+
+# How far behind the database clock a changes cursor is set. ``updated_at``
+# has one-second resolution and a transaction may commit rows stamped before
+# the changes were read, so the next request re-reads this window.
+CHANGES_SETTLE_SECONDS = 5
+
+
+class APIBase:
+    model: Type[Model]
+    # Schema that POSTed rows are validated against, if any.
+    schema: Optional[SchemaType] = None
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """
+        Evict cached responses that were rendered from this model's table.
+        """
+        invalidate_tags(cls.model._meta.table_name)
+
+    @classmethod
+    def last_modified(cls) -> Optional[datetime]:
+        """
+        Return the newest ``updated_at`` or tombstone of the table, if the
+        model tracks changes.
+        """
+        if not cls.tracks_changes():
+            return None
+        updated = cls.model.select(fn.MAX(cls.model.updated_at)).scalar()
+        deleted = (
+            Tombstone.select(fn.MAX(Tombstone.deleted_at))
+            .where(Tombstone.table_name == cls.model._meta.table_name)
+            .scalar()
+        )
+        return max((value for value in (updated, deleted) if value), default=None)
+
+    @classmethod
+    def tracks_changes(cls) -> bool:
+        return "updated_at" in cls.model._meta.fields
+
+    @classmethod
+    def record_deleted(cls, ids: Iterable[int]) -> None:
+        """
+        Leave a tombstone for each deleted row, if the model tracks changes.
+        """
+        rows = [
+            {"table_name": cls.model._meta.table_name, "row_id": item_id}
+            for item_id in ids
+        ]
+        if rows and cls.tracks_changes():
+            Tombstone.insert_many(rows).execute()
+            cls.prune_tombstones()
+
+    @classmethod
+    def prune_tombstones(cls) -> int:
+        """
+        Drop the table's tombstones older than ``TOMBSTONE_RETENTION``.
+        """
+        cutoff = (
+            current_timestamp(cls.model._meta.database.cursor()) - TOMBSTONE_RETENTION
+        )
+        return (
+            Tombstone.delete()
+            .where(
+                (Tombstone.table_name == cls.model._meta.table_name)
+                & (Tombstone.deleted_at < cutoff)
+            )
+            .execute()
+        )
+
+    @classmethod
+    def prepare(
+        cls, data: Dict[str, Any], item_id: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Return the column values to write for ``data``.
+
+        ``item_id`` is set when updating an existing row. Subclasses derive
+        stored columns here.
+        """
+        return data
+
+    @classmethod
+    def validate(cls, rows: List[Dict[str, Any]]) -> Optional[JSONResponse]:
+        """
+        Check ``rows`` against ``schema`` before any of them is written.
+
+        Returns a 400 response with the errors of every invalid row, keyed by
+        its index, or ``None`` when all rows are valid.
+        """
+        if cls.schema is None:
+            return None
+        errors = validate_rows(cls.schema, rows)
+        if not errors:
+            return None
+        return json_response({"error": "Validation failed", "errors": errors}), 400
+
+    @classmethod
+    def build_query(cls, args: Optional[MultiDict] = None) -> ModelSelect:
+        """
+        Build the select query for ``get_all`` from ``args`` (the request's
+        query string by default).
+
+        Supports ``limit`` and ``offset``; subclasses add their own filters.
+        """
+        args = request.args if args is None else args
+        query = cls.model.select()
+        limit: Optional[int] = args.get("limit", type=int)
+        offset: Optional[int] = args.get("offset", type=int)
+        if limit is not None:
+            if limit < 0:
+                raise ValueError("limit must be a positive integer")
+            query = query.limit(limit)
+        if offset is not None:
+            if offset < 0:
+                raise ValueError("offset must be a positive integer")
+            query = query.offset(offset)
+        return query
+
+    @classmethod
+    def rows(cls, args: Optional[MultiDict] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Run the ``get_all`` query and yield its rows as dicts from the cursor.
+        """
+        return cls.build_query(args).dicts().iterator()
+
+    @classmethod
+    def get_all(cls) -> JSONResponse:
+        try:
+            # The query runs here so database errors still map to a 500; rows are
+            # then encoded and streamed as the cursor is consumed.
+            return stream_json_array(cls.rows()), 200
+        except ValueError as e:
+            return json_response({"error": str(e)}), 400
+        except DatabaseError as e:
+            logger.error("Database error on GET: %s", e)
+            return json_response({"error": str(e)}), 500
+
+    @classmethod
+    def get_by_id(cls, item_id: int) -> JSONResponse:
+        try:
+            item = cls.model.get_by_id(item_id)
+            if item:
+                return json_response(item.__data__), 200
+            else:
+                return json_response({"error": "Item not found"}), 404
+        except DatabaseError as e:
+            logger.error("Database error on GET by ID: %s", e)
+            return json_response({"error": str(e)}), 500
+
+    @classmethod
+    def changes(cls) -> JSONResponse:
+        """
+        Return the rows written and the ids deleted since the ``since`` cursor.
+
+        The response carries the ``cursor`` to pass as ``since`` next time.
+        Rows written around the cursor may be returned again, so clients apply
+        ``deleted`` first and then ``upserted`` as upserts. Without ``since`` every
+        row is returned. A ``since`` older than ``TOMBSTONE_RETENTION`` gets a
+        410, since deletions before it may have been pruned.
+        """
+        if not cls.tracks_changes():
+            return (
+                json_response(
+                    {"error": f"{cls.model._meta.table_name} does not track changes"}
+                ),
+                400,
+            )
+        try:
+            since = parse_cursor(request.args.get("since"))
+        except ValueError as e:
+            return json_response({"error": str(e)}), 400
+        try:
+            database = cls.model._meta.database
+            now = current_timestamp(database.cursor())
+            if cursor_expired(since, now):
+                return expired_cursor_response()
+            updated_at = cls.model._meta.fields["updated_at"]
+            query = cls.model.select().order_by(updated_at, cls.model.id)
+            deleted: List[int] = []
+            if since is not None:
+                query = query.where(updated_at >= since)
+                deleted = [
+                    tombstone.row_id
+                    for tombstone in Tombstone.select(Tombstone.row_id)
+                    .where(
+                        (Tombstone.table_name == cls.model._meta.table_name)
+                        & (Tombstone.deleted_at >= since)
+                    )
+                    .order_by(Tombstone.deleted_at, Tombstone.id)
+                ]
+            return (
+                json_response(
+                    {
+                        "cursor": next_cursor(since, now),
+                        "upserted": list(query.dicts()),
+                        "deleted": deleted,
+                    }
+                ),
+                200,
+            )
+        except DatabaseError as e:
+            logger.error("Database error on GET changes: %s", e)
+            return json_response({"error": str(e)}), 500
+
+    @classmethod
+    def create(cls) -> JSONResponse:
+        try:
+            data = request.get_json(force=True)
+            logger.debug("POST Data: %s", data)
+
+            def get_expected_keys(model_name: str) -> dict:
+                match model_name:
+                    case "Timeline":
+                        return {
+                            "timeline_id": "<int>",
+                            "title": "<str>",
+                            "description": "<str>",
+                            "date": "<datetime>",
+                            "image": "<str>",
+                            "url": "<str>",
+                        }
+                    case "Hobbies":
+                        return {
+                            "hobbies_id": "<int>",
+                            "name": "<str>",
+                            "description": "<str>",
+                            "image": "<str>",
+                        }
+                    case "Projects":
+                        return {
+                            "projects_id": "<int>",
+                            "name": "<str>",
+                            "description": "<str>",
+                            "url": "<str>",
+                            "language": "<str>",
+                        }
+                    case _:
+                        return {}
+
+            if isinstance(data, list):
+                if not all(isinstance(item, dict) for item in data):
+                    expected_keys = get_expected_keys(cls.model.__name__)
+                    return (
+                        json_response(
+                            {"error": f"Invalid data format: expected {expected_keys}"}
+                        ),
+                        400,
+                    )
+                invalid = cls.validate(data)
+                if invalid is not None:
+                    return invalid
+                with cls.model._meta.database.atomic():
+                    for item in data:
+                        cls.model.create(**cls.prepare(item))
+                cls.invalidate()
+            elif isinstance(data, dict):
+                invalid = cls.validate([data])
+                if invalid is not None:
+                    return invalid
+                cls.model.create(**cls.prepare(data))
+                cls.invalidate()
+            else:
+                expected_keys = get_expected_keys(cls.model.__name__)
+                return (
+                    json_response(
+                        {"error": f"Invalid data format: expected {expected_keys}"}
+                    ),
+                    400,
+                )
+
+            return (
+                json_response({"message": "Item(s) created successfully"}),
+                201,
+            )
+        except DatabaseError as e:
+            logger.error("Database error on POST: %s", e)
+            return json_response({"error": str(e)}), 500
+
+    @classmethod
+    def update(cls, item_id: int) -> JSONResponse:
+        try:
+            data = request.get_json(force=True)
+            if not isinstance(data, dict):
+                return (
+                    json_response({"error": "Invalid data format"}),
+                    400,
+                )
+            cls.model.set_by_id(item_id, cls.prepare(data, item_id))
+            cls.invalidate()
+            return (
+                json_response({"message": "Item updated successfully"}),
+                200,
+            )
+        except ValueError as e:
+            return json_response({"error": str(e)}), 400
+        except DatabaseError as e:
+            logger.error("Database error on PUT: %s", e)
+            return json_response({"error": str(e)}), 500
+
+    @classmethod
+    def delete(cls, item_id: int) -> JSONResponse:
+        try:
+            with cls.model._meta.database.atomic():
+                if cls.model.delete_by_id(item_id):
+                    cls.record_deleted([item_id])
+            cls.invalidate()
+            return (
+                json_response({"message": "Item deleted successfully"}),
+                200,
+            )
+        except DatabaseError as e:
+            logger.error("Database error on DELETE: %s", e)
+            return json_response({"error": str(e)}), 500
+
+    @classmethod
+    def delete_range(cls) -> JSONResponse:
+        print(cls.model.__name__)
+        try:
+            start_string: Optional[str] = request.args.get("start")
+            end_string: Optional[str] = request.args.get("end")
+
+            if not all([start_string, end_string]):
+                return (
+                    json_response({"error": "Missing required parameters"}),
+                    400,
+                )
+
+            start: int = int(start_string) if start_string else 0
+            end: int = int(end_string) if end_string else 0
+            deleted_count: int = 0
+            errors: List[str] = []
+
+            for i in range(start, end + 1):
+                try:
+                    item = cls.model.get_by_id(i)
+                    if item:
+                        with cls.model._meta.database.atomic():
+                            item.delete_instance()
+                            cls.record_deleted([i])
+                        deleted_count += 1
+                    else:
+                        errors.append(f"Item with id {i} not found")
+                except DoesNotExist as e:
+                    errors.append(f"Item with id {i} does not exist: {str(e)}")
+                except DatabaseError as e:
+                    errors.append(f"Error deleting item with id {i}: {str(e)}")
+
+            if deleted_count > 0:
+                cls.invalidate()
+                return (
+                    json_response(
+                        {
+                            "message": f"{deleted_count} items deleted successfully",
+                            "errors": errors,
+                        }
+                    ),
+                    200,
+                )
+            else:
+                return (
+                    json_response({"error": "No items deleted", "errors": errors}),
+                    404,
+                )
+        except Exception as e:
+            logger.error("Error in delete_range: %s", str(e))
+            return json_response({"error": str(e)}), 500
+
+
+class APITimeline(APIBase):
+    model = Timeline
+    schema = SchemaType.TIMELINE
+
+    @classmethod
+    def prepare(
+        cls, data: Dict[str, Any], item_id: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Store the date as a ``datetime``, and the event type, location and
+        display date derived from the description and date, so the timeline
+        page only prints them.
+        """
+        if "date" in data:
+            data = {**data, "date": timeline.parse_event_date(data["date"])}
+        if item_id is not None and not ("description" in data or "date" in data):
+            return data
+        description = data.get("description")
+        date = data.get("date")
+        if item_id is not None and (description is None or date is None):
+            current = cls.model.get_by_id(item_id)
+            description = current.description if description is None else description
+            date = current.date if date is None else date
+        return {**data, **timeline.enrich(description, date)}
+
+    @classmethod
+    def build_query(cls, args: Optional[MultiDict] = None) -> ModelSelect:
+        """
+        Filter by ``start_date``/``end_date`` (ISO 8601, inclusive) and order by
+        ``date`` (``order=asc|desc``), both served by the index on ``date``.
+
+        Events are always returned in date order, oldest first unless
+        ``order=desc``, rather than in insertion order.
+        """
+        args = request.args if args is None else args
+        query = super().build_query(args)
+        start_date = parse_date_arg(args, "start_date")
+        end_date = parse_date_arg(args, "end_date", end_of_day=True)
+        if start_date is not None:
+            query = query.where(cls.model.date >= start_date)
+        if end_date is not None:
+            query = query.where(cls.model.date <= end_date)
+
+        order: str = args.get("order", "asc").lower()
+        if order not in ("asc", "desc"):
+            raise ValueError("order must be either 'asc' or 'desc'")
+        if order == "desc":
+            return query.order_by(cls.model.date.desc(), cls.model.id.desc())
+        return query.order_by(cls.model.date.asc(), cls.model.id.asc())
+
+    @classmethod
+    def create(cls):
+        """
+        Create one event and return its id. Lists are created by
+        ``APIBase.create``; both are checked by ``validate`` first.
+        """
+        try:
+            data = request.get_json(force=True)
+            if not isinstance(data, dict):
+                return super().create()
+            invalid = cls.validate([data])
+            if invalid is not None:
+                return invalid
+
+            instance = cls.model.create(**cls.prepare(data))
+            cls.invalidate()
+            return (
+                json_response(
+                    {"message": "Timeline item created successfully", "id": instance.id}
+                ),
+                201,
+            )
+        except Exception as e:
+            return json_response({"error": str(e)}), 400
+
+    @classmethod
+    def delete_range(cls):
+        try:
+            start = request.args.get("start", type=int)
+            end = request.args.get("end", type=int)
+            if start is None or end is None:
+                return json_response({"error": "Missing start or end parameter"}), 400
+            in_range = cls.model.id.between(start, end)
+            with cls.model._meta.database.atomic():
+                ids = [row.id for row in cls.model.select(cls.model.id).where(in_range)]
+                deleted = cls.model.delete().where(in_range).execute()
+                cls.record_deleted(ids)
+            cls.invalidate()
+            return (
+                json_response({"message": f"{deleted} items deleted successfully"}),
+                200,
+            )
+        except Exception as e:
+            return json_response({"error": str(e)}), 500
+
+
+class APIHobbies(APIBase):
+    model = Hobbies
+    schema = SchemaType.HOBBIES
+
+
+class APIProjects(APIBase):
+    model = Projects
+    schema = SchemaType.PROJECTS
+
+    @classmethod
+    def build_query(cls, args: Optional[MultiDict] = None) -> ModelSelect:
+        """
+        Filter by one or more exact ``language`` values using the index on ``language``.
+        """
+        args = request.args if args is None else args
+        query = super().build_query(args)
+        languages: List[str] = [
+            language for language in args.getlist("language") if language
+        ]
+        if languages:
+            query = query.where(cls.model.language.in_(languages)).order_by(
+                cls.model.language, cls.model.id
+            )
+        return query
+
+
+for _api in (APITimeline, APIHobbies, APIProjects):
+    register_tag_loader(_api.model._meta.table_name, _api.last_modified)
+
+
+def parse_date_arg(
+    args: MultiDict, name: str, end_of_day: bool = False
+) -> Optional[datetime]:
+    """
+    Parse an ISO 8601 date query argument, raising ``ValueError`` when malformed.
+
+    A bare date (``YYYY-MM-DD``) with ``end_of_day`` set covers the whole day.
+    """
+    value: Optional[str] = args.get(name)
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError as e:
+        raise ValueError(f"{name} must be an ISO 8601 date") from e
+    if end_of_day and len(value) == 10:
+        parsed = parsed.replace(hour=23, minute=59, second=59, microsecond=999999)
+    return parsed
+
+
+def parse_cursor(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse the ``since`` cursor of a changes request, raising ``ValueError``
+    when malformed.
+    """
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError as e:
+        raise ValueError("since must be a cursor returned by a changes request") from e
+
+
+def cursor_expired(since: Optional[datetime], now: datetime) -> bool:
+    """
+    Return whether ``since`` is older than the tombstones kept at database
+    time ``now``.
+    """
+    return since is not None and since < now - TOMBSTONE_RETENTION
+
+
+def expired_cursor_response() -> JSONResponse:
+    """
+    Tell a client its cursor is too old, so it syncs again without ``since``.
+    """
+    return (
+        json_response(
+            {"error": "since is older than the deletions kept; sync without since"}
+        ),
+        410,
+    )
+
+
+def next_cursor(since: Optional[datetime], now: datetime) -> str:
+    """
+    Return the cursor for the next changes request, read at database time
+    ``now``. It never moves back before ``since``.
+    """
+    cursor = now.replace(microsecond=0) - timedelta(seconds=CHANGES_SETTLE_SECONDS)
+    if since is not None and since > cursor:
+        cursor = since
+    return cursor.isoformat()
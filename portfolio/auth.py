@@ -1,17 +1,23 @@
-from functools import wraps
-from flask import request, jsonify
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
-
-
-def check_authentication(f):
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
-        auth = request.headers.get("Authorization")
-        if auth != os.getenv("TOKEN"):
-            return jsonify({"message": "Unauthorized"}), 401
-        return f(*args, **kwargs)
-
-    return decorated_function
+from functools import wraps
+from flask import request
+import os
+from dotenv import load_dotenv
+from portfolio.responses import json_response
+
+load_dotenv()
+
+# Set in the environ of sub-requests dispatched by an authenticated batch.
+AUTHENTICATED_ENVIRON_KEY = "portfolio.authenticated"
+
+
+def check_authentication(f):
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        if request.environ.get(AUTHENTICATED_ENVIRON_KEY):
+            return f(*args, **kwargs)
+        auth = request.headers.get("Authorization")
+        if auth != os.getenv("TOKEN"):
+            return json_response({"message": "Unauthorized"}), 401
+        return f(*args, **kwargs)
+
+    return decorated_function
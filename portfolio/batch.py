@@ -0,0 +1,148 @@
+import json
+import logging
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from flask import Response, current_app, g, has_app_context, request
+from werkzeug.test import EnvironBuilder
+
+from portfolio.auth import AUTHENTICATED_ENVIRON_KEY
+from portfolio.cache import invalidate_tags, on_invalidate
+from portfolio.db import Database, mydb
+from portfolio.responses import JSONResponse, json_response
+
+logger = logging.getLogger(__name__)
+
+BATCH_PATH = "/api/v1/batch"
+
+# Most sub-requests accepted in one batch.
+MAX_BATCH_SIZE = 100
+
+METHODS = {"GET", "POST", "PUT", "DELETE"}
+
+
+class BatchError(ValueError):
+    """
+    Raised when a batch or one of its sub-requests is malformed.
+    """
+
+
+class _Rollback(Exception):
+    pass
+
+
+def _parse(payload: Any) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    Return the sub-requests of a batch and whether it is all-or-nothing.
+
+    The payload is either an array of sub-requests or an object with
+    ``requests`` and an optional ``atomic`` flag.
+    """
+    atomic = False
+    if isinstance(payload, dict):
+        atomic = bool(payload.get("atomic", False))
+        payload = payload.get("requests")
+    if not isinstance(payload, list):
+        raise BatchError("Expected an array of {method, path, body} requests")
+    if len(payload) > MAX_BATCH_SIZE:
+        raise BatchError(f"A batch may hold at most {MAX_BATCH_SIZE} requests")
+    for index, item in enumerate(payload):
+        if not isinstance(item, dict):
+            raise BatchError(f"Request {index} must be an object")
+        method = str(item.get("method", "GET")).upper()
+        path = item.get("path")
+        if method not in METHODS:
+            raise BatchError(f"Request {index} has unsupported method {method}")
+        if not isinstance(path, str) or not path.startswith("/"):
+            raise BatchError(f"Request {index} needs a path starting with /")
+        if path.split("?", 1)[0].rstrip("/") == BATCH_PATH:
+            raise BatchError(f"Request {index} cannot be a batch")
+    return payload, atomic
+
+
+def _body(response: Response) -> Any:
+    data = response.get_data()
+    if response.is_json:
+        return json.loads(data) if data else None
+    return data.decode(response.charset or "utf-8", "replace")
+
+
+def _dispatch(item: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run one sub-request through the URL map and the view's decorators.
+
+    It shares this request's application context, and so its database
+    connection and any open transaction.
+    """
+    method = str(item.get("method", "GET")).upper()
+    path = item["path"]
+    builder = EnvironBuilder(
+        path=path,
+        method=method,
+        base_url=request.host_url,
+        json=item.get("body"),
+        environ_overrides={AUTHENTICATED_ENVIRON_KEY: True},
+    )
+    try:
+        environ = builder.get_environ()
+    finally:
+        builder.close()
+    app = current_app._get_current_object()  # pylint: disable=protected-access
+    try:
+        with app.request_context(environ):
+            response = app.full_dispatch_request()
+            status, body = response.status_code, _body(response)
+            response.close()
+    except Exception as e:  # pylint: disable=broad-except
+        logger.exception("Batch sub-request %s %s failed", method, path)
+        status, body = 500, {"error": str(e)}
+    return {"method": method, "path": path, "status": status, "body": body}
+
+
+def _record_invalidated(tags: Set[str]) -> None:
+    if has_app_context() and "batch_tags" in g:
+        g.batch_tags.update(tags)
+
+
+def run_batch(db: Database) -> JSONResponse:
+    """
+    Dispatch the sub-requests of a ``POST /api/v1/batch`` in order.
+
+    Authentication is checked once, for the batch. With ``atomic`` the
+    batch stops at the first sub-request that fails (status 400 or higher),
+    and every write made by the batch to the landing tables and the models
+    is rolled back. The response is the array of sub-request results, with
+    the failing sub-request's status when an atomic batch was rolled back.
+    """
+    try:
+        items, atomic = _parse(request.get_json(force=True, silent=True))
+    except BatchError as e:
+        return json_response({"error": str(e)}), 400
+
+    results: List[Dict[str, Any]] = []
+    if not atomic:
+        for item in items:
+            results.append(_dispatch(item))
+        return json_response(results), 200
+
+    failed: Optional[Dict[str, Any]] = None
+    g.batch_tags = set()
+    try:
+        with db.transaction(), mydb.atomic():
+            for item in items:
+                result = _dispatch(item)
+                results.append(result)
+                if result["status"] >= 400:
+                    failed = result
+                    raise _Rollback()
+    except _Rollback:
+        pass
+    finally:
+        # Pages cached while the batch ran may hold uncommitted rows, and
+        # warmups started by its writes may have read the old ones.
+        invalidate_tags(*g.pop("batch_tags"))
+    if failed is not None:
+        return json_response(results), failed["status"]
+    return json_response(results), 200
+
+
+on_invalidate(_record_invalidated)
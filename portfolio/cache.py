@@ -0,0 +1,609 @@
+import logging
+import os
+import pickle
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import wraps
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+from urllib.parse import urlencode
+
+from flask import Flask, Response, current_app, request, stream_with_context
+from flask_caching import Cache
+from flask_caching.backends.base import BaseCache
+from peewee import DatabaseError
+
+from portfolio.compression import compress_variants, negotiate
+
+logger = logging.getLogger(__name__)
+
+# The fragment cache tag comes from portfolio.templating instead.
+cache = Cache(with_jinja2_ext=False)
+
+DEFAULT_CACHE_DIR = os.path.join(tempfile.gettempdir(), "portfolio-cache")
+
+# Expired entries are swept after this many writes.
+PRUNE_INTERVAL = 100
+
+TAG_KEY_PREFIX = "tag/"
+
+# Cached pages are re-rendered in the background once they are this old.
+DEFAULT_SOFT_TIMEOUT = 300
+
+# A background refresh that has not finished after this long may be retried.
+REFRESH_LOCK_TIMEOUT = 60
+
+# Per-response headers that must not be replayed from the cache.
+UNCACHED_HEADERS = {"content-length", "date", "set-cookie", "x-cache", "age"}
+
+# How long a request waits for another request to fill the same key.
+FILL_WAIT_TIMEOUT = 10
+
+# How often a worker polls the shared cache while another worker fills a key.
+FILL_POLL_INTERVAL = 0.05
+
+_inflight: Dict[str, threading.Event] = {}
+_inflight_lock = threading.Lock()
+
+_refresh_executor = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="cache-refresh"
+)
+
+
+class SQLiteCache(BaseCache):
+    """
+    Response cache shared by every worker process on the host.
+
+    Entries live in a WAL-mode SQLite file, so all gunicorn workers read and
+    write the same store: a page rendered by one worker is a hit for the others,
+    and invalidation is seen by everyone. Every write is a single atomic
+    statement; ``add`` is an upsert that only succeeds when the key is absent or
+    expired, which makes it usable as a cross-process lock.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        default_timeout: int = 300,
+        threshold: int = 10000,
+    ) -> None:
+        super().__init__(default_timeout=default_timeout)
+        self.path = path
+        self.threshold = threshold
+        self._local = threading.local()
+        self._writes = 0
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection().execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL NOT NULL)"
+        )
+
+    @classmethod
+    def factory(cls, app, config, args, kwargs):
+        kwargs.update(
+            path=config.get("CACHE_SQLITE_PATH")
+            or os.path.join(DEFAULT_CACHE_DIR, "cache.sqlite"),
+            threshold=config.get("CACHE_THRESHOLD", 10000),
+        )
+        return cls(*args, **kwargs)
+
+    def _connection(self) -> sqlite3.Connection:
+        # One connection per thread, reopened after a fork so workers never
+        # share a handle inherited from the master process.
+        conn: Optional[sqlite3.Connection] = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=wal")
+            conn.execute("PRAGMA synchronous=normal")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _expires(self, timeout: Optional[int]) -> float:
+        timeout = self._normalize_timeout(timeout)
+        return 0 if timeout == 0 else time.time() + timeout
+
+    def _prune(self) -> None:
+        self._writes += 1
+        if self._writes % PRUNE_INTERVAL:
+            return
+        conn = self._connection()
+        conn.execute(
+            "DELETE FROM cache WHERE expires != 0 AND expires <= ?", (time.time(),)
+        )
+        conn.execute(
+            "DELETE FROM cache WHERE rowid IN ("
+            "SELECT rowid FROM cache ORDER BY rowid "
+            "LIMIT max(0, (SELECT count(*) FROM cache) - ?))",
+            (self.threshold,),
+        )
+
+    def get(self, key: str) -> Any:
+        row = (
+            self._connection()
+            .execute(
+                "SELECT value FROM cache WHERE key = ? AND (expires = 0 OR expires > ?)",
+                (key, time.time()),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+        try:
+            return pickle.loads(row[0])
+        except (pickle.PickleError, EOFError, AttributeError, ImportError):
+            logger.warning("Discarding unreadable cache entry %s", key)
+            return None
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
+        self._connection().execute(
+            "INSERT OR REPLACE INTO cache (key, value, expires) VALUES (?, ?, ?)",
+            (key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL), self._expires(timeout)),
+        )
+        self._prune()
+        return True
+
+    def add(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
+        cursor = self._connection().execute(
+            "INSERT INTO cache (key, value, expires) VALUES (?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value, "
+            "expires = excluded.expires "
+            "WHERE cache.expires != 0 AND cache.expires <= ?",
+            (
+                key,
+                pickle.dumps(value, pickle.HIGHEST_PROTOCOL),
+                self._expires(timeout),
+                time.time(),
+            ),
+        )
+        added = cursor.rowcount > 0
+        if added:
+            self._prune()
+        return added
+
+    def delete(self, key: str) -> bool:
+        cursor = self._connection().execute("DELETE FROM cache WHERE key = ?", (key,))
+        return cursor.rowcount > 0
+
+    def has(self, key: str) -> bool:
+        row = (
+            self._connection()
+            .execute(
+                "SELECT 1 FROM cache WHERE key = ? AND (expires = 0 OR expires > ?)",
+                (key, time.time()),
+            )
+            .fetchone()
+        )
+        return row is not None
+
+    def clear(self) -> bool:
+        self._connection().execute("DELETE FROM cache")
+        return True
+
+    def inc(self, key: str, delta: int = 1) -> Optional[int]:
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            value = (self.get(key) or 0) + delta
+            row = conn.execute(
+                "SELECT expires FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires) VALUES (?, ?, ?)",
+                (
+                    key,
+                    pickle.dumps(value, pickle.HIGHEST_PROTOCOL),
+                    row[0] if row else self._expires(None),
+                ),
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return value
+
+    def dec(self, key: str, delta: int = 1) -> Optional[int]:
+        return self.inc(key, -delta)
+
+
+def cache_config() -> Dict[str, Any]:
+    """
+    Build the Flask-Caching config from ``CACHE_BACKEND``.
+
+    ``sqlite`` (default) and ``filesystem`` are shared between worker processes
+    without any external service; ``redis`` uses ``CACHE_REDIS_URL`` and works
+    with any Redis-compatible server; ``simple`` keeps a per-process cache.
+    """
+    backend = os.getenv("CACHE_BACKEND", "sqlite").lower()
+    cache_dir = os.getenv("CACHE_DIR") or DEFAULT_CACHE_DIR
+    config: Dict[str, Any] = {
+        "CACHE_DEFAULT_TIMEOUT": int(os.getenv("CACHE_DEFAULT_TIMEOUT", "3000")),
+        "CACHE_SOFT_TIMEOUT": int(
+            os.getenv("CACHE_SOFT_TIMEOUT", str(DEFAULT_SOFT_TIMEOUT))
+        ),
+        "CACHE_THRESHOLD": int(os.getenv("CACHE_THRESHOLD", "10000")),
+    }
+    if backend == "simple":
+        config["CACHE_TYPE"] = "SimpleCache"
+    elif backend == "filesystem":
+        config["CACHE_TYPE"] = "FileSystemCache"
+        config["CACHE_DIR"] = cache_dir
+    elif backend == "redis":
+        config["CACHE_TYPE"] = "RedisCache"
+        config["CACHE_REDIS_URL"] = os.getenv(
+            "CACHE_REDIS_URL", "redis://localhost:6379/0"
+        )
+        config["CACHE_KEY_PREFIX"] = os.getenv("CACHE_KEY_PREFIX", "portfolio:")
+    else:
+        if backend != "sqlite":
+            logger.warning("Unknown CACHE_BACKEND %s, falling back to sqlite", backend)
+        config["CACHE_TYPE"] = "portfolio.cache.SQLiteCache"
+        config["CACHE_SQLITE_PATH"] = os.path.join(cache_dir, "cache.sqlite")
+    return config
+
+
+def init_cache(app: Flask) -> None:
+    """
+    Attach the shared response cache to the app.
+
+    Settings already present in ``app.config`` win over the environment.
+    """
+    for key, value in cache_config().items():
+        app.config.setdefault(key, value)
+    cache.init_app(app)
+
+
+# (version token, unix time of the last write to the tagged table)
+TagState = Tuple[str, float]
+
+_tag_loaders: Dict[str, Callable[[], Optional[datetime]]] = {}
+
+_invalidation_listeners: List[Callable[[Set[str]], None]] = []
+
+
+def _new_version() -> str:
+    return uuid.uuid4().hex[:12]
+
+
+def register_tag_loader(tag: str, loader: Callable[[], Optional[datetime]]) -> None:
+    """
+    Register how to look up a tag's last modification time in the database.
+
+    The loader only runs when a tag has no cached state yet, e.g. after a cold
+    start; later writes record their own time through ``invalidate_tags``.
+    """
+    _tag_loaders[tag] = loader
+
+
+def load_last_modified(tag: str) -> Optional[datetime]:
+    """
+    Return when the tag's table was last written, as recorded in the database.
+
+    Returns ``None`` when the tag has no loader or the lookup fails.
+    """
+    loader = _tag_loaders.get(tag)
+    if loader is None:
+        return None
+    try:
+        modified = loader()
+    except (DatabaseError, sqlite3.Error) as e:
+        logger.warning("Could not load last modification of %s: %s", tag, e)
+        return None
+    if modified is not None and modified.tzinfo is None:
+        # Both backends store CURRENT_TIMESTAMP as naive UTC.
+        modified = modified.replace(tzinfo=timezone.utc)
+    return modified
+
+
+def _initial_state(tag: str) -> TagState:
+    now = time.time()
+    modified = load_last_modified(tag)
+    if modified is None:
+        return _new_version(), now
+    return _new_version(), min(modified.timestamp(), now)
+
+
+def tag_states(*tags: str) -> Dict[str, TagState]:
+    """
+    Return the current version token and last modification time of each tag.
+
+    A tag names a table; its version changes whenever the table is written.
+    Tags that have never been seen (or were evicted) get a fresh version, which
+    safely invalidates anything cached under the old one.
+    """
+    keys = [TAG_KEY_PREFIX + tag for tag in tags]
+    states = dict(zip(tags, cache.get_many(*keys)))
+    for tag, key in zip(tags, keys):
+        if states[tag] is None:
+            state = _initial_state(tag)
+            if not cache.add(key, state, timeout=0):
+                state = cache.get(key) or state
+            states[tag] = state
+    return states
+
+
+def tag_versions(*tags: str) -> Dict[str, str]:
+    """
+    Return the current version token of each tag.
+    """
+    return {tag: state[0] for tag, state in tag_states(*tags).items()}
+
+
+def on_invalidate(listener: Callable[[Set[str]], None]) -> None:
+    """
+    Call ``listener`` with the set of tags after every ``invalidate_tags``.
+    """
+    if listener not in _invalidation_listeners:
+        _invalidation_listeners.append(listener)
+
+
+def invalidate_tags(*tags: str) -> None:
+    """
+    Evict every cached entry that depends on any of the given tags.
+    """
+    if not tags:
+        return
+    now = time.time()
+    invalidated = set(tags)
+    for tag in invalidated:
+        cache.set(TAG_KEY_PREFIX + tag, (_new_version(), now), timeout=0)
+    logger.info("Invalidated cache tags: %s", ", ".join(sorted(invalidated)))
+    for listener in _invalidation_listeners:
+        listener(invalidated)
+
+
+def tagged_key(prefix: str, *tags: str) -> str:
+    """
+    Build a cache key that changes whenever one of the tags is invalidated.
+    """
+    versions = tag_versions(*tags)
+    return prefix + "|" + ",".join(f"{tag}:{versions[tag]}" for tag in tags)
+
+
+def _freeze(response: Response, body: Optional[bytes] = None) -> Dict[str, Any]:
+    headers = [
+        (name, value)
+        for name, value in response.headers.items()
+        if name.lower() not in UNCACHED_HEADERS
+    ]
+    if body is None:
+        body = response.get_data()
+    return {
+        "body": body,
+        "variants": compress_variants(body, response.mimetype),
+        "status": response.status_code,
+        "headers": headers,
+        "created": time.time(),
+    }
+
+
+def _tee(
+    response: Response,
+    body: Iterable[Union[str, bytes]],
+    entry: Dict[str, Any],
+    key: str,
+    timeout: int,
+) -> Iterator[bytes]:
+    """
+    Pass a streamed body through to the client and cache it once fully sent.
+
+    A stream that fails or is abandoned by the client is not stored.
+    """
+    chunks: List[bytes] = []
+    complete = False
+    try:
+        for chunk in body:
+            if isinstance(chunk, str):
+                chunk = chunk.encode(response.charset)
+            chunks.append(chunk)
+            yield chunk
+        complete = True
+    finally:
+        if complete:
+            data = b"".join(chunks)
+            entry.update(
+                body=data,
+                variants=compress_variants(data, response.mimetype),
+                created=time.time(),
+            )
+            cache.set(key, entry, timeout=timeout)
+
+
+def _thaw(entry: Dict[str, Any], status: str) -> Response:
+    variants = entry.get("variants") or {}
+    encoding = negotiate(variants) if variants else None
+    response = current_app.response_class(
+        variants[encoding] if encoding else entry["body"],
+        status=entry["status"],
+        headers=entry["headers"],
+    )
+    if encoding:
+        response.headers["Content-Encoding"] = encoding
+    if variants:
+        response.vary.add("Accept-Encoding")
+    response.headers["X-Cache"] = status
+    response.headers["Age"] = str(max(0, int(time.time() - entry["created"])))
+    return response
+
+
+def _render(
+    view: Callable, args: Any, kwargs: Any, key: str, timeout: int
+) -> Tuple[Optional[Dict[str, Any]], Response]:
+    """
+    Run the view and store its response under ``key`` if it can be cached.
+
+    A streamed response is sent as it renders and stored once the client has
+    read all of it, so no entry is returned for it.
+    """
+    response = current_app.make_response(view(*args, **kwargs))
+    if response.status_code != 200:
+        return None, response
+    if response.is_streamed:
+        # Headers as the view returned them; the body is added by _tee.
+        entry = _freeze(response, b"")
+        response.response = stream_with_context(
+            _tee(response, response.response, entry, key, timeout)
+        )
+        response.headers["X-Cache"] = "MISS"
+        return None, response
+    entry = _freeze(response)
+    cache.set(key, entry, timeout=timeout)
+    return entry, response
+
+
+def _view_path(query: Sequence[str]) -> str:
+    """
+    Return the request path with only the query arguments named in ``query``.
+
+    Other arguments do not change the response, so they get no entries of
+    their own.
+    """
+    args = [
+        (name, value) for name in sorted(query) for value in request.args.getlist(name)
+    ]
+    return f"{request.path}?{urlencode(args)}" if args else request.path
+
+
+def _schedule_refresh(
+    view: Callable, args: Any, kwargs: Any, key: str, timeout: int, path: str
+) -> None:
+    """
+    Re-render a stale entry in the background, once across all workers.
+    """
+    lock = f"refresh/{key}"
+    if not cache.add(lock, os.getpid(), timeout=REFRESH_LOCK_TIMEOUT):
+        return
+    app = current_app._get_current_object()  # pylint: disable=protected-access
+    base_url = request.host_url
+
+    def refresh() -> None:
+        try:
+            with app.test_request_context(path, base_url=base_url):
+                _entry, response = _render(view, args, kwargs, key, timeout)
+                # Drain a streamed body so that it reaches the cache.
+                response.get_data()
+                response.close()
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Background refresh of %s failed", path)
+        finally:
+            cache.delete(lock)
+
+    _refresh_executor.submit(refresh)
+
+
+def _wait_for_fill(key: str) -> Optional[Dict[str, Any]]:
+    deadline = time.monotonic() + FILL_WAIT_TIMEOUT
+    while time.monotonic() < deadline:
+        entry = cache.get(key)
+        if entry is not None:
+            return entry
+        if not cache.has(f"fill/{key}"):
+            break
+        time.sleep(FILL_POLL_INTERVAL)
+    return cache.get(key)
+
+
+def _fill(view: Callable, args: Any, kwargs: Any, key: str, timeout: int) -> Response:
+    """
+    Render a missing entry once while concurrent requests for it wait.
+
+    Threads of this worker wait on an event; other workers see the ``fill/``
+    lock in the shared cache and poll until the entry appears. A waiter that
+    still finds nothing (the render failed, was not cacheable, or is still
+    streaming to its client) renders for itself.
+    """
+    with _inflight_lock:
+        event = _inflight.get(key)
+        leader = event is None
+        if leader:
+            event = _inflight[key] = threading.Event()
+
+    if not leader:
+        event.wait(FILL_WAIT_TIMEOUT)
+        entry = cache.get(key)
+    else:
+        try:
+            lock = f"fill/{key}"
+            if cache.add(lock, os.getpid(), timeout=FILL_WAIT_TIMEOUT):
+                try:
+                    entry, response = _render(view, args, kwargs, key, timeout)
+                finally:
+                    cache.delete(lock)
+                return response if entry is None else _thaw(entry, "MISS")
+            entry = _wait_for_fill(key)
+        finally:
+            with _inflight_lock:
+                del _inflight[key]
+            event.set()
+
+    if entry is not None:
+        return _thaw(entry, "HIT")
+    entry, response = _render(view, args, kwargs, key, timeout)
+    return response if entry is None else _thaw(entry, "MISS")
+
+
+def cached_view(
+    *tags: str, timeout: Optional[int] = None, query: Sequence[str] = ()
+) -> Callable:
+    """
+    Cache a view's GET responses, keyed by path, the query arguments named in
+    ``query`` and the versions of ``tags``.
+
+    Writes to any of the tagged tables go through ``invalidate_tags``, which
+    retires only the entries that read those tables. Other methods are never
+    cached.
+
+    Entries are served fresh for ``CACHE_SOFT_TIMEOUT`` seconds. After that,
+    and until the hard ``timeout`` (``CACHE_DEFAULT_TIMEOUT``), the stale copy
+    is still served while one background thread in one worker re-renders it,
+    so only a cold or invalidated key ever renders inside a request, and then
+    only once however many requests for it arrive together. The
+    ``X-Cache`` (``HIT``/``STALE``/``MISS``) and ``Age`` headers report which
+    case applied.
+    """
+
+    def decorator(f: Callable) -> Callable:
+        @wraps(f)
+        def decorated_function(*args: Any, **kwargs: Any) -> Any:
+            if request.method not in ("GET", "HEAD"):
+                return f(*args, **kwargs)
+
+            hard_timeout = timeout or current_app.config["CACHE_DEFAULT_TIMEOUT"]
+            soft_timeout = min(
+                current_app.config.get("CACHE_SOFT_TIMEOUT", DEFAULT_SOFT_TIMEOUT),
+                hard_timeout,
+            )
+            path = _view_path(query)
+            key = tagged_key(f"view/{path}", *tags)
+
+            entry = cache.get(key)
+            if entry is not None:
+                if time.time() - entry["created"] < soft_timeout:
+                    return _thaw(entry, "HIT")
+                _schedule_refresh(f, args, kwargs, key, hard_timeout, path)
+                return _thaw(entry, "STALE")
+
+            return _fill(f, args, kwargs, key, hard_timeout)
+
+        decorated_function.cache_tags = tags  # type: ignore[attr-defined]
+        return decorated_function
+
+    return decorator
@@ -0,0 +1,88 @@
+from typing import Optional
+
+import click
+from flask import Flask, current_app
+from flask.cli import with_appcontext
+
+from portfolio import timeline
+from portfolio.db import connect_mysql, connect_sqlite, mydb
+from portfolio.export import export_site
+from portfolio.templating import precompile_templates
+from portfolio.migrations import copy_tables
+from portfolio.mysql_db import Hobbies, Projects, Timeline
+
+
+@click.command("copy-mysql-to-sqlite")
+@click.option(
+    "--path",
+    default=None,
+    help="Target SQLite file. Defaults to SQLITE_DATABASE_PATH or portfolio.db.",
+)
+@click.option("--batch-size", default=100, show_default=True, type=int)
+def copy_mysql_to_sqlite(path: Optional[str], batch_size: int) -> None:
+    """
+    Copy Hobbies, Projects and Timeline from MySQL into the embedded SQLite database.
+
+    Run once before switching DATABASE_BACKEND to sqlite.
+    """
+    source = connect_mysql()
+    target = connect_sqlite(path)
+    try:
+        counts = copy_tables(
+            source, target, [Hobbies, Projects, Timeline], batch_size=batch_size
+        )
+    finally:
+        source.close()
+        target.close()
+    for table_name, count in counts.items():
+        click.echo(f"{table_name}: {count} rows copied")
+
+
+@click.command("backfill-timeline")
+def backfill_timeline() -> None:
+    """
+    Fill the derived event columns of timeline rows that lack them.
+
+    The app does this once, when the columns are added. Rerun it after
+    loading rows that were written without them.
+    """
+    with mydb.connection_context():
+        updated = timeline.backfill(Timeline)
+    click.echo(f"Enriched {updated} timeline events")
+
+
+@click.command("export-static")
+@click.option(
+    "--output",
+    default=None,
+    help="Symlink nginx serves the site from. Defaults to STATIC_EXPORT_DIR.",
+)
+@with_appcontext
+def export_static(output: Optional[str]) -> None:
+    """
+    Render the public pages into a new static release.
+    """
+    release = export_site(current_app, output)
+    click.echo(f"Published {release}")
+
+
+@click.command("precompile-templates")
+@with_appcontext
+def precompile_templates_command() -> None:
+    """
+    Compile every template into the Jinja bytecode cache.
+    """
+    count = precompile_templates(current_app)
+    click.echo(
+        f"Compiled {count} templates into {current_app.config['JINJA_BYTECODE_CACHE_DIR']}"
+    )
+
+
+def register_commands(app: Flask) -> None:
+    """
+    Register the portfolio CLI commands on the app.
+    """
+    app.cli.add_command(backfill_timeline)
+    app.cli.add_command(copy_mysql_to_sqlite)
+    app.cli.add_command(export_static)
+    app.cli.add_command(precompile_templates_command)
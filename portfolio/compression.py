@@ -0,0 +1,155 @@
+import gzip
+import mimetypes
+import os
+import sys
+from typing import Dict, Iterable, Optional
+
+from flask import Flask, Response, current_app, request, send_from_directory
+from werkzeug.security import safe_join
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is an optional speedup
+    brotli = None  # type: ignore
+
+# Preferred first when the client accepts several.
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+FILE_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+COMPRESSIBLE_MIMETYPES = {
+    "application/javascript",
+    "application/json",
+    "application/manifest+json",
+    "application/xml",
+    "image/svg+xml",
+}
+
+STATIC_EXTENSIONS = (".css", ".js", ".json", ".svg", ".txt", ".html", ".xml")
+
+# Bodies smaller than this are not worth a Content-Encoding.
+MIN_SIZE = 512
+
+# Cached responses are compressed when a request fills the entry, so they use
+# moderate levels. Static assets are compressed once at build time, at the
+# highest levels.
+DYNAMIC_LEVELS = {"br": 5, "gzip": 6}
+STATIC_LEVELS = {"br": 11, "gzip": 9}
+
+
+def is_compressible(mimetype: Optional[str]) -> bool:
+    """
+    Return whether a body of this type benefits from compression.
+    """
+    if not mimetype:
+        return False
+    return mimetype.startswith("text/") or mimetype in COMPRESSIBLE_MIMETYPES
+
+
+def compress(
+    data: bytes, encoding: str, levels: Dict[str, int] = DYNAMIC_LEVELS
+) -> bytes:
+    """
+    Compress ``data`` at the level ``levels`` gives for ``encoding``.
+    """
+    if encoding == "br":
+        return brotli.compress(data, quality=levels["br"])
+    return gzip.compress(data, compresslevel=levels["gzip"], mtime=0)
+
+
+def compress_variants(data: bytes, mimetype: Optional[str]) -> Dict[str, bytes]:
+    """
+    Build every encoding of ``data`` that is smaller than the original.
+    """
+    if len(data) < MIN_SIZE or not is_compressible(mimetype):
+        return {}
+    variants = {}
+    for encoding in ENCODINGS:
+        compressed = compress(data, encoding)
+        if len(compressed) < len(data):
+            variants[encoding] = compressed
+    return variants
+
+
+def negotiate(available: Iterable[str]) -> Optional[str]:
+    """
+    Pick the best of ``available`` encodings the current request accepts.
+    """
+    accepted = request.accept_encodings
+    best, best_quality = None, 0.0
+    for encoding in ENCODINGS:
+        if encoding not in available:
+            continue
+        quality = accepted[encoding]
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress_static(folder: str) -> int:
+    """
+    Write ``.gz`` and ``.br`` siblings next to every text asset in ``folder``.
+
+    Siblings that are newer than their source are left alone. Returns the
+    number of files written.
+    """
+    written = 0
+    for directory, _dirs, files in os.walk(folder):
+        for name in files:
+            if not name.endswith(STATIC_EXTENSIONS):
+                continue
+            path = os.path.join(directory, name)
+            mtime = os.path.getmtime(path)
+            data = None
+            for encoding in ENCODINGS:
+                target = path + FILE_SUFFIXES[encoding]
+                if os.path.exists(target) and os.path.getmtime(target) >= mtime:
+                    continue
+                if data is None:
+                    with open(path, "rb") as f:
+                        data = f.read()
+                compressed = compress(data, encoding, STATIC_LEVELS)
+                if len(compressed) >= len(data):
+                    continue
+                with open(target, "wb") as f:
+                    f.write(compressed)
+                written += 1
+    return written
+
+
+def send_precompressed_static(filename: str) -> Response:
+    """
+    Serve a static file, using a precompressed sibling when the client takes it.
+    """
+    folder = current_app.static_folder
+    path = safe_join(folder, filename)
+    available = [
+        encoding
+        for encoding in ENCODINGS
+        if path is not None and os.path.isfile(path + FILE_SUFFIXES[encoding])
+    ]
+    encoding = negotiate(available) if available else None
+    if encoding is None:
+        response = current_app.send_static_file(filename)
+    else:
+        response = send_from_directory(
+            folder,
+            filename + FILE_SUFFIXES[encoding],
+            mimetype=mimetypes.guess_type(filename)[0] or "application/octet-stream",
+        )
+        response.headers["Content-Encoding"] = encoding
+    if available:
+        response.vary.add("Accept-Encoding")
+    return response
+
+
+def init_compression(app: Flask) -> None:
+    """
+    Serve precompressed static siblings written by ``compress_static``.
+    """
+    app.view_functions["static"] = send_precompressed_static
+
+
+if __name__ == "__main__":
+    for static_folder in sys.argv[1:] or ["portfolio/static"]:
+        print(f"{static_folder}: {compress_static(static_folder)} files compressed")
@@ -0,0 +1,85 @@
+import hashlib
+from datetime import datetime, timezone
+from functools import wraps
+from typing import Any, Callable
+
+from flask import Response, current_app, request
+from werkzeug.http import is_resource_modified
+
+from portfolio.cache import tag_states
+from portfolio.compression import ENCODINGS
+
+
+def conditional(*tags: str) -> Callable:
+    """
+    Answer conditional GETs with ``304 Not Modified`` before the view runs.
+
+    The ETag is derived from the URL and the version of every tagged table.
+    It is weak, because a body may carry per-request metadata.
+    ``Last-Modified`` is the time of the newest write to a tagged table, kept
+    with its version. A tag's state is seeded from the newest ``updated_at``
+    or deletion in the database, and is moved forward by each invalidation.
+    The database is only read for a tag that has no cached state yet, so
+    both checks usually cost one cache lookup and no database or template
+    work.
+    """
+
+    def decorator(f: Callable) -> Callable:
+        @wraps(f)
+        def decorated_function(*args: Any, **kwargs: Any) -> Any:
+            if request.method not in ("GET", "HEAD"):
+                return f(*args, **kwargs)
+
+            states = tag_states(*tags)
+            fingerprint = (
+                request.full_path
+                + "|"
+                + ",".join(f"{tag}:{states[tag][0]}" for tag in tags)
+            )
+            etag = hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()
+            last_modified = max(
+                datetime.fromtimestamp(states[tag][1], tz=timezone.utc) for tag in tags
+            ).replace(microsecond=0)
+
+            if request.if_none_match:
+                # Each content coding of the page has its own ETag; any of
+                # them for the current version means the client is fresh.
+                candidates = [etag] + [f"{etag}-{enc}" for enc in ENCODINGS]
+                matched = next(
+                    (
+                        tag
+                        for tag in candidates
+                        if request.if_none_match.contains_weak(tag)
+                    ),
+                    None,
+                )
+            else:
+                matched = (
+                    etag
+                    if not is_resource_modified(
+                        request.environ, last_modified=last_modified
+                    )
+                    else None
+                )
+
+            if matched is not None:
+                response: Response = current_app.response_class(status=304)
+                etag = matched
+            else:
+                response = current_app.make_response(f(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+                if response.content_encoding:
+                    etag = f"{etag}-{response.content_encoding}"
+
+            response.set_etag(etag, weak=True)
+            response.last_modified = last_modified
+            # Let browsers and the proxy keep the body but revalidate each use.
+            response.cache_control.no_cache = True
+            if "Authorization" in request.headers:
+                response.cache_control.private = True
+            return response
+
+        return decorated_function
+
+    return decorator
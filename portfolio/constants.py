@@ -1,159 +1,166 @@
-from typing import Dict, List, Literal
-
-status_codes: List[int] = [
-    100,
-    101,
-    102,
-    103,
-    200,
-    201,
-    202,
-    203,
-    204,
-    205,
-    206,
-    207,
-    208,
-    226,
-    300,
-    301,
-    302,
-    303,
-    304,
-    305,
-    306,
-    307,
-    308,
-    400,
-    401,
-    402,
-    403,
-    404,
-    405,
-    406,
-    407,
-    408,
-    409,
-    410,
-    411,
-    412,
-    413,
-    414,
-    415,
-    416,
-    417,
-    418,
-    421,
-    422,
-    423,
-    424,
-    425,
-    426,
-    428,
-    429,
-    431,
-    451,
-    500,
-    501,
-    502,
-    503,
-    504,
-    505,
-    506,
-    507,
-    508,
-    510,
-    511,
-]
-
-StatusCodeLiteral = Literal[
-    100,
-    101,
-    102,
-    103,
-    200,
-    201,
-    202,
-    203,
-    204,
-    205,
-    206,
-    207,
-    208,
-    226,
-    300,
-    301,
-    302,
-    303,
-    304,
-    305,
-    306,
-    307,
-    308,
-    400,
-    401,
-    402,
-    403,
-    404,
-    405,
-    406,
-    407,
-    408,
-    409,
-    410,
-    411,
-    412,
-    413,
-    414,
-    415,
-    416,
-    417,
-    418,
-    421,
-    422,
-    423,
-    424,
-    425,
-    426,
-    428,
-    429,
-    431,
-    451,
-    500,
-    501,
-    502,
-    503,
-    504,
-    505,
-    506,
-    507,
-    508,
-    510,
-    511,
-]
-
-columns: Dict[str, List[str]] = {
-    "education": [
-        "institution",
-        "degree",
-        "startDate",
-        "endDate",
-        "logo",
-        "description",
-        "skills",
-        "id",
-    ],
-    "places": ["name", "description", "lat", "lng", "id"],
-    "work": [
-        "logo",
-        "company",
-        "title",
-        "type",
-        "location",
-        "startDate",
-        "endDate",
-        "description",
-        "id",
-    ],
-    "about": ["description", "image", "id"],
-}
+from typing import Dict, List, Literal
+
+status_codes: List[int] = [
+    100,
+    101,
+    102,
+    103,
+    200,
+    201,
+    202,
+    203,
+    204,
+    205,
+    206,
+    207,
+    208,
+    226,
+    300,
+    301,
+    302,
+    303,
+    304,
+    305,
+    306,
+    307,
+    308,
+    400,
+    401,
+    402,
+    403,
+    404,
+    405,
+    406,
+    407,
+    408,
+    409,
+    410,
+    411,
+    412,
+    413,
+    414,
+    415,
+    416,
+    417,
+    418,
+    421,
+    422,
+    423,
+    424,
+    425,
+    426,
+    428,
+    429,
+    431,
+    451,
+    500,
+    501,
+    502,
+    503,
+    504,
+    505,
+    506,
+    507,
+    508,
+    510,
+    511,
+]
+
+StatusCodeLiteral = Literal[
+    100,
+    101,
+    102,
+    103,
+    200,
+    201,
+    202,
+    203,
+    204,
+    205,
+    206,
+    207,
+    208,
+    226,
+    300,
+    301,
+    302,
+    303,
+    304,
+    305,
+    306,
+    307,
+    308,
+    400,
+    401,
+    402,
+    403,
+    404,
+    405,
+    406,
+    407,
+    408,
+    409,
+    410,
+    411,
+    412,
+    413,
+    414,
+    415,
+    416,
+    417,
+    418,
+    421,
+    422,
+    423,
+    424,
+    425,
+    426,
+    428,
+    429,
+    431,
+    451,
+    500,
+    501,
+    502,
+    503,
+    504,
+    505,
+    506,
+    507,
+    508,
+    510,
+    511,
+]
+
+columns: Dict[str, List[str]] = {
+    "education": [
+        "institution",
+        "degree",
+        "startDate",
+        "endDate",
+        "logo",
+        "description",
+        "skills",
+        "id",
+    ],
+    "places": ["name", "description", "lat", "lng", "id"],
+    "work": [
+        "logo",
+        "company",
+        "title",
+        "type",
+        "location",
+        "startDate",
+        "endDate",
+        "description",
+        "id",
+    ],
+    "about": ["description", "image", "id"],
+}
+
+# Landing fields rendered as lists. Each is stored as plain text with the JSON
+# array of its items next to it in ``<field>_items``.
+list_fields: Dict[str, List[str]] = {
+    "education": ["description", "skills"],
+    "work": ["description"],
+}
@@ -1,306 +1,669 @@
-import os
-import sqlite3
-import json
-import logging
-from flask import g
-from typing import Dict, List, Any, Optional, Tuple
-from peewee import MySQLDatabase
-from dotenv import load_dotenv
-
-load_dotenv(dotenv_path=".env")
-
-logger = logging.getLogger(__name__)
-
-mydb = MySQLDatabase(
-    os.getenv(
-        "TEST_MYSQL_DATABASE" if os.getenv("TEST") == "True" else "MYSQL_DATABASE"
-    ),
-    user=os.getenv("MYSQL_USER"),
-    password=os.getenv("MYSQL_PASSWORD"),
-    host=os.getenv("MYSQL_HOST"),
-    port=3306,
-)
-
-
-class Database:
-    def __init__(self, db_path: str):
-        self.db_path = db_path
-
-    def get_connection(self) -> Tuple[sqlite3.Connection, sqlite3.Cursor]:
-        try:
-            if "conn" not in g:
-                g.conn = sqlite3.connect(self.db_path)
-                g.cursor = g.conn.cursor()
-            return g.conn, g.cursor
-        except sqlite3.Error as e:
-            logger.error("Error connecting to database: %s", e)
-            raise
-
-    def create_table(self, table_name: str, columns: Dict[str, str]) -> None:
-        conn: Optional[sqlite3.Connection] = None
-        cursor: Optional[sqlite3.Cursor] = None
-        try:
-            conn, cursor = self.get_connection()
-
-            columns_dict = self.python_to_sql(columns)
-            if "id" not in columns_dict:
-                columns_dict["id"] = "INTEGER PRIMARY KEY AUTOINCREMENT"
-            columns_str = ", ".join(
-                [
-                    f"{column_name} {column_type}"
-                    for column_name, column_type in columns_dict.items()
-                ]
-            )
-            query = f"CREATE TABLE IF NOT EXISTS {table_name} ({columns_str})"
-            cursor.execute(query)
-            conn.commit()
-        except sqlite3.Error as e:
-            logger.error("Error creating table %s: %s", table_name, e)
-            if conn:
-                conn.rollback()
-            raise
-
-    def insert_data(self, table_name: str, data: Dict[str, Any]) -> None:
-        conn: Optional[sqlite3.Connection] = None
-        cursor: Optional[sqlite3.Cursor] = None
-        try:
-            conn, cursor = self.get_connection()
-            logger.info("Inserting data into table: %s", table_name)
-            logger.debug("Data to be inserted: %s", data)
-
-            if isinstance(data, str):
-                logger.warning(
-                    "Received string data instead of dictionary. Attempting to parse as JSON."
-                )
-                data = json.loads(data)
-
-            if not isinstance(data, dict):
-                raise ValueError(
-                    f"Invalid data type. Expected dictionary, got {type(data)}"
-                )
-
-            filtered_data = {k: v for k, v in data.items() if v is not None}
-
-            if "id" in data and data["id"] is not None:
-                cursor.execute(
-                    f"SELECT id FROM {table_name} WHERE id = ?", (data["id"],)
-                )
-                if cursor.fetchone():
-                    set_clause = ", ".join(
-                        [f"{k} = ?" for k in filtered_data.keys() if k != "id"]
-                    )
-                    query = f"UPDATE {table_name} SET {set_clause} WHERE id = ?"
-                    values = tuple(v for k, v in filtered_data.items() if k != "id") + (
-                        data["id"],
-                    )
-                else:
-                    columns_str = ", ".join(filtered_data.keys())
-                    placeholders = ", ".join(["?" for _ in filtered_data])
-                    query = f"INSERT INTO {table_name} ({columns_str}) VALUES ({placeholders})"
-                    values = tuple(filtered_data.values())
-            else:
-                columns_str = ", ".join(filtered_data.keys())
-                placeholders = ", ".join(["?" for _ in filtered_data])
-                query = (
-                    f"INSERT INTO {table_name} ({columns_str}) VALUES ({placeholders})"
-                )
-                values = tuple(filtered_data.values())
-
-            cursor.execute(query, values)
-            conn.commit()
-            logger.info("Successfully inserted data into %s", table_name)
-        except (sqlite3.Error, json.JSONDecodeError) as e:
-            logger.error("Error inserting data into %s: %s", table_name, e)
-            if conn:
-                conn.rollback()
-            raise
-
-    def update_data(
-        self,
-        table_name: str,
-        where_condition: Optional[Dict[str, Any]] = None,
-        data: Optional[Dict[str, Any]] = None,
-        index: int = 1,
-    ) -> None:
-        conn: Optional[sqlite3.Connection] = None
-        cursor: Optional[sqlite3.Cursor] = None
-        if where_condition is None:
-            raise ValueError("where_condition is required")
-        if data is None:
-            raise ValueError("data is required")
-        try:
-            conn, cursor = self.get_connection()
-
-            if index is not None:
-                cursor.execute(f"SELECT * FROM {table_name}")
-                rows = cursor.fetchall()
-
-                if 0 <= (index - 1) < len(rows):
-                    row_id = rows[index - 1][-1]
-                    where_condition = {"id": row_id}
-                else:
-                    logger.error(
-                        "Index %s out of range for table %s", index, table_name
-                    )
-                    raise ValueError(
-                        f"Index {index} out of range for table {table_name}. The length of the table is {len(rows)}, the index is. Rows is {rows[0][-1]}"
-                    )
-
-            if where_condition:
-                set_clause = ", ".join([f"{k} = ?" for k in data.keys()])
-                where_clause = " AND ".join(
-                    [f"{k} = ?" for k in where_condition.keys()]
-                )
-                query = f"UPDATE {table_name} SET {set_clause} WHERE {where_clause}"
-                logger.error("Query: %s", query)
-                params = tuple(data.values()) + tuple(where_condition.values())
-            else:
-                set_clause = ", ".join([f"{k} = ?" for k in data.keys()])
-                query = f"UPDATE {table_name} SET {set_clause}"
-                params = tuple(data.values())
-
-            cursor.execute(query, params)
-            conn.commit()
-        except sqlite3.Error as e:
-            logger.error("Error updating data in %s: %s", table_name, e)
-            if conn:
-                conn.rollback()
-            raise
-
-    def read_data(
-        self,
-        table_name: str,
-        columns: List[str],
-        where_condition: Optional[Dict[str, str]] = None,
-    ) -> List[Dict[str, Any]]:
-        conn: Optional[sqlite3.Connection] = None
-        cursor: Optional[sqlite3.Cursor] = None
-        try:
-            _, cursor = self.get_connection()
-
-            cursor.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name=?",
-                (table_name,),
-            )
-            if not cursor.fetchone():
-                raise ValueError(f"Table {table_name} does not exist")
-
-            cursor.execute(f"PRAGMA table_info({table_name})")
-            existing_columns = [col[1] for col in cursor.fetchall()]
-            logger.debug("Existing columns in %s: %s", table_name, existing_columns)
-            valid_columns = [
-                col for col in columns if col in existing_columns or col == "*"
-            ]
-
-            if not valid_columns:
-                raise ValueError(f"No valid columns found for {table_name}")
-
-            columns_str = ", ".join(valid_columns) if "*" not in valid_columns else "*"
-            query = f"SELECT {columns_str} FROM {table_name}"
-            if "id" in existing_columns:
-                query = f"SELECT id, {columns_str} FROM {table_name}"
-
-            if where_condition:
-                where_clause = " AND ".join(
-                    [f"{column_name} = ?" for column_name in where_condition.keys()]
-                )
-                query += f" WHERE {where_clause}"
-                cursor.execute(query, tuple(where_condition.values()))
-            else:
-                cursor.execute(query)
-
-            column_names = [description[0] for description in cursor.description]
-            return [dict(zip(column_names, row)) for row in cursor.fetchall()]
-        except sqlite3.Error as e:
-            logger.error("Error reading data from %s: %s", table_name, e)
-            if conn:
-                conn.rollback()
-            raise
-
-    def delete_data(self, table_name: str, where_condition: Dict[str, str]) -> None:
-        conn: Optional[sqlite3.Connection] = None
-        cursor: Optional[sqlite3.Cursor] = None
-        try:
-            conn, cursor = self.get_connection()
-            where_clause = " AND ".join(
-                [f"{column_name} = ?" for column_name, value in where_condition.items()]
-            )
-            query = f"DELETE FROM {table_name} WHERE {where_clause}"
-            cursor.execute(query, tuple(where_condition.values()))
-            conn.commit()
-        except sqlite3.Error as e:
-            logger.error("Error deleting data from %s: %s", table_name, e)
-            if conn:
-                conn.rollback()
-            raise
-
-    def close_connection(self) -> None:
-        try:
-            conn: Optional[sqlite3.Connection] = getattr(g, "conn", None)
-            if conn is not None:
-                conn.close()
-        except sqlite3.Error as e:
-            logger.error("Error closing database connection: %s", e)
-            raise
-
-    @staticmethod
-    def python_to_sql(columns: Dict[str, Any]) -> Dict[str, str]:
-        try:
-            python_to_sql_types = {
-                "str": "TEXT",
-                "int": "INTEGER",
-                "float": "REAL",
-                "bool": "INTEGER",
-                "datetime": "DATETIME",
-                "date": "DATE",
-                "list": "TEXT",
-                "dict": "TEXT",
-            }
-
-            reserved_keywords = ["limit", "order", "group"]
-
-            result = {}
-            for column_name, column_value in columns.items():
-                if column_name.lower() in reserved_keywords:
-                    column_name = f'"{column_name}"'
-                if isinstance(column_value, dict):
-                    result[column_name] = "TEXT"
-                else:
-                    type_name = type(column_value).__name__
-                    if type_name in python_to_sql_types:
-                        result[column_name] = python_to_sql_types[type_name]
-                    else:
-                        result[column_name] = "TEXT"
-                        logger.warning(
-                            "Unrecognized type %s for column %s. Using TEXT.",
-                            type_name,
-                            column_name,
-                        )
-
-            return result
-        except Exception as e:
-            logger.error("Error in python_to_sql conversion: %s", e)
-            raise
-
-    def convert_data_type(self, from_type: str, to_type: str) -> str:
-        python_to_sql_types = {
-            "str": "TEXT",
-            "int": "INTEGER",
-            "float": "REAL",
-            "bool": "INTEGER",
-            "datetime": "DATETIME",
-            "date": "DATE",
-            "list": "TEXT",
-            "dict": "TEXT",
-        }
-
-        sql_to_python_types = {v: k for k, v in python_to_sql_types.items()}
-
-        if from_type in python_to_sql_types and to_type.upper() in sql_to_python_types:
-            return to_type.upper()
-        elif (
-            from_type.upper() in sql_to_python_types and to_type in python_to_sql_types
-        ):
-            return python_to_sql_types[to_type]
-        else:
-            raise ValueError(f"Invalid conversion: from {from_type} to {to_type}")
+import os
+import sqlite3
+import json
+import logging
+from flask import g
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Any, Optional, Tuple
+from peewee import Database as PeeweeDatabase, MySQLDatabase, SqliteDatabase
+from dotenv import load_dotenv
+
+from portfolio.constants import list_fields
+from portfolio.filters import format_description
+
+load_dotenv(dotenv_path=".env")
+
+logger = logging.getLogger(__name__)
+
+root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Tuned for many concurrent readers and an occasional writer: WAL lets readers
+# proceed while a write is in flight, and the page cache / mmap keep hot pages
+# out of the syscall path.
+SQLITE_PRAGMAS: Dict[str, Any] = {
+    "journal_mode": "wal",
+    "synchronous": "normal",
+    "cache_size": -64 * 1024,
+    "mmap_size": 256 * 1024 * 1024,
+    "temp_store": "memory",
+    "foreign_keys": 1,
+}
+
+
+def connect_mysql() -> MySQLDatabase:
+    """
+    Create the MySQL/MariaDB database used by the peewee models.
+    """
+    return MySQLDatabase(
+        os.getenv(
+            "TEST_MYSQL_DATABASE" if os.getenv("TEST") == "True" else "MYSQL_DATABASE"
+        ),
+        user=os.getenv("MYSQL_USER"),
+        password=os.getenv("MYSQL_PASSWORD"),
+        host=os.getenv("MYSQL_HOST"),
+        port=3306,
+    )
+
+
+def connect_sqlite(path: Optional[str] = None) -> SqliteDatabase:
+    """
+    Create an embedded WAL-mode SQLite database for the peewee models.
+    """
+    return SqliteDatabase(
+        path
+        or os.getenv("SQLITE_DATABASE_PATH")
+        or os.path.join(root_path, "portfolio.db"),
+        pragmas=SQLITE_PRAGMAS,
+        timeout=5,
+    )
+
+
+def connect_models_database() -> PeeweeDatabase:
+    """
+    Pick the peewee backend from ``DATABASE_BACKEND`` (``mysql`` or ``sqlite``).
+    """
+    backend = os.getenv("DATABASE_BACKEND", "mysql").lower()
+    if backend == "sqlite":
+        return connect_sqlite()
+    if backend != "mysql":
+        logger.warning("Unknown DATABASE_BACKEND %s, falling back to mysql", backend)
+    return connect_mysql()
+
+
+mydb = connect_models_database()
+
+ITEMS_SUFFIX = "_items"
+
+
+# Ids of rows deleted from the landing tables, filled by triggers.
+TOMBSTONES_TABLE = "landing_tombstones"
+
+# How long tombstones are kept. Deletions before a changes cursor older than
+# this may have been pruned, so such a cursor is refused.
+TOMBSTONE_RETENTION = timedelta(days=30)
+
+SQLITE_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def current_timestamp(cursor: Any) -> datetime:
+    """
+    Return the database clock, which fills the ``updated_at`` columns.
+    """
+    cursor.execute("SELECT CURRENT_TIMESTAMP")
+    value = cursor.fetchone()[0]
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+def items_column(field: str) -> str:
+    return f"{field}{ITEMS_SUFFIX}"
+
+
+def normalize_list_fields(table_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Add the JSON array of items of each list field of ``data``.
+
+    The items are what the landing templates iterate over, so rendering reads
+    them as they are instead of reshaping the description on every request.
+    The list fields themselves are stored as given.
+    """
+    fields = [
+        field
+        for field in list_fields.get(table_name, ())
+        if data.get(field) is not None
+    ]
+    if not fields:
+        return data
+    data = dict(data)
+    for field in fields:
+        items = format_description(data[field]) if data[field] else []
+        data[items_column(field)] = json.dumps(items)
+    return data
+
+
+class Database:
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+
+    def get_connection(self) -> Tuple[sqlite3.Connection, sqlite3.Cursor]:
+        try:
+            if "conn" not in g:
+                g.conn = sqlite3.connect(self.db_path)
+                g.cursor = g.conn.cursor()
+            return g.conn, g.cursor
+        except sqlite3.Error as e:
+            logger.error("Error connecting to database: %s", e)
+            raise
+
+    def commit(self, conn: sqlite3.Connection) -> None:
+        """
+        Commit a write, unless it is part of an enclosing ``transaction``.
+        """
+        if not g.get("db_transaction"):
+            conn.commit()
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Commit every write made inside the block together, or none of them.
+        """
+        conn, _ = self.get_connection()
+        g.db_transaction = True
+        try:
+            yield
+        except BaseException:
+            conn.rollback()
+            raise
+        else:
+            conn.commit()
+        finally:
+            g.pop("db_transaction", None)
+
+    def create_table(self, table_name: str, columns: Dict[str, str]) -> None:
+        conn: Optional[sqlite3.Connection] = None
+        cursor: Optional[sqlite3.Cursor] = None
+        try:
+            conn, cursor = self.get_connection()
+
+            columns_dict = self.python_to_sql(columns)
+            if "id" not in columns_dict:
+                columns_dict["id"] = "INTEGER PRIMARY KEY AUTOINCREMENT"
+            columns_str = ", ".join(
+                [
+                    f"{column_name} {column_type}"
+                    for column_name, column_type in columns_dict.items()
+                ]
+            )
+            query = f"CREATE TABLE IF NOT EXISTS {table_name} ({columns_str})"
+            cursor.execute(query)
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.error("Error creating table %s: %s", table_name, e)
+            if conn:
+                conn.rollback()
+            raise
+
+    def insert_data(self, table_name: str, data: Dict[str, Any]) -> None:
+        conn: Optional[sqlite3.Connection] = None
+        cursor: Optional[sqlite3.Cursor] = None
+        try:
+            conn, cursor = self.get_connection()
+            logger.info("Inserting data into table: %s", table_name)
+            logger.debug("Data to be inserted: %s", data)
+
+            if isinstance(data, str):
+                logger.warning(
+                    "Received string data instead of dictionary. Attempting to parse as JSON."
+                )
+                data = json.loads(data)
+
+            if not isinstance(data, dict):
+                raise ValueError(
+                    f"Invalid data type. Expected dictionary, got {type(data)}"
+                )
+
+            filtered_data = normalize_list_fields(
+                table_name, {k: v for k, v in data.items() if v is not None}
+            )
+
+            if "id" in data and data["id"] is not None:
+                cursor.execute(
+                    f"SELECT id FROM {table_name} WHERE id = ?", (data["id"],)
+                )
+                if cursor.fetchone():
+                    set_clause = ", ".join(
+                        [f"{k} = ?" for k in filtered_data.keys() if k != "id"]
+                    )
+                    query = f"UPDATE {table_name} SET {set_clause} WHERE id = ?"
+                    values = tuple(v for k, v in filtered_data.items() if k != "id") + (
+                        data["id"],
+                    )
+                else:
+                    columns_str = ", ".join(filtered_data.keys())
+                    placeholders = ", ".join(["?" for _ in filtered_data])
+                    query = f"INSERT INTO {table_name} ({columns_str}) VALUES ({placeholders})"
+                    values = tuple(filtered_data.values())
+            else:
+                columns_str = ", ".join(filtered_data.keys())
+                placeholders = ", ".join(["?" for _ in filtered_data])
+                query = (
+                    f"INSERT INTO {table_name} ({columns_str}) VALUES ({placeholders})"
+                )
+                values = tuple(filtered_data.values())
+
+            cursor.execute(query, values)
+            self.commit(conn)
+            logger.info("Successfully inserted data into %s", table_name)
+        except (sqlite3.Error, json.JSONDecodeError) as e:
+            logger.error("Error inserting data into %s: %s", table_name, e)
+            if conn:
+                conn.rollback()
+            raise
+
+    def update_data(
+        self,
+        table_name: str,
+        where_condition: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        index: int = 1,
+    ) -> None:
+        conn: Optional[sqlite3.Connection] = None
+        cursor: Optional[sqlite3.Cursor] = None
+        if where_condition is None:
+            raise ValueError("where_condition is required")
+        if data is None:
+            raise ValueError("data is required")
+        try:
+            conn, cursor = self.get_connection()
+            data = normalize_list_fields(table_name, data)
+
+            if index is not None:
+                cursor.execute(f"SELECT id FROM {table_name}")
+                rows = cursor.fetchall()
+
+                if 0 <= (index - 1) < len(rows):
+                    row_id = rows[index - 1][0]
+                    where_condition = {"id": row_id}
+                else:
+                    logger.error(
+                        "Index %s out of range for table %s", index, table_name
+                    )
+                    raise ValueError(
+                        f"Index {index} out of range for table {table_name}. The length of the table is {len(rows)}, the index is. Rows is {rows[0][0]}"
+                    )
+
+            if where_condition:
+                set_clause = ", ".join([f"{k} = ?" for k in data.keys()])
+                where_clause = " AND ".join(
+                    [f"{k} = ?" for k in where_condition.keys()]
+                )
+                query = f"UPDATE {table_name} SET {set_clause} WHERE {where_clause}"
+                logger.error("Query: %s", query)
+                params = tuple(data.values()) + tuple(where_condition.values())
+            else:
+                set_clause = ", ".join([f"{k} = ?" for k in data.keys()])
+                query = f"UPDATE {table_name} SET {set_clause}"
+                params = tuple(data.values())
+
+            cursor.execute(query, params)
+            self.commit(conn)
+        except sqlite3.Error as e:
+            logger.error("Error updating data in %s: %s", table_name, e)
+            if conn:
+                conn.rollback()
+            raise
+
+    def read_data(
+        self,
+        table_name: str,
+        columns: List[str],
+        where_condition: Optional[Dict[str, str]] = None,
+    ) -> List[Dict[str, Any]]:
+        conn: Optional[sqlite3.Connection] = None
+        cursor: Optional[sqlite3.Cursor] = None
+        try:
+            _, cursor = self.get_connection()
+
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name=?",
+                (table_name,),
+            )
+            if not cursor.fetchone():
+                raise ValueError(f"Table {table_name} does not exist")
+
+            cursor.execute(f"PRAGMA table_info({table_name})")
+            existing_columns = [col[1] for col in cursor.fetchall()]
+            logger.debug("Existing columns in %s: %s", table_name, existing_columns)
+            valid_columns = [
+                col for col in columns if col in existing_columns or col == "*"
+            ]
+
+            if not valid_columns:
+                raise ValueError(f"No valid columns found for {table_name}")
+
+            columns_str = ", ".join(valid_columns) if "*" not in valid_columns else "*"
+            query = f"SELECT {columns_str} FROM {table_name}"
+            if "id" in existing_columns:
+                query = f"SELECT id, {columns_str} FROM {table_name}"
+
+            if where_condition:
+                where_clause = " AND ".join(
+                    [f"{column_name} = ?" for column_name in where_condition.keys()]
+                )
+                query += f" WHERE {where_clause}"
+                cursor.execute(query, tuple(where_condition.values()))
+            else:
+                cursor.execute(query)
+
+            column_names = [description[0] for description in cursor.description]
+            return [dict(zip(column_names, row)) for row in cursor.fetchall()]
+        except sqlite3.Error as e:
+            logger.error("Error reading data from %s: %s", table_name, e)
+            if conn:
+                conn.rollback()
+            raise
+
+    def read_items(self, table_name: str, columns: List[str]) -> List[Dict[str, Any]]:
+        """
+        Read rows with each list field replaced by its stored list of items.
+        """
+        fields = [
+            field for field in list_fields.get(table_name, ()) if field in columns
+        ]
+        rows = self.read_data(
+            table_name, columns + [items_column(field) for field in fields]
+        )
+        for row in rows:
+            for field in fields:
+                items = row.pop(items_column(field), None)
+                if items is not None:
+                    row[field] = json.loads(items)
+                elif field in row:
+                    value = row[field]
+                    row[field] = format_description(value) if value else []
+        return rows
+
+    def migrate_list_fields(self, table_name: str) -> int:
+        """
+        Add the ``<field>_items`` columns of a table and fill them for old rows.
+
+        Returns the number of rows updated.
+        """
+        fields = list_fields.get(table_name, ())
+        if not fields:
+            return 0
+        conn: Optional[sqlite3.Connection] = None
+        cursor: Optional[sqlite3.Cursor] = None
+        try:
+            conn, cursor = self.get_connection()
+            cursor.execute(f"PRAGMA table_info({table_name})")
+            existing_columns = [col[1] for col in cursor.fetchall()]
+            for field in fields:
+                if items_column(field) not in existing_columns:
+                    cursor.execute(
+                        f"ALTER TABLE {table_name} ADD COLUMN {items_column(field)} TEXT"
+                    )
+
+            missing = " OR ".join(
+                f"({items_column(field)} IS NULL AND {field} IS NOT NULL)"
+                for field in fields
+            )
+            cursor.execute(
+                f"SELECT id, {', '.join(fields)} FROM {table_name} WHERE {missing}"
+            )
+            rows = cursor.fetchall()
+            for row in rows:
+                data = {
+                    key: value
+                    for key, value in normalize_list_fields(
+                        table_name, dict(zip(fields, row[1:]))
+                    ).items()
+                    if key not in fields
+                }
+                set_clause = ", ".join(f"{k} = ?" for k in data)
+                cursor.execute(
+                    f"UPDATE {table_name} SET {set_clause} WHERE id = ?",
+                    tuple(data.values()) + (row[0],),
+                )
+            conn.commit()
+            return len(rows)
+        except sqlite3.Error as e:
+            logger.error("Error migrating list fields of %s: %s", table_name, e)
+            if conn:
+                conn.rollback()
+            raise
+
+    def track_changes(self, table_name: str) -> None:
+        """
+        Keep an indexed ``updated_at`` on a table and a tombstone for each
+        deleted row, both maintained by triggers.
+        """
+        conn: Optional[sqlite3.Connection] = None
+        cursor: Optional[sqlite3.Cursor] = None
+        try:
+            conn, cursor = self.get_connection()
+            cursor.execute(f"PRAGMA table_info({table_name})")
+            if "updated_at" not in [col[1] for col in cursor.fetchall()]:
+                # SQLite cannot add a column defaulting to CURRENT_TIMESTAMP.
+                cursor.execute(f"ALTER TABLE {table_name} ADD COLUMN updated_at TEXT")
+                cursor.execute(
+                    f"UPDATE {table_name} SET updated_at = CURRENT_TIMESTAMP"
+                )
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS {table_name}_updated_at "
+                f"ON {table_name} (updated_at)"
+            )
+            cursor.execute(
+                f"CREATE TABLE IF NOT EXISTS {TOMBSTONES_TABLE} ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "table_name TEXT NOT NULL, row_id INTEGER, "
+                "deleted_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP)"
+            )
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS {TOMBSTONES_TABLE}_table_name_deleted_at "
+                f"ON {TOMBSTONES_TABLE} (table_name, deleted_at)"
+            )
+            cursor.execute(
+                f"CREATE TRIGGER IF NOT EXISTS {table_name}_inserted_at "
+                f"AFTER INSERT ON {table_name} FOR EACH ROW "
+                "WHEN NEW.updated_at IS NULL "
+                f"BEGIN UPDATE {table_name} SET updated_at = CURRENT_TIMESTAMP "
+                "WHERE rowid = NEW.rowid; END"
+            )
+            cursor.execute(
+                f"CREATE TRIGGER IF NOT EXISTS {table_name}_updated_at "
+                f"AFTER UPDATE ON {table_name} FOR EACH ROW "
+                "WHEN NEW.updated_at IS OLD.updated_at "
+                f"BEGIN UPDATE {table_name} SET updated_at = CURRENT_TIMESTAMP "
+                "WHERE rowid = NEW.rowid; END"
+            )
+            cursor.execute(
+                f"CREATE TRIGGER IF NOT EXISTS {table_name}_deleted "
+                f"AFTER DELETE ON {table_name} FOR EACH ROW "
+                f"BEGIN INSERT INTO {TOMBSTONES_TABLE} (table_name, row_id) "
+                f"VALUES ('{table_name}', OLD.id); END"
+            )
+            self.prune_tombstones(cursor)
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.error("Error tracking changes of %s: %s", table_name, e)
+            if conn:
+                conn.rollback()
+            raise
+
+    @staticmethod
+    def prune_tombstones(cursor: sqlite3.Cursor) -> None:
+        """
+        Drop the tombstones older than ``TOMBSTONE_RETENTION``.
+        """
+        cursor.execute(
+            f"DELETE FROM {TOMBSTONES_TABLE} WHERE deleted_at < datetime('now', ?)",
+            (f"-{int(TOMBSTONE_RETENTION.total_seconds())} seconds",),
+        )
+
+    def now(self) -> datetime:
+        """
+        Return the clock the ``updated_at`` columns are filled from.
+        """
+        _, cursor = self.get_connection()
+        return current_timestamp(cursor)
+
+    def last_modified(self, table_name: str) -> Optional[datetime]:
+        """
+        Return the newest ``updated_at`` or tombstone of a tracked table.
+        """
+        _, cursor = self.get_connection()
+        cursor.execute(f"SELECT MAX(updated_at) FROM {table_name}")
+        updated = cursor.fetchone()[0]
+        cursor.execute(
+            f"SELECT MAX(deleted_at) FROM {TOMBSTONES_TABLE} WHERE table_name = ?",
+            (table_name,),
+        )
+        deleted = cursor.fetchone()[0]
+        return max(
+            (datetime.fromisoformat(value) for value in (updated, deleted) if value),
+            default=None,
+        )
+
+    def read_changes(
+        self, table_name: str, columns: List[str], since: Optional[datetime] = None
+    ) -> Tuple[List[Dict[str, Any]], List[int]]:
+        """
+        Read the rows written at or after ``since``, oldest first, and the ids
+        of the rows deleted since then.
+
+        Without ``since`` every row is read and no ids are returned.
+        """
+        _, cursor = self.get_connection()
+        columns_str = ", ".join(["id"] + [col for col in columns if col != "id"])
+        query = f"SELECT {columns_str}, updated_at FROM {table_name}"
+        if since is None:
+            cursor.execute(f"{query} ORDER BY updated_at, id")
+        else:
+            cursor.execute(
+                f"{query} WHERE updated_at >= ? ORDER BY updated_at, id",
+                (since.strftime(SQLITE_TIMESTAMP_FORMAT),),
+            )
+        column_names = [description[0] for description in cursor.description]
+        rows = [dict(zip(column_names, row)) for row in cursor.fetchall()]
+        if since is None:
+            return rows, []
+        cursor.execute(
+            f"SELECT row_id FROM {TOMBSTONES_TABLE} "
+            "WHERE table_name = ? AND deleted_at >= ? ORDER BY deleted_at, id",
+            (table_name, since.strftime(SQLITE_TIMESTAMP_FORMAT)),
+        )
+        return rows, [row[0] for row in cursor.fetchall()]
+
+    def iter_rows(self, table_name: str) -> Iterator[Dict[str, Any]]:
+        """
+        Yield every row of a table with all its columns, from the cursor.
+        """
+        conn, _ = self.get_connection()
+        cursor = conn.execute(f"SELECT * FROM {table_name}")
+        column_names = [description[0] for description in cursor.description]
+        for row in cursor:
+            yield dict(zip(column_names, row))
+
+    def write_rows(self, table_name: str, rows: List[Dict[str, Any]]) -> int:
+        """
+        Insert rows as they are stored, replacing those with the same id.
+
+        Keys that are not columns of the table are dropped, and
+        ``updated_at`` is left to the triggers. Returns the rows written.
+        """
+        conn: Optional[sqlite3.Connection] = None
+        cursor: Optional[sqlite3.Cursor] = None
+        try:
+            conn, cursor = self.get_connection()
+            cursor.execute(f"PRAGMA table_info({table_name})")
+            existing_columns = {col[1] for col in cursor.fetchall()} - {"updated_at"}
+            written = 0
+            for row in rows:
+                data = {k: v for k, v in row.items() if k in existing_columns}
+                if not data:
+                    continue
+                placeholders = ", ".join(["?" for _ in data])
+                cursor.execute(
+                    f"INSERT OR REPLACE INTO {table_name} ({', '.join(data)}) "
+                    f"VALUES ({placeholders})",
+                    tuple(data.values()),
+                )
+                written += 1
+            self.commit(conn)
+            return written
+        except sqlite3.Error as e:
+            logger.error("Error writing rows to %s: %s", table_name, e)
+            if conn:
+                conn.rollback()
+            raise
+
+    def delete_data(self, table_name: str, where_condition: Dict[str, str]) -> None:
+        conn: Optional[sqlite3.Connection] = None
+        cursor: Optional[sqlite3.Cursor] = None
+        try:
+            conn, cursor = self.get_connection()
+            where_clause = " AND ".join(
+                [f"{column_name} = ?" for column_name, value in where_condition.items()]
+            )
+            query = f"DELETE FROM {table_name} WHERE {where_clause}"
+            cursor.execute(query, tuple(where_condition.values()))
+            # The delete trigger of a tracked table just wrote a tombstone.
+            self.prune_tombstones(cursor)
+            self.commit(conn)
+        except sqlite3.Error as e:
+            logger.error("Error deleting data from %s: %s", table_name, e)
+            if conn:
+                conn.rollback()
+            raise
+
+    def close_connection(self) -> None:
+        try:
+            conn: Optional[sqlite3.Connection] = getattr(g, "conn", None)
+            if conn is not None:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.error("Error closing database connection: %s", e)
+            raise
+
+    @staticmethod
+    def python_to_sql(columns: Dict[str, Any]) -> Dict[str, str]:
+        try:
+            python_to_sql_types = {
+                "str": "TEXT",
+                "int": "INTEGER",
+                "float": "REAL",
+                "bool": "INTEGER",
+                "datetime": "DATETIME",
+                "date": "DATE",
+                "list": "TEXT",
+                "dict": "TEXT",
+            }
+
+            reserved_keywords = ["limit", "order", "group"]
+
+            result = {}
+            for column_name, column_value in columns.items():
+                if column_name.lower() in reserved_keywords:
+                    column_name = f'"{column_name}"'
+                if isinstance(column_value, dict):
+                    result[column_name] = "TEXT"
+                else:
+                    type_name = type(column_value).__name__
+                    if type_name in python_to_sql_types:
+                        result[column_name] = python_to_sql_types[type_name]
+                    else:
+                        result[column_name] = "TEXT"
+                        logger.warning(
+                            "Unrecognized type %s for column %s. Using TEXT.",
+                            type_name,
+                            column_name,
+                        )
+
+            return result
+        except Exception as e:
+            logger.error("Error in python_to_sql conversion: %s", e)
+            raise
+
+    def convert_data_type(self, from_type: str, to_type: str) -> str:
+        python_to_sql_types = {
+            "str": "TEXT",
+            "int": "INTEGER",
+            "float": "REAL",
+            "bool": "INTEGER",
+            "datetime": "DATETIME",
+            "date": "DATE",
+            "list": "TEXT",
+            "dict": "TEXT",
+        }
+
+        sql_to_python_types = {v: k for k, v in python_to_sql_types.items()}
+
+        if from_type in python_to_sql_types and to_type.upper() in sql_to_python_types:
+            return to_type.upper()
+        elif (
+            from_type.upper() in sql_to_python_types and to_type in python_to_sql_types
+        ):
+            return python_to_sql_types[to_type]
+        else:
+            raise ValueError(f"Invalid conversion: from {from_type} to {to_type}")
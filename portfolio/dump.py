@@ -0,0 +1,190 @@
+import json
+import logging
+import sqlite3
+from datetime import date, datetime
+from itertools import groupby
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple, Type
+
+from flask import request
+from peewee import DatabaseError
+
+from portfolio.api import APIBase, APIHobbies, APIProjects, APITimeline
+from portfolio.cache import invalidate_tags
+from portfolio.constants import columns
+from portfolio.db import Database, mydb, normalize_list_fields
+from portfolio.responses import JSONResponse, json_response, stream_ndjson
+from portfolio.schemas import validate_rows
+
+logger = logging.getLogger(__name__)
+
+# Lines written per transaction by an import.
+IMPORT_BATCH_SIZE = 500
+
+MODEL_APIS: Dict[str, Type[APIBase]] = {
+    api.model._meta.table_name: api for api in (APIHobbies, APIProjects, APITimeline)
+}
+
+TABLES = tuple(MODEL_APIS) + tuple(columns)
+
+# table -> [(line number, row)]
+Batch = Dict[str, List[Tuple[int, Dict[str, Any]]]]
+
+
+class DumpError(ValueError):
+    """
+    Raised when a dump names an unknown table or one of its lines is malformed.
+    """
+
+
+def _isoformat(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat(" ")
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def parse_tables(value: Optional[str]) -> Tuple[str, ...]:
+    """
+    Parse ``?tables=a,b``, defaulting to every content table.
+    """
+    if not value:
+        return TABLES
+    tables = tuple(table for table in value.split(",") if table)
+    for table in tables:
+        if table not in TABLES:
+            raise DumpError(f"Unknown table {table}")
+    return tables
+
+
+def iter_dump(db: Database, tables: Tuple[str, ...]) -> Iterator[Dict[str, Any]]:
+    """
+    Yield a ``{"table", "row"}`` record for every row of ``tables``.
+
+    Rows are read from the cursor, and dates are written in ISO 8601 so an
+    import parses them back.
+    """
+    for table in tables:
+        api = MODEL_APIS.get(table)
+        rows = api.model.select().dicts().iterator() if api else db.iter_rows(table)
+        for row in rows:
+            yield {
+                "table": table,
+                "row": {key: _isoformat(value) for key, value in row.items()},
+            }
+
+
+def export_dump(db: Database) -> JSONResponse:
+    """
+    Stream the content tables as newline-delimited JSON.
+    """
+    try:
+        tables = parse_tables(request.args.get("tables"))
+    except DumpError as e:
+        return json_response({"error": str(e)}), 400
+    return stream_ndjson(iter_dump(db, tables)), 200
+
+
+def _parse_line(line_number: int, line: bytes) -> Tuple[str, Dict[str, Any]]:
+    try:
+        record = json.loads(line)
+    except ValueError as e:
+        raise DumpError(f"Line {line_number} is not valid JSON: {e}") from e
+    if not isinstance(record, dict) or not isinstance(record.get("row"), dict):
+        raise DumpError(f"Line {line_number} must be an object with table and row")
+    table = record.get("table")
+    if table not in TABLES:
+        raise DumpError(f"Line {line_number} has unknown table {table}")
+    return table, record["row"]
+
+
+def iter_batches(stream: IO[bytes], batch_size: int) -> Iterator[Batch]:
+    """
+    Parse a dump line by line, yielding its rows in batches of ``batch_size``.
+    """
+    batch: Batch = {}
+    size = 0
+    for line_number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        table, row = _parse_line(line_number, line)
+        batch.setdefault(table, []).append((line_number, row))
+        size += 1
+        if size >= batch_size:
+            yield batch
+            batch, size = {}, 0
+    if batch:
+        yield batch
+
+
+def _write_models(api: Type[APIBase], rows: List[Dict[str, Any]]) -> int:
+    """
+    Insert rows into a model table, replacing those with the same keys.
+
+    Rows go through ``prepare`` like an API write, so derived columns are
+    filled. ``updated_at`` is left to the database so delta sync sees the rows.
+    """
+    model = api.model
+    fields = set(model._meta.fields) - {"updated_at"}
+    data = [
+        {key: value for key, value in api.prepare(row).items() if key in fields}
+        for row in rows
+    ]
+    # insert_many takes its columns from the first row.
+    for _keys, group in groupby(data, key=lambda row: tuple(row)):
+        model.insert_many(list(group)).on_conflict_replace().execute()
+    return len(data)
+
+
+def write_batch(db: Database, batch: Batch) -> Dict[str, int]:
+    """
+    Validate a batch, then write it in one transaction.
+
+    Returns the rows written per table.
+    """
+    for table, lines in batch.items():
+        api = MODEL_APIS.get(table)
+        if api is None or api.schema is None:
+            continue
+        errors = validate_rows(api.schema, [row for _, row in lines])
+        if errors:
+            index, messages = next(iter(errors.items()))
+            raise DumpError(f"Line {lines[index][0]}: {', '.join(messages)}")
+
+    written: Dict[str, int] = {}
+    with db.transaction(), mydb.atomic():
+        for table, lines in batch.items():
+            rows = [row for _, row in lines]
+            api = MODEL_APIS.get(table)
+            if api is None:
+                # Refresh the <field>_items columns as a landing write does.
+                rows = [normalize_list_fields(table, row) for row in rows]
+                written[table] = db.write_rows(table, rows)
+            else:
+                written[table] = _write_models(api, rows)
+    return written
+
+
+def import_dump(db: Database) -> JSONResponse:
+    """
+    Load a newline-delimited JSON dump from the request body.
+
+    The body is parsed as it is read and written every ``IMPORT_BATCH_SIZE``
+    lines, one transaction per batch, so memory does not grow with the dump.
+    Rows replace those with the same id. When a line fails, the batches
+    before it stay written and the response reports them.
+    """
+    imported: Dict[str, int] = {}
+    try:
+        for batch in iter_batches(request.stream, IMPORT_BATCH_SIZE):
+            for table, count in write_batch(db, batch).items():
+                imported[table] = imported.get(table, 0) + count
+    except DumpError as e:
+        return json_response({"error": str(e), "imported": imported}), 400
+    except (DatabaseError, sqlite3.Error) as e:
+        logger.error("Error importing dump: %s", e)
+        return json_response({"error": str(e), "imported": imported}), 500
+    finally:
+        if imported:
+            invalidate_tags(*imported)
+    return json_response({"imported": imported}), 200
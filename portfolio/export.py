@@ -0,0 +1,174 @@
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from datetime import datetime
+from typing import Dict, Optional, Set
+
+from flask import Flask, current_app, has_app_context, url_for
+
+from portfolio.cache import cache, on_invalidate
+from portfolio.compression import compress_static
+
+logger = logging.getLogger(__name__)
+
+root_path = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Public pages and the file each is written to inside a release.
+EXPORT_PAGES: Dict[str, str] = {
+    "index": "index.html",
+    "hobbies": "hobbies/index.html",
+    "projects": "projects/index.html",
+    "timeline": "timeline/index.html",
+    "contact": "contact/index.html",
+}
+
+DEFAULT_KEEP_RELEASES = 3
+
+# Writes arriving within this many seconds are published together.
+PUBLISH_DELAY = 2.0
+
+PUBLISH_LOCK = "publish/static-export"
+PUBLISH_LOCK_TIMEOUT = 300
+
+_timer: Optional[threading.Timer] = None
+_timer_lock = threading.Lock()
+
+
+class ExportError(RuntimeError):
+    """
+    Raised when a page cannot be rendered for the export.
+    """
+
+
+def _write(release: str, filename: str, data: bytes) -> None:
+    path = os.path.join(release, filename)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def _render_release(app: Flask, release: str) -> None:
+    base_url = app.config.get("CACHE_WARMUP_BASE_URL", "http://localhost:5000/")
+    client = app.test_client()
+    with app.test_request_context(base_url=base_url):
+        files = {url_for(endpoint): name for endpoint, name in EXPORT_PAGES.items()}
+
+    # Only public pages are exported, rendered as an anonymous visitor: nginx
+    # serves the export to anyone.
+    for url, filename in files.items():
+        response = client.get(url, base_url=base_url)
+        try:
+            if response.status_code != 200:
+                raise ExportError(f"GET {url} returned {response.status_code}")
+            _write(release, filename, response.get_data())
+        finally:
+            response.close()
+
+    shutil.copytree(app.static_folder, os.path.join(release, "static"))
+    compress_static(release)
+
+
+def _swap(output: str, release: str) -> None:
+    """
+    Point the ``output`` symlink at ``release`` in a single rename.
+    """
+    if os.path.isdir(output) and not os.path.islink(output):
+        raise ExportError(f"{output} is a directory, expected a symlink")
+    link = f"{output}.{os.getpid()}.tmp"
+    os.symlink(os.path.relpath(release, os.path.dirname(output)), link)
+    os.replace(link, output)
+
+
+def _prune(releases: str, keep: int, current: str) -> None:
+    names = sorted(os.listdir(releases), reverse=True)
+    for name in names[keep:]:
+        path = os.path.join(releases, name)
+        if path != current:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def export_site(app: Flask, output: Optional[str] = None) -> str:
+    """
+    Render the public site into a new release and publish it at ``output``.
+
+    ``output`` (``STATIC_EXPORT_DIR``) is a symlink to the current release
+    under ``releases/`` next to it. The new release is fully written before
+    the link is swapped, so nginx never serves a half-written tree, and a
+    failed render leaves the previous release in place. Returns the path of
+    the published release.
+    """
+    output = os.path.abspath(output or app.config["STATIC_EXPORT_DIR"])
+    releases = os.path.join(os.path.dirname(output), "releases")
+    os.makedirs(releases, exist_ok=True)
+    # Names sort in creation order, which _prune relies on.
+    prefix = datetime.now().strftime("%Y%m%dT%H%M%S%f-")
+    release = tempfile.mkdtemp(prefix=prefix, dir=releases)
+    os.chmod(release, 0o755)
+    try:
+        _render_release(app, release)
+        _swap(output, release)
+    except Exception:
+        shutil.rmtree(release, ignore_errors=True)
+        raise
+    _prune(releases, app.config["STATIC_EXPORT_KEEP"], release)
+    logger.info("Published static export %s", release)
+    return release
+
+
+def _publish(app: Flask) -> None:
+    with app.app_context():
+        if not cache.add(PUBLISH_LOCK, os.getpid(), timeout=PUBLISH_LOCK_TIMEOUT):
+            # Another worker is exporting; run again once it is done so this
+            # write is included.
+            schedule_publish(app)
+            return
+        try:
+            export_site(app)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Static export failed")
+        finally:
+            cache.delete(PUBLISH_LOCK)
+
+
+def schedule_publish(app: Flask, delay: float = PUBLISH_DELAY) -> None:
+    """
+    Export the site after ``delay`` seconds, restarting the delay on each call.
+    """
+    global _timer  # pylint: disable=global-statement
+    with _timer_lock:
+        if _timer is not None:
+            _timer.cancel()
+        _timer = threading.Timer(delay, _publish, args=(app,))
+        _timer.daemon = True
+        _timer.start()
+
+
+def _publish_invalidated(_tags: Set[str]) -> None:
+    if not has_app_context() or not current_app.config.get("STATIC_EXPORT"):
+        return
+    app = current_app._get_current_object()  # pylint: disable=protected-access
+    schedule_publish(app)
+
+
+def init_export(app: Flask) -> None:
+    """
+    Configure the static export and republish it after every write.
+
+    The publisher only runs when ``STATIC_EXPORT`` is enabled; ``flask
+    export-static`` works either way.
+    """
+    app.config.setdefault(
+        "STATIC_EXPORT",
+        os.getenv("STATIC_EXPORT", "false").lower() in ("1", "true", "yes"),
+    )
+    app.config.setdefault(
+        "STATIC_EXPORT_DIR",
+        os.getenv("STATIC_EXPORT_DIR") or os.path.join(root_path, "build", "site"),
+    )
+    app.config.setdefault(
+        "STATIC_EXPORT_KEEP",
+        int(os.getenv("STATIC_EXPORT_KEEP", str(DEFAULT_KEEP_RELEASES))),
+    )
+    on_invalidate(_publish_invalidated)
@@ -0,0 +1,152 @@
+import logging
+import re
+import threading
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, Iterable, List, Set
+
+from flask import Flask
+from jinja2 import Environment, nodes
+
+from portfolio.utils import Memoize
+
+logger = logging.getLogger(__name__)
+
+# Distinct regex_replace patterns kept compiled.
+PATTERN_CACHE_SIZE = 256
+
+compile_pattern = Memoize(re.compile, maxsize=PATTERN_CACHE_SIZE)
+
+# filter name -> [calls, seconds]
+_timings: Dict[str, List[float]] = {}
+_timings_lock = threading.Lock()
+
+
+def timed(name: str) -> Callable[[Callable], Callable]:
+    """
+    Count the calls to a filter and the time spent in it.
+    """
+
+    def decorator(f: Callable) -> Callable:
+        with _timings_lock:
+            _timings.setdefault(name, [0, 0.0])
+
+        @wraps(f)
+        def decorated_function(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return f(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                with _timings_lock:
+                    counters = _timings[name]
+                    counters[0] += 1
+                    counters[1] += elapsed
+
+        return decorated_function
+
+    return decorator
+
+
+def filter_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Return the call count and total seconds of every filter, and the
+    compiled-pattern cache statistics under ``patterns``.
+    """
+    with _timings_lock:
+        stats: Dict[str, Dict[str, Any]] = {
+            name: {"calls": int(calls), "seconds": seconds}
+            for name, (calls, seconds) in _timings.items()
+        }
+    stats["patterns"] = compile_pattern.stats()
+    return stats
+
+
+def reset_filter_stats() -> None:
+    with _timings_lock:
+        for counters in _timings.values():
+            counters[0], counters[1] = 0, 0.0
+
+
+@timed("format_description")
+def format_description(description: Any) -> Any:
+    """
+    Format the description to be displayed on the landing page.
+    """
+    if isinstance(description, list):
+        return [
+            item if isinstance(item, str) else "".join(item) for item in description
+        ]
+    elif isinstance(description, str):
+        return [description]
+    else:
+        try:
+            return [str(description)]
+        except (TypeError, ValueError, AttributeError) as e:
+            logger.error("Error in format_description: %s", str(e))
+            return ["Error: Unable to format description"]
+
+
+@timed("clean_description")
+def clean_description(description: Any) -> str:
+    """
+    Clean the description to be displayed on the landing page.
+    """
+    if isinstance(description, list):
+        return " ".join(description)
+    return str(description)
+
+
+@timed("regex_replace")
+def regex_replace(value: str, pattern: str, repl: str) -> str:
+    """
+    Replace the pattern in the value with the replacement.
+    """
+    return compile_pattern(pattern).sub(repl, value)
+
+
+FILTERS: Dict[str, Callable] = {
+    "format_description": format_description,
+    "clean_description": clean_description,
+    "regex_replace": regex_replace,
+}
+
+
+def template_patterns(env: Environment, names: Iterable[str]) -> Set[str]:
+    """
+    Find the literal patterns passed to ``regex_replace`` in the templates.
+    """
+    patterns: Set[str] = set()
+    for name in names:
+        source, _filename, _uptodate = env.loader.get_source(env, name)
+        for node in env.parse(source).find_all(nodes.Filter):
+            if (
+                node.name == "regex_replace"
+                and node.args
+                and isinstance(node.args[0], nodes.Const)
+                and isinstance(node.args[0].value, str)
+            ):
+                patterns.add(node.args[0].value)
+    return patterns
+
+
+def precompile_patterns(env: Environment, names: Iterable[str]) -> int:
+    """
+    Compile the ``regex_replace`` patterns of the templates ahead of use.
+
+    Returns the number of patterns compiled.
+    """
+    patterns = template_patterns(env, names)
+    for pattern in patterns:
+        try:
+            compile_pattern(pattern)
+        except re.error as e:
+            logger.error("Invalid regex_replace pattern %r: %s", pattern, e)
+    return len(patterns)
+
+
+def init_filters(app: Flask) -> None:
+    """
+    Register the portfolio template filters.
+    """
+    app.jinja_env.filters.update(FILTERS)
@@ -0,0 +1,188 @@
+import logging
+from typing import Dict, List, Sequence, Type
+
+from peewee import (
+    Database,
+    DateTimeField,
+    Model,
+    ModelIndex,
+    SqliteDatabase,
+    chunked,
+)
+from playhouse.migrate import SchemaMigrator, migrate
+
+from portfolio.mysql_db import TimestampField
+
+logger = logging.getLogger(__name__)
+
+
+def missing_indexes(database: Database, model: Type[Model]) -> List[ModelIndex]:
+    """
+    Return the indexes declared on the model that do not exist in the database yet.
+    """
+    table_name = model._meta.table_name
+    existing = database.get_indexes(table_name)
+    existing_names = {index.name for index in existing}
+    existing_columns = {tuple(index.columns) for index in existing}
+
+    missing: List[ModelIndex] = []
+    for index in model._meta.fields_to_index():
+        if not isinstance(index, ModelIndex):
+            continue
+        columns = tuple(
+            field.column_name
+            for field in index._expressions
+            if hasattr(field, "column_name")
+        )
+        if index._name in existing_names or columns in existing_columns:
+            continue
+        missing.append(index)
+    return missing
+
+
+def create_missing_indexes(database: Database, model: Type[Model]) -> List[str]:
+    """
+    Create the secondary indexes declared on the model.
+
+    ``create_tables`` skips tables that already exist on MySQL, so indexes added
+    to a model after its table was first created are only built here. Where the
+    database supports ``CREATE INDEX IF NOT EXISTS`` the schema manager builds
+    them; MySQL does not, so there only the missing ones are created.
+    """
+    table_name = model._meta.table_name
+    existing = {index.name for index in database.get_indexes(table_name)}
+    if database.safe_create_index:
+        model._schema.create_indexes(safe=True)
+    else:
+        for index in missing_indexes(database, model):
+            database.execute(index.safe(False))
+    created = sorted(
+        index.name
+        for index in database.get_indexes(table_name)
+        if index.name not in existing
+    )
+    for name in created:
+        logger.info("Created index %s on %s", name, table_name)
+    return created
+
+
+def add_missing_columns(database: Database, model: Type[Model]) -> List[str]:
+    """
+    Add the nullable columns declared on the model that the table lacks.
+
+    SQLite cannot add a column defaulting to ``CURRENT_TIMESTAMP``, so there a
+    ``TimestampField`` is added without a default and its existing rows are
+    stamped; ``create_updated_at_trigger`` stamps the rows inserted later.
+    """
+    table_name = model._meta.table_name
+    existing = {column.name for column in database.get_columns(table_name)}
+    missing = [
+        field
+        for field in model._meta.sorted_fields
+        if field.column_name not in existing and field.null
+    ]
+    if missing:
+        migrator = SchemaMigrator.from_database(database)
+        stamped = [
+            field
+            for field in missing
+            if isinstance(database, SqliteDatabase)
+            and isinstance(field, TimestampField)
+        ]
+        migrate(
+            *(
+                migrator.add_column(
+                    table_name,
+                    field.column_name,
+                    DateTimeField(null=True) if field in stamped else field,
+                )
+                for field in missing
+            )
+        )
+        for field in stamped:
+            database.execute_sql(
+                f'UPDATE "{table_name}" SET "{field.column_name}" = CURRENT_TIMESTAMP'
+            )
+        for field in missing:
+            logger.info("Added column %s to %s", field.column_name, table_name)
+    return [field.column_name for field in missing]
+
+
+def create_updated_at_trigger(database: SqliteDatabase, model: Type[Model]) -> None:
+    """
+    Emulate MySQL's ``ON UPDATE CURRENT_TIMESTAMP`` for ``updated_at`` on SQLite.
+
+    A second trigger stamps inserted rows that have no ``updated_at``, for
+    columns added without their default by ``add_missing_columns``.
+    """
+    fields = model._meta.fields
+    if "updated_at" not in fields:
+        return
+    table_name = model._meta.table_name
+    primary_key = model._meta.primary_key.column_name
+    updated_at = fields["updated_at"].column_name
+    database.execute_sql(
+        f'CREATE TRIGGER IF NOT EXISTS "{table_name}_{updated_at}" '
+        f'AFTER UPDATE ON "{table_name}" FOR EACH ROW '
+        f'WHEN NEW."{updated_at}" IS OLD."{updated_at}" '
+        f'BEGIN UPDATE "{table_name}" SET "{updated_at}" = CURRENT_TIMESTAMP '
+        f'WHERE "{primary_key}" = NEW."{primary_key}"; END'
+    )
+    database.execute_sql(
+        f'CREATE TRIGGER IF NOT EXISTS "{table_name}_{updated_at}_insert" '
+        f'AFTER INSERT ON "{table_name}" FOR EACH ROW '
+        f'WHEN NEW."{updated_at}" IS NULL '
+        f'BEGIN UPDATE "{table_name}" SET "{updated_at}" = CURRENT_TIMESTAMP '
+        f'WHERE "{primary_key}" = NEW."{primary_key}"; END'
+    )
+
+
+def migrate_models(
+    database: Database, models: Sequence[Type[Model]]
+) -> Dict[str, List[str]]:
+    """
+    Bring existing tables up to date with the model definitions.
+
+    Returns the columns added per table, so one-off data migrations run only
+    when their column is first created.
+    """
+    added: Dict[str, List[str]] = {}
+    with database.atomic():
+        for model in models:
+            added[model._meta.table_name] = add_missing_columns(database, model)
+            create_missing_indexes(database, model)
+            if isinstance(database, SqliteDatabase):
+                create_updated_at_trigger(database, model)
+    return added
+
+
+def copy_tables(
+    source: Database,
+    target: Database,
+    models: Sequence[Type[Model]],
+    batch_size: int = 100,
+) -> Dict[str, int]:
+    """
+    Copy every row of the given models from ``source`` into ``target``.
+
+    The target tables are created and migrated first, then replaced
+    table by table inside one transaction each, so a failed copy leaves the
+    previous contents in place. Returns the number of rows copied per table.
+    """
+    with target.bind_ctx(models):
+        target.create_tables(models)
+        migrate_models(target, models)
+
+    counts: Dict[str, int] = {}
+    for model in models:
+        table_name = model._meta.table_name
+        rows = model.select().dicts().iterator(source)
+        copied = 0
+        with target.atomic():
+            model.delete().execute(target)
+            for batch in chunked(rows, batch_size):
+                model.insert_many(batch).execute(target)
+                copied += len(batch)
+        logger.info("Copied %s rows into %s", copied, table_name)
+        counts[table_name] = copied
+    return counts
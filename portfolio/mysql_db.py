@@ -1,48 +1,92 @@
-from peewee import (
-    Model,
-    CharField,
-    TextField,
-    DateTimeField,
-    SQL,
-    AutoField,
-    IntegerField,
-)
-from portfolio.db import mydb
-
-
-class BaseModel(Model):
-    created_at = DateTimeField(constraints=[SQL("DEFAULT CURRENT_TIMESTAMP")])
-    updated_at = DateTimeField(
-        constraints=[SQL("DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP")]
-    )
-
-    class Meta:
-        database = mydb
-
-
-class Hobbies(BaseModel):
-    id = AutoField(primary_key=True)
-    hobbies_id = IntegerField(unique=True)  # Change this line
-    name = CharField()
-    description = TextField()
-    image = CharField()
-
-
-class Projects(BaseModel):
-    id = AutoField(primary_key=True)
-    projects_id = IntegerField(unique=True)  # Change this line
-    name = CharField()
-    description = TextField()
-    url = CharField()
-    language = CharField()
-
-
-class Timeline(Model):
-    id = AutoField(primary_key=True)
-    timeline_id = IntegerField(unique=True)
-    title = CharField()
-    description = TextField()
-    date = DateTimeField()
-
-    class Meta:
-        database = mydb
+from peewee import (
+    Model,
+    CharField,
+    TextField,
+    DateTimeField,
+    SQL,
+    AutoField,
+    IntegerField,
+    MySQLDatabase,
+)
+from portfolio.db import mydb
+
+
+class TimestampField(DateTimeField):
+    """
+    DATETIME column defaulting to the current time.
+
+    With ``auto_update`` the column is refreshed on every UPDATE: natively on
+    MySQL, and through a trigger created by ``portfolio.migrations`` on SQLite.
+    """
+
+    def __init__(self, auto_update: bool = False, **kwargs) -> None:
+        self.auto_update = auto_update
+        super().__init__(**kwargs)
+
+    def ddl(self, ctx):
+        node = super().ddl(ctx)
+        default = "DEFAULT CURRENT_TIMESTAMP"
+        if self.auto_update and isinstance(self.model._meta.database, MySQLDatabase):
+            default += " ON UPDATE CURRENT_TIMESTAMP"
+        node.nodes.append(SQL(default))
+        return node
+
+
+class BaseModel(Model):
+    created_at = TimestampField()
+    # Indexed for the delta-sync queries of the ``/changes`` endpoints.
+    updated_at = TimestampField(auto_update=True, index=True)
+
+    class Meta:
+        database = mydb
+
+
+class Hobbies(BaseModel):
+    id = AutoField(primary_key=True)
+    hobbies_id = IntegerField(unique=True)  # Change this line
+    name = CharField()
+    description = TextField()
+    image = CharField()
+
+
+class Projects(BaseModel):
+    id = AutoField(primary_key=True)
+    projects_id = IntegerField(unique=True)  # Change this line
+    name = CharField()
+    description = TextField()
+    url = CharField()
+    language = CharField(index=True)
+
+
+class Timeline(Model):
+    id = AutoField(primary_key=True)
+    timeline_id = IntegerField(unique=True)
+    title = CharField()
+    description = TextField()
+    date = DateTimeField(index=True)
+    # Derived from description and date by portfolio.timeline when written.
+    event_type = CharField(null=True)
+    location = CharField(null=True)
+    display_date = CharField(null=True)
+    # Like BaseModel's, but nullable so portfolio.migrations can add it to
+    # existing tables.
+    updated_at = TimestampField(auto_update=True, index=True, null=True)
+
+    class Meta:
+        database = mydb
+
+
+class Tombstone(Model):
+    """
+    A row deleted from a model table, kept so that clients syncing through
+    the ``/changes`` endpoints learn about the deletion.
+    """
+
+    id = AutoField(primary_key=True)
+    table_name = CharField()
+    row_id = IntegerField()
+    deleted_at = TimestampField()
+
+    class Meta:
+        database = mydb
+        indexes = ((("table_name", "deleted_at"), False),)
@@ -0,0 +1,168 @@
+import dataclasses
+import decimal
+import json
+import uuid
+from datetime import date
+from typing import Any, Iterable, Iterator, List, Tuple
+
+from flask import Response, current_app, stream_template, stream_with_context
+from werkzeug.http import http_date
+
+from portfolio.constants import StatusCodeLiteral
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore
+
+JSON_MIMETYPE = "application/json"
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+# Flush streamed arrays to the WSGI server in chunks of roughly this size.
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Streamed pages are sent to the client as soon as one of these has rendered.
+HTML_FLUSH_MARKERS = ("</head>", "</section>")
+
+JSONResponse = Tuple[Response, StatusCodeLiteral]
+
+
+def _default(value: Any) -> Any:
+    """
+    Encode the types Flask's JSON provider supports, with the same output.
+
+    Dates keep Flask's HTTP-date format and keys are sorted, as ``jsonify``
+    wrote them. Unlike ``jsonify``, non-ASCII text is sent as UTF-8 rather
+    than ``\\u`` escapes.
+    """
+    if isinstance(value, date):
+        return http_date(value)
+    if isinstance(value, (decimal.Decimal, uuid.UUID)):
+        return str(value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if hasattr(value, "__html__"):
+        return str(value.__html__())
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    # Keys are sorted as Flask's JSON_SORT_KEYS did for jsonify.
+    _ORJSON_OPTIONS = (
+        orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS
+    )
+
+    def dumps(payload: Any) -> bytes:
+        """
+        Serialize ``payload`` to compact JSON bytes.
+        """
+        return orjson.dumps(payload, default=_default, option=_ORJSON_OPTIONS)
+
+else:
+
+    def dumps(payload: Any) -> bytes:
+        """
+        Serialize ``payload`` to compact JSON bytes.
+        """
+        return json.dumps(
+            payload,
+            default=_default,
+            ensure_ascii=False,
+            separators=(",", ":"),
+            sort_keys=True,
+        ).encode("utf-8")
+
+
+def json_response(payload: Any) -> Response:
+    """
+    Build a JSON response straight from the encoded bytes.
+    """
+    return current_app.response_class(dumps(payload), mimetype=JSON_MIMETYPE)
+
+
+def iter_json_array(
+    rows: Iterable[Any], chunk_size: int = STREAM_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    Encode ``rows`` as a JSON array, yielding it in chunks as rows are consumed.
+    """
+    buffer = bytearray(b"[")
+    separator = b""
+    for row in rows:
+        buffer += separator
+        buffer += dumps(row)
+        separator = b","
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    buffer += b"]"
+    yield bytes(buffer)
+
+
+def stream_json_array(rows: Iterable[Any]) -> Response:
+    """
+    Stream ``rows`` as a JSON array without materializing the full result set.
+    """
+    return current_app.response_class(
+        stream_with_context(iter_json_array(rows)), mimetype=JSON_MIMETYPE
+    )
+
+
+def iter_ndjson(
+    records: Iterable[Any], chunk_size: int = STREAM_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    Encode ``records`` as newline-delimited JSON, yielding it in chunks.
+    """
+    buffer = bytearray()
+    for record in records:
+        buffer += dumps(record)
+        buffer += b"\n"
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+def stream_ndjson(records: Iterable[Any]) -> Response:
+    """
+    Stream ``records`` as newline-delimited JSON, one record per line.
+    """
+    return current_app.response_class(
+        stream_with_context(iter_ndjson(records)), mimetype=NDJSON_MIMETYPE
+    )
+
+
+def iter_flushed(
+    chunks: Iterable[str],
+    markers: Tuple[str, ...] = HTML_FLUSH_MARKERS,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> Iterator[str]:
+    """
+    Group Jinja's many small output chunks into larger writes.
+
+    A write is made after each chunk containing one of ``markers`` so the
+    browser can start on the ``<head>`` and each finished section while the
+    rest of the page still renders.
+    """
+    buffer: List[str] = []
+    size = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= chunk_size or any(marker in chunk for marker in markers):
+            yield "".join(buffer)
+            buffer.clear()
+            size = 0
+    if buffer:
+        yield "".join(buffer)
+
+
+def stream_html(template_name: str, **context: Any) -> Response:
+    """
+    Render a template as a streamed HTML response.
+    """
+    return current_app.response_class(
+        iter_flushed(stream_template(template_name, **context)), mimetype="text/html"
+    )
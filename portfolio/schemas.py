@@ -1,351 +1,392 @@
-from typing import Dict, Any, List, Optional
-from abc import ABC, abstractmethod
-from enum import Enum
-import time
-from datetime import datetime
-
-
-class SchemaType(Enum):
-    PROJECTS = "projects"
-    HOBBIES = "hobbies"
-    TIMELINE = "timeline"
-    EDUCATION = "education"
-    PLACES = "places"
-    WORK = "work"
-    ABOUT = "about"
-
-
-class Schema(ABC):
-    @abstractmethod
-    def json(self) -> Dict[str, str]:
-        pass
-
-
-class ProjectsSchema(Schema):
-    def __init__(self, name: str, description: str, url: str, language: str):
-        self.name = self.__name(name)
-        self.description = self.__description(description)
-        self.url = self.__url(url)
-        self.language = self.__language(language)
-
-    def json(self) -> Dict[str, str]:
-        return {
-            "name": self.name,
-            "description": self.description,
-            "url": self.url,
-            "language": self.language,
-        }
-
-    def __name(self, name: str) -> str:
-        if name is None:
-            raise ValueError("Name cannot be None")
-        if type(name) != str:
-            raise ValueError("Name must be a string")
-        return name
-
-    def __description(self, description: str) -> str:
-        if description is None:
-            raise ValueError("Description cannot be None")
-        if type(description) != str:
-            raise ValueError("Description must be a string")
-        return description
-
-    def __url(self, url: str) -> str:
-        if url is None:
-            raise ValueError("Url cannot be None")
-        if type(url) != str:
-            raise ValueError("Url must be a string")
-        return url
-
-    def __language(self, language: str) -> str:
-        if language is None:
-            raise ValueError("Language cannot be None")
-        if type(language) != str:
-            raise ValueError("Language must be a string")
-        return language
-
-
-class HobbiesSchema(Schema):
-    def __init__(self, name: str, description: str, image: str):
-        self.name = self.__name(name)
-        self.description = self.__description(description)
-        self.image = self.__image(image)
-
-    def json(self) -> Dict[str, str]:
-        return {
-            "name": self.name,
-            "description": self.description,
-            "image": self.image,
-        }
-
-    def __name(self, name: str) -> str:
-        if name is None:
-            raise ValueError("Name cannot be None")
-        if type(name) != str:
-            raise ValueError("Name must be a string")
-        return name
-
-    def __description(self, description: str) -> str:
-        if description is None:
-            raise ValueError("Description cannot be None")
-        if type(description) != str:
-            raise ValueError("Description must be a string")
-        return description
-
-    def __image(self, image: str) -> str:
-        if image is None:
-            raise ValueError("Image cannot be None")
-        if type(image) != str:
-            raise ValueError("Image must be a string")
-        return image
-
-
-class TimelineSchema(Schema):
-    def __init__(self, title: str, description: str, date: datetime) -> None:
-        self.title = self.__title(title)
-        self.description = self.__description(description)
-        self.date = self.__date(date)
-
-    def json(self) -> Dict[str, str]:
-        return {
-            "title": self.title,
-            "description": self.description,
-            "date": self.date.strftime("%Y-%m-%d"),
-        }
-
-    def __title(self, title: str) -> str:
-        if title is None:
-            raise ValueError("Title cannot be None")
-        if type(title) != str:
-            raise ValueError("Title must be a string")
-        return title
-
-    def __description(self, description: str) -> str:
-        if description is None:
-            raise ValueError("Description cannot be None")
-        if type(description) != str:
-            raise ValueError("Description must be a string")
-        return description
-
-    def __date(self, date: datetime) -> datetime:
-        if date is None:
-            raise ValueError("Date cannot be None")
-        if type(date) != datetime:
-            raise ValueError("Date must be a datetime")
-        return date
-
-
-class EducationSchema(Schema):
-    def __init__(
-        self,
-        institution: str,
-        degree: str,
-        startDate: str,
-        endDate: str,
-        logo: str,
-        description: str,
-        skills: str,
-        id: Optional[int] = None,  # type: ignore
-    ) -> None:
-        self.id = id
-        self.institution = institution
-        self.degree = degree
-        self.startDate = startDate
-        self.endDate = endDate
-        self.logo = logo
-        self.description = description
-        self.skills = skills
-
-    def json(self) -> Dict[str, Any]:
-        result = {
-            "id": self.id,
-            "institution": self.institution,
-            "degree": self.degree,
-            "startDate": self.startDate,
-            "endDate": self.endDate,
-            "logo": self.logo,
-            "description": self.description,
-            "skills": self.skills,
-        }
-        if self.id is not None:
-            result["id"] = self.id
-        return result
-
-
-class PlacesSchema(Schema):
-    def __init__(
-        self,
-        name: str,
-        description: str,
-        lat: float,
-        lng: float,
-        id: Optional[int] = None,
-    ) -> None:
-        self.id = id
-        self.name = name
-        self.description = description
-        self.lat = lat
-        self.lng = lng
-
-    def json(self) -> Dict[str, Any]:
-        result = {
-            "id": self.id,
-            "name": self.name,
-            "description": self.description,
-            "lat": self.lat,
-            "lng": self.lng,
-        }
-        if self.id is not None:
-            result["id"] = self.id
-        return result
-
-
-class WorkSchema(Schema):
-    def __init__(
-        self,
-        logo: str,
-        company: str,
-        title: str,
-        type: str,
-        location: str,
-        startDate: str,
-        endDate: str,
-        description: str,
-        id: Optional[int] = None,
-    ) -> None:
-        self.id = id
-        self.logo = logo
-        self.company = company
-        self.title = title
-        self.type = type
-        self.location = location
-        self.startDate = startDate
-        self.endDate = endDate
-        self.description = description
-
-    def json(self) -> Dict[str, Any]:
-        result = {
-            "id": self.id,
-            "logo": self.logo,
-            "company": self.company,
-            "title": self.title,
-            "type": self.type,
-            "location": self.location,
-            "startDate": self.startDate,
-            "endDate": self.endDate,
-            "description": self.description,
-        }
-        if self.id is not None:
-            result["id"] = self.id
-        return result
-
-
-class AboutSchema(Schema):
-    def __init__(self, description: str, image: str, id: Optional[int] = None) -> None:
-        self.id = id
-        self.description = description
-        self.image = image
-
-    def json(self) -> Dict[str, Any]:
-        result = {
-            "id": self.id,
-            "description": self.description,
-            "image": self.image,
-        }
-        if self.id is not None:
-            result["id"] = self.id
-        return result
-
-
-class LandingSchema:
-    """
-    This class is used to create the landing page schema.
-    """
-
-    def __init__(
-        self,
-        education: List[Dict[str, Any]],
-        places: List[Dict[str, Any]],
-        work: List[Dict[str, Any]],
-        about: Dict[str, Any],
-        metadata: Optional[Dict[str, Any]] = None,
-    ) -> None:
-        self.education = [
-            EducationSchema(
-                institution=edu.get("institution", ""),
-                degree=edu.get("degree", ""),
-                startDate=edu.get("startDate", ""),
-                endDate=edu.get("endDate", ""),
-                logo=edu.get("logo", ""),
-                description=edu.get("description", ""),
-                skills=edu.get("skills", ""),
-                id=edu.get("id"),
-            )
-            for edu in education
-        ]
-        self.places = [
-            PlacesSchema(
-                name=place.get("name", ""),
-                description=place.get("description", ""),
-                lat=place.get("lat", 0.0),
-                lng=place.get("lng", 0.0),
-                id=place.get("id"),
-            )
-            for place in places
-        ]
-        self.work = [
-            WorkSchema(
-                logo=wrk.get("logo", ""),
-                company=wrk.get("company", ""),
-                title=wrk.get("title", ""),
-                type=wrk.get("type", ""),
-                location=wrk.get("location", ""),
-                startDate=wrk.get("startDate", ""),
-                endDate=wrk.get("endDate", ""),
-                description=wrk.get("description", ""),
-                id=wrk.get("id"),
-            )
-            for wrk in work
-        ]
-        self.about = AboutSchema(
-            description=about.get("description", ""),
-            image=about.get("image", ""),
-            id=about.get("id"),
-        )
-        self._set_metadata(metadata)
-
-    def _set_metadata(self, metadata: Optional[Dict[str, Any]] = None) -> None:
-        default_metadata: Dict[str, Any] = {
-            "page": 0,
-            "version": "1.0.0",
-            "timestamp": round(time.time()),
-            "total": 1,
-            "skip": 0,
-            "limit": 10,
-            "lastUpdated": datetime.now().isoformat(),
-            "author": "Mike Odnis",
-            "language": "en",
-            "apiVersion": "v1",
-            "dataSource": "sqlite",
-            "license": "MIT",
-            "contact": {
-                "name": "Mike Odnis",
-                "email": "mikeodnis3242004@gmail.com",
-                "url": "https://mikeodnis.dev",
-            },
-            "tags": ["portfolio", "flask", "python"],
-        }
-        if metadata:
-            default_metadata.update(metadata)
-        self.metadata = default_metadata
-
-    def json(self) -> Dict[str, Any]:
-        return {
-            "metadata": self.metadata,
-            "data": {
-                "education": [edu.json() for edu in self.education],
-                "places": [place.json() for place in self.places],
-                "work": [wrk.json() for wrk in self.work],
-                "about": self.about.json(),
-            },
-        }
+from typing import Dict, Any, Callable, Iterable, List, Optional, Tuple, Type, TypeVar
+import functools
+from abc import ABC, abstractmethod, update_abstractmethods
+from dataclasses import dataclass, fields
+from enum import Enum
+import time
+from datetime import datetime
+
+RecordType = TypeVar("RecordType", bound=Type["Schema"])
+
+# Value used for a column that is missing from a row, by field type.
+ROW_DEFAULTS: Dict[Any, Any] = {str: "", float: 0.0}
+
+
+class SchemaType(Enum):
+    PROJECTS = "projects"
+    HOBBIES = "hobbies"
+    TIMELINE = "timeline"
+    EDUCATION = "education"
+    PLACES = "places"
+    WORK = "work"
+    ABOUT = "about"
+
+
+class Schema(ABC):
+    __slots__ = ()
+
+    @abstractmethod
+    def json(self) -> Dict[str, str]:
+        pass
+
+
+def _compile(source: str, name: str) -> Callable:
+    namespace: Dict[str, Callable] = {}
+    exec(source, namespace)  # pylint: disable=exec-used
+    return namespace[name]
+
+
+def _compile_dump(names: Tuple[str, ...], defaults: Dict[str, Any]) -> Callable:
+    items = ", ".join(f"{name!r}: get({name!r}, {defaults[name]!r})" for name in names)
+    return _compile(
+        f"def dump(row):\n    get = row.get\n    return {{{items}}}\n", "dump"
+    )
+
+
+def record(cls: RecordType) -> RecordType:
+    """
+    Make ``cls`` a slotted dataclass with generated serializers.
+
+    ``json()`` returns the fields with ``id`` first. ``dump(row)`` builds the
+    same dict straight from a database row, filling in missing columns, so a
+    row never has to become an object just to be serialized.
+    ``dumper(names)`` returns a ``dump`` for only some of the fields.
+    """
+    cls = dataclass(slots=True)(cls)
+    names = tuple(
+        sorted((field.name for field in fields(cls)), key=lambda n: n != "id")
+    )
+    defaults = {field.name: ROW_DEFAULTS.get(field.type) for field in fields(cls)}
+    attributes = ", ".join(f"{name!r}: self.{name}" for name in names)
+
+    @functools.lru_cache(maxsize=None)
+    def dumper(selected: Tuple[str, ...]) -> Callable:
+        return _compile_dump(
+            tuple(name for name in names if name == "id" or name in selected),
+            defaults,
+        )
+
+    cls.FIELDS = names
+    cls.json = _compile(f"def json(self):\n    return {{{attributes}}}\n", "json")
+    cls.dump = staticmethod(_compile_dump(names, defaults))
+    cls.dumper = staticmethod(dumper)
+    return update_abstractmethods(cls)
+
+
+class ProjectsSchema(Schema):
+    __slots__ = ("name", "description", "url", "language")
+
+    def __init__(self, name: str, description: str, url: str, language: str):
+        self.name = self.__name(name)
+        self.description = self.__description(description)
+        self.url = self.__url(url)
+        self.language = self.__language(language)
+
+    def json(self) -> Dict[str, str]:
+        return {
+            "name": self.name,
+            "description": self.description,
+            "url": self.url,
+            "language": self.language,
+        }
+
+    def __name(self, name: str) -> str:
+        if name is None:
+            raise ValueError("Name cannot be None")
+        if type(name) != str:
+            raise ValueError("Name must be a string")
+        return name
+
+    def __description(self, description: str) -> str:
+        if description is None:
+            raise ValueError("Description cannot be None")
+        if type(description) != str:
+            raise ValueError("Description must be a string")
+        return description
+
+    def __url(self, url: str) -> str:
+        if url is None:
+            raise ValueError("Url cannot be None")
+        if type(url) != str:
+            raise ValueError("Url must be a string")
+        return url
+
+    def __language(self, language: str) -> str:
+        if language is None:
+            raise ValueError("Language cannot be None")
+        if type(language) != str:
+            raise ValueError("Language must be a string")
+        return language
+
+
+class HobbiesSchema(Schema):
+    __slots__ = ("name", "description", "image")
+
+    def __init__(self, name: str, description: str, image: str):
+        self.name = self.__name(name)
+        self.description = self.__description(description)
+        self.image = self.__image(image)
+
+    def json(self) -> Dict[str, str]:
+        return {
+            "name": self.name,
+            "description": self.description,
+            "image": self.image,
+        }
+
+    def __name(self, name: str) -> str:
+        if name is None:
+            raise ValueError("Name cannot be None")
+        if type(name) != str:
+            raise ValueError("Name must be a string")
+        return name
+
+    def __description(self, description: str) -> str:
+        if description is None:
+            raise ValueError("Description cannot be None")
+        if type(description) != str:
+            raise ValueError("Description must be a string")
+        return description
+
+    def __image(self, image: str) -> str:
+        if image is None:
+            raise ValueError("Image cannot be None")
+        if type(image) != str:
+            raise ValueError("Image must be a string")
+        return image
+
+
+class TimelineSchema(Schema):
+    __slots__ = ("title", "description", "date")
+
+    def __init__(self, title: str, description: str, date: datetime) -> None:
+        self.title = self.__title(title)
+        self.description = self.__description(description)
+        self.date = self.__date(date)
+
+    def json(self) -> Dict[str, str]:
+        return {
+            "title": self.title,
+            "description": self.description,
+            "date": self.date.strftime("%Y-%m-%d"),
+        }
+
+    def __title(self, title: str) -> str:
+        if title is None:
+            raise ValueError("Title cannot be None")
+        if type(title) != str:
+            raise ValueError("Title must be a string")
+        return title
+
+    def __description(self, description: str) -> str:
+        if description is None:
+            raise ValueError("Description cannot be None")
+        if type(description) != str:
+            raise ValueError("Description must be a string")
+        return description
+
+    def __date(self, date: datetime) -> datetime:
+        if date is None:
+            raise ValueError("Date cannot be None")
+        if type(date) != datetime:
+            raise ValueError("Date must be a datetime")
+        return date
+
+
+@record
+class EducationSchema(Schema):
+    institution: str
+    degree: str
+    startDate: str
+    endDate: str
+    logo: str
+    description: str
+    skills: str
+    id: Optional[int] = None
+
+
+@record
+class PlacesSchema(Schema):
+    name: str
+    description: str
+    lat: float
+    lng: float
+    id: Optional[int] = None
+
+
+@record
+class WorkSchema(Schema):
+    logo: str
+    company: str
+    title: str
+    type: str
+    location: str
+    startDate: str
+    endDate: str
+    description: str
+    id: Optional[int] = None
+
+
+@record
+class AboutSchema(Schema):
+    description: str
+    image: str
+    id: Optional[int] = None
+
+
+# Landing metadata that never changes; only the timestamps are set per call.
+LANDING_METADATA: Dict[str, Any] = {
+    "page": 0,
+    "version": "1.0.0",
+    "timestamp": 0,
+    "total": 1,
+    "skip": 0,
+    "limit": 10,
+    "lastUpdated": "",
+    "author": "Mike Odnis",
+    "language": "en",
+    "apiVersion": "v1",
+    "dataSource": "sqlite",
+    "license": "MIT",
+    "contact": {
+        "name": "Mike Odnis",
+        "email": "mikeodnis3242004@gmail.com",
+        "url": "https://mikeodnis.dev",
+    },
+    "tags": ["portfolio", "flask", "python"],
+}
+
+
+LANDING_SECTIONS: Dict[str, Any] = {
+    "education": EducationSchema,
+    "places": PlacesSchema,
+    "work": WorkSchema,
+    "about": AboutSchema,
+}
+
+
+class LandingSchema:
+    """
+    This class is used to create the landing page schema.
+
+    Rows are kept as they were read and serialized by the section schemas'
+    ``dump``, without building a record object per row. Sections left as
+    ``None`` are omitted, ``fields`` limits a section to some of its columns
+    (``id`` is always kept) and ``include_metadata=False`` drops the metadata.
+    """
+
+    __slots__ = ("education", "places", "work", "about", "metadata", "fields")
+
+    def __init__(
+        self,
+        education: Optional[List[Dict[str, Any]]] = None,
+        places: Optional[List[Dict[str, Any]]] = None,
+        work: Optional[List[Dict[str, Any]]] = None,
+        about: Optional[Dict[str, Any]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        fields: Optional[Dict[str, List[str]]] = None,
+        include_metadata: bool = True,
+    ) -> None:
+        self.education = education
+        self.places = places
+        self.work = work
+        self.about = about
+        self.fields = fields or {}
+        self.metadata: Optional[Dict[str, Any]] = None
+        if include_metadata:
+            self._set_metadata(metadata)
+
+    def _set_metadata(self, metadata: Optional[Dict[str, Any]] = None) -> None:
+        default_metadata = LANDING_METADATA.copy()
+        default_metadata["timestamp"] = round(time.time())
+        default_metadata["lastUpdated"] = datetime.now().isoformat()
+        if metadata:
+            default_metadata.update(metadata)
+        self.metadata = default_metadata
+
+    def _dump(self, section: str) -> Callable:
+        schema = LANDING_SECTIONS[section]
+        selected = self.fields.get(section)
+        return schema.dump if selected is None else schema.dumper(tuple(selected))
+
+    def json(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {}
+        for section in ("education", "places", "work"):
+            rows = getattr(self, section)
+            if rows is not None:
+                data[section] = list(map(self._dump(section), rows))
+        if self.about is not None:
+            data["about"] = self._dump("about")(self.about)
+        if self.metadata is None:
+            return {"data": data}
+        return {"metadata": self.metadata, "data": data}
+
+
+class BatchValidator:
+    """
+    Check many rows against a schema's required string fields in one pass.
+
+    The checks and their messages are built once per schema; they match the
+    ones the schema's constructor raises. Fields in ``dates`` are JSON strings
+    that must also parse as ISO 8601 dates.
+    """
+
+    __slots__ = ("checks", "dates")
+
+    def __init__(self, fields: Iterable[str], dates: Iterable[str] = ()) -> None:
+        self.checks: Tuple[Tuple[str, str, str], ...] = tuple(
+            (
+                field,
+                f"{field.capitalize()} cannot be None",
+                f"{field.capitalize()} must be a string",
+            )
+            for field in fields
+        )
+        self.dates: Tuple[Tuple[str, str], ...] = tuple(
+            (field, f"{field.capitalize()} must be an ISO 8601 date") for field in dates
+        )
+
+    def validate(self, rows: Iterable[Any]) -> Dict[int, List[str]]:
+        """
+        Return the errors of every invalid row, keyed by its index.
+        """
+        errors: Dict[int, List[str]] = {}
+        for index, row in enumerate(rows):
+            if not isinstance(row, dict):
+                errors[index] = ["Row must be an object"]
+                continue
+            row_errors = []
+            for field, missing, wrong_type in self.checks:
+                value = row.get(field)
+                if value is None:
+                    row_errors.append(missing)
+                elif type(value) is not str:
+                    row_errors.append(wrong_type)
+            for field, malformed in self.dates:
+                value = row.get(field)
+                if type(value) is not str:
+                    continue
+                try:
+                    datetime.fromisoformat(value)
+                except ValueError:
+                    row_errors.append(malformed)
+            if row_errors:
+                errors[index] = row_errors
+        return errors
+
+
+VALIDATORS: Dict[SchemaType, BatchValidator] = {
+    SchemaType.PROJECTS: BatchValidator(ProjectsSchema.__slots__),
+    SchemaType.HOBBIES: BatchValidator(HobbiesSchema.__slots__),
+    SchemaType.TIMELINE: BatchValidator(TimelineSchema.__slots__, dates=("date",)),
+}
+
+
+def validate_rows(schema_type: SchemaType, rows: Iterable[Any]) -> Dict[int, List[str]]:
+    """
+    Validate ``rows`` for ``schema_type``, returning their errors by row index.
+    """
+    validator = VALIDATORS.get(schema_type)
+    if validator is None:
+        raise ValueError("Invalid schema type")
+    return validator.validate(rows)
@@ -0,0 +1,26 @@
+from typing import Any, Dict, List
+
+from werkzeug.datastructures import MultiDict
+
+from portfolio.api import APIHobbies, APIProjects, APITimeline
+
+
+def list_hobbies() -> List[Dict[str, Any]]:
+    """
+    Return every hobby, as the hobbies API lists them.
+    """
+    return list(APIHobbies.rows(MultiDict()))
+
+
+def list_projects() -> List[Dict[str, Any]]:
+    """
+    Return every project, as the projects API lists them.
+    """
+    return list(APIProjects.rows(MultiDict()))
+
+
+def list_timeline() -> List[Dict[str, Any]]:
+    """
+    Return every timeline entry in date order, as the timeline API lists them.
+    """
+    return list(APITimeline.rows(MultiDict()))
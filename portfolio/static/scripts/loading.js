@@ -1,6 +1,6 @@
-window.addEventListener("DOMContentLoaded", () => {
-  const loading = document.querySelector(".loading");
-  setTimeout(() => {
-    loading.style.display = "none";
-  }, 1000);
+window.addEventListener("DOMContentLoaded", () => {
+  const loading = document.querySelector(".loading");
+  setTimeout(() => {
+    loading.style.display = "none";
+  }, 1000);
 });
\ No newline at end of file
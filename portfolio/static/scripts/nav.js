@@ -1,31 +1,31 @@
-const body = document.body;
-let lastScroll = 0;
-const navbar = document.getElementById("navbar");
-
-navbar.addEventListener("click", () => {
-  body.classList.remove("scroll-down");
-  window.scrollTo({
-    top: 0,
-    behavior: "smooth",
-  });
-});
-
-window.addEventListener("scroll", () => {
-  const currentScroll = window.scrollY;
-  if (currentScroll <= 0) {
-    body.classList.remove("scroll-up");
-    return;
-  }
-
-  if (currentScroll > lastScroll && !body.classList.contains("scroll-down")) {
-    body.classList.remove("scroll-up");
-    body.classList.add("scroll-down");
-  } else if (
-    currentScroll < lastScroll &&
-    body.classList.contains("scroll-down")
-  ) {
-    body.classList.remove("scroll-down");
-    body.classList.add("scroll-up");
-  }
-  lastScroll = currentScroll;
-});
+const body = document.body;
+let lastScroll = 0;
+const navbar = document.getElementById("navbar");
+
+navbar.addEventListener("click", () => {
+  body.classList.remove("scroll-down");
+  window.scrollTo({
+    top: 0,
+    behavior: "smooth",
+  });
+});
+
+window.addEventListener("scroll", () => {
+  const currentScroll = window.scrollY;
+  if (currentScroll <= 0) {
+    body.classList.remove("scroll-up");
+    return;
+  }
+
+  if (currentScroll > lastScroll && !body.classList.contains("scroll-down")) {
+    body.classList.remove("scroll-up");
+    body.classList.add("scroll-down");
+  } else if (
+    currentScroll < lastScroll &&
+    body.classList.contains("scroll-down")
+  ) {
+    body.classList.remove("scroll-down");
+    body.classList.add("scroll-up");
+  }
+  lastScroll = currentScroll;
+});
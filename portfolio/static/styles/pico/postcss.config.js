@@ -1,8 +1,8 @@
-module.exports = {
-  map: false,
-  plugins: {
-    autoprefixer: {
-      cascade: false
-    }
-  }
+module.exports = {
+  map: false,
+  plugins: {
+    autoprefixer: {
+      cascade: false
+    }
+  }
 }
\ No newline at end of file
@@ -0,0 +1,90 @@
+import logging
+import os
+from typing import Callable, List
+
+from flask import Flask, current_app
+from jinja2 import FileSystemBytecodeCache, nodes
+from jinja2.ext import Extension
+from jinja2.parser import Parser
+from markupsafe import Markup
+
+from portfolio.cache import cache, tagged_key
+from portfolio.filters import precompile_patterns
+
+logger = logging.getLogger(__name__)
+
+root_path = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+TEMPLATE_EXTENSIONS = ("jinja2", "html")
+
+
+class FragmentCacheExtension(Extension):
+    """
+    ``{% cache key, tag, ... %}...{% endcache %}`` caches the enclosed markup.
+
+    The fragment is stored under ``key`` and the current versions of the
+    tags, so writing to one table only re-renders the fragments that name it.
+    """
+
+    tags = {"cache"}
+
+    def parse(self, parser: Parser) -> nodes.Node:
+        lineno = next(parser.stream).lineno
+        args: List[nodes.Expr] = [parser.parse_expression()]
+        while parser.stream.skip_if("comma"):
+            args.append(parser.parse_expression())
+        body = parser.parse_statements(("name:endcache",), drop_needle=True)
+        return nodes.CallBlock(
+            self.call_method("_render_fragment", [nodes.List(args)]), [], [], body
+        ).set_lineno(lineno)
+
+    @staticmethod
+    def _render_fragment(args: List[str], caller: Callable[[], str]) -> Markup:
+        key = tagged_key(f"fragment/{args[0]}", *args[1:])
+        fragment = cache.get(key)
+        if fragment is None:
+            fragment = str(caller())
+            cache.set(
+                key, fragment, timeout=current_app.config["CACHE_DEFAULT_TIMEOUT"]
+            )
+        return Markup(fragment)
+
+
+def precompile_templates(app: Flask) -> int:
+    """
+    Compile every template, filling the bytecode cache and the in-memory cache,
+    and the ``regex_replace`` patterns they use.
+
+    Returns the number of templates compiled.
+    """
+    names = app.jinja_env.list_templates(extensions=TEMPLATE_EXTENSIONS)
+    for name in names:
+        app.jinja_env.get_template(name)
+    precompile_patterns(app.jinja_env, names)
+    return len(names)
+
+
+def init_templating(app: Flask) -> None:
+    """
+    Register the portfolio Jinja extensions and the template bytecode cache.
+
+    Compiled templates are kept in ``JINJA_BYTECODE_CACHE_DIR`` so restarted
+    and new workers load them instead of compiling the sources again. With
+    ``JINJA_EAGER_LOAD`` every template is loaded at boot, before the first
+    request needs it.
+    """
+    app.config.setdefault(
+        "JINJA_BYTECODE_CACHE_DIR",
+        os.getenv("JINJA_BYTECODE_CACHE_DIR")
+        or os.path.join(root_path, "build", "jinja"),
+    )
+    app.config.setdefault(
+        "JINJA_EAGER_LOAD",
+        os.getenv("JINJA_EAGER_LOAD", "false").lower() in ("1", "true", "yes"),
+    )
+    directory = app.config["JINJA_BYTECODE_CACHE_DIR"]
+    os.makedirs(directory, exist_ok=True)
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(directory)
+    app.jinja_env.add_extension(FragmentCacheExtension)
+    if app.config["JINJA_EAGER_LOAD"]:
+        logger.info("Loaded %d templates", precompile_templates(app))
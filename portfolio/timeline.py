@@ -0,0 +1,104 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from peewee import Model
+from werkzeug.http import http_date, parse_date
+
+# Event categories that appear in imported timeline descriptions.
+EVENT_TYPES = (
+    "Info Session",
+    "Workshop / Study Group",
+    "Speaker Session or Tech Talk",
+    "Hackathon",
+    "Watch Party",
+    "Demo Day",
+    "External Ticketing (External RSVP)",
+    "Test Event (use only for event testing)",
+)
+
+# Leading words of an imported description (date and time) that are skipped.
+DESCRIPTION_PREAMBLE_WORDS = 5
+
+
+def extract_event(description: str) -> Tuple[List[str], Optional[str]]:
+    """
+    Find the event types named in a description and the location after them.
+
+    The location is whatever follows the last event type found.
+    """
+    text = " ".join(description.split()[DESCRIPTION_PREAMBLE_WORDS:])
+    event_types: List[str] = []
+    location: Optional[str] = None
+    for event_type in EVENT_TYPES:
+        if event_type in text:
+            event_types.append(event_type)
+            location = text.split(event_type)[1].strip() or None
+    return event_types, location
+
+
+def parse_event_date(value: Any) -> Any:
+    """
+    Parse a posted event date (ISO 8601 or HTTP date) into a naive UTC datetime.
+
+    Stored dates are then canonical on every backend, so the range filters
+    compare them correctly. Raises ``ValueError`` for a malformed string.
+    """
+    if isinstance(value, str):
+        parsed = parse_date(value)
+        if parsed is None:
+            try:
+                parsed = datetime.fromisoformat(value)
+            except ValueError as e:
+                raise ValueError("date must be an ISO 8601 date") from e
+        value = parsed
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def format_display_date(value: Any) -> Optional[str]:
+    """
+    Format an event date as ``Mon, 01 Jan 2024``.
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        parsed = parse_date(value)
+        if parsed is None:
+            try:
+                parsed = datetime.fromisoformat(value)
+            except ValueError:
+                return value
+        value = parsed
+    return " ".join(http_date(value).split()[:4])
+
+
+def enrich(description: str, date: Any) -> Dict[str, Optional[str]]:
+    """
+    Compute the stored ``event_type``, ``location`` and ``display_date`` columns.
+    """
+    event_types, location = extract_event(description or "")
+    return {
+        "event_type": ", ".join(event_types) or None,
+        "location": location,
+        "display_date": format_display_date(date),
+    }
+
+
+def backfill(model: Type[Model]) -> int:
+    """
+    Enrich rows written before the derived columns existed.
+
+    Returns the number of rows updated.
+    """
+    updated = 0
+    rows = model.select(model.id, model.description, model.date).where(
+        model.display_date.is_null()
+    )
+    with model._meta.database.atomic():
+        for row in list(rows):
+            model.update(**enrich(row.description, row.date)).where(
+                model.id == row.id
+            ).execute()
+            updated += 1
+    return updated
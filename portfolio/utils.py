@@ -1,139 +1,274 @@
-import os
-import json
-import sys
-from abc import abstractmethod
-from flask import jsonify
-from pydantic import BaseModel, EmailStr
-from typing import List, Dict, Any, Callable, Tuple, Union
-from portfolio.schemas import SchemaType, ProjectsSchema, HobbiesSchema
-from portfolio.constants import StatusCodeLiteral
-
-
-class DataReader:
-    def __init__(self, filename: str) -> None:
-        self.filename = filename
-
-    @abstractmethod
-    def read_data(self) -> List[Dict[str, str]]:
-        pass
-
-    @abstractmethod
-    def write_data(self, data: List[Dict[str, str]]) -> None:
-        pass
-
-
-class CsvReader(DataReader):
-    def read_data(self) -> List[Dict[str, str]]:
-        with open(self.filename, "r", encoding="utf-8") as file:
-            data = []
-            for line in file:
-                data.append(line.strip().split(","))
-            return data
-
-    @abstractmethod
-    def write_data(self, data: List[Dict[str, str]]) -> None:
-        pass
-
-
-class JsonReader(DataReader):
-    def read_data(self) -> Union[List[Dict[str, str]], Tuple[str, StatusCodeLiteral]]:
-        try:
-            base_path = os.path.dirname(__file__)
-            file_path = os.path.join(base_path, self.filename)
-            with open(file_path, "r", encoding="utf-8") as file:
-                return json.load(file)
-        except FileNotFoundError as e:
-            return jsonify({"error": str(e)}).get_data(as_text=True), 404
-
-    def write_data(
-        self, data: List[Dict[str, str]]
-    ) -> Union[Tuple[str, StatusCodeLiteral], None]:
-        try:
-            base_path = os.path.dirname(__file__)
-            file_path = os.path.join(base_path, self.filename)
-            with open(file_path, "w", encoding="utf-8") as file:
-                json.dump(data, file)
-        except FileNotFoundError as e:
-            return jsonify({"error": str(e)}).get_data(as_text=True), 404
-
-
-class Processor:
-    def __init__(self, data_reader: DataReader) -> None:
-        self.data_reader = data_reader
-
-    def process(self) -> Union[List[Dict[str, str]], Tuple[str, StatusCodeLiteral]]:
-        data = self.data_reader.read_data()
-        if data:
-            return data
-        raise ValueError("Data not found")
-
-
-class Memoize:
-    def __init__(self, func: Callable) -> None:
-        self.func = func
-        self.cache = {}
-
-    def __call__(self, *args, **kwargs) -> Any:
-        if args not in self.cache:
-            self.cache[args] = self.func(*args, **kwargs)
-        return self.cache[args]
-
-    def memory_allocated(self) -> int:
-        return sys.getsizeof(self.cache)
-
-    def memory_allocated_in_mb(self) -> int:
-        return int(self.memory_allocated() / 1024 / 1024)
-
-    def memory_allocated_for_args(self, args: Tuple[Any, ...]) -> int:
-        return sys.getsizeof(args)
-
-    def memory_allocated_for_args_in_mb(self, args: Tuple[Any, ...]) -> int:
-        return int(self.memory_allocated_for_args(args) / 1024 / 1024)
-
-    def memory_allocated_loop(
-        self, func: Callable, args: Tuple[Any, ...], iterations: int
-    ) -> int:
-        return sys.getsizeof(func(*args) for _ in range(iterations))
-
-    def memory_allocated_loop_in_mb(
-        self, func: Callable, args: Tuple[Any, ...], iterations: int
-    ) -> int:
-        return int(self.memory_allocated_loop(func, args, iterations) / 1024 / 1024)
-
-    def clear_cache(self) -> str:
-        cache_size = self.memory_allocated()
-        self.cache = {}
-        return f"Cleared cache. Memory allocated: {cache_size} bytes"
-
-
-class ContactForm(BaseModel):
-    name: str
-    profession: str
-    company: str
-    email: EmailStr
-    subject: str
-    message: str
-
-
-def validate_request_body(body: Dict[str, str], schema_type: SchemaType) -> None:
-    if schema_type == SchemaType.PROJECTS:
-        ProjectsSchema(**body)
-    elif schema_type == SchemaType.HOBBIES:
-        HobbiesSchema(**body)
-    else:
-        raise ValueError("Invalid schema type")
-
-
-def post_function(
-    body: Dict[str, str],
-    json_body: Dict[str, List[Dict[str, str]]],
-    schema_type: SchemaType,
-) -> Tuple[str, StatusCodeLiteral]:
-    try:
-        validate_request_body(body, schema_type)
-        json_body[schema_type.value].append(body)
-        data_reader = JsonReader(f"static/json/{schema_type.value}.json")
-        data_reader.write_data(json_body[schema_type.value])
-        return jsonify({"message": "Success"}).get_data(as_text=True), 200
-    except ValueError as e:
-        return jsonify({"error": str(e)}).get_data(as_text=True), 400
+import os
+import json
+import functools
+import math
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from abc import abstractmethod
+from pydantic import BaseModel, EmailStr
+from typing import List, Dict, Any, Callable, Hashable, Optional, Set, Tuple, Union
+from portfolio.schemas import SchemaType, validate_rows
+from portfolio.responses import JSONResponse, json_response
+
+
+class DataReader:
+    def __init__(self, filename: str) -> None:
+        self.filename = filename
+
+    @abstractmethod
+    def read_data(self) -> List[Dict[str, str]]:
+        pass
+
+    @abstractmethod
+    def write_data(self, data: List[Dict[str, str]]) -> None:
+        pass
+
+
+class CsvReader(DataReader):
+    def read_data(self) -> List[Dict[str, str]]:
+        with open(self.filename, "r", encoding="utf-8") as file:
+            data = []
+            for line in file:
+                data.append(line.strip().split(","))
+            return data
+
+    @abstractmethod
+    def write_data(self, data: List[Dict[str, str]]) -> None:
+        pass
+
+
+class JsonReader(DataReader):
+    def read_data(self) -> Union[List[Dict[str, str]], JSONResponse]:
+        try:
+            base_path = os.path.dirname(__file__)
+            file_path = os.path.join(base_path, self.filename)
+            with open(file_path, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except FileNotFoundError as e:
+            return json_response({"error": str(e)}), 404
+
+    def write_data(
+        self, data: List[Dict[str, str]]
+    ) -> Union[JSONResponse, None]:
+        try:
+            base_path = os.path.dirname(__file__)
+            file_path = os.path.join(base_path, self.filename)
+            with open(file_path, "w", encoding="utf-8") as file:
+                json.dump(data, file)
+        except FileNotFoundError as e:
+            return json_response({"error": str(e)}), 404
+
+
+class Processor:
+    def __init__(self, data_reader: DataReader) -> None:
+        self.data_reader = data_reader
+
+    def process(self) -> Union[List[Dict[str, str]], JSONResponse]:
+        data = self.data_reader.read_data()
+        if data:
+            return data
+        raise ValueError("Data not found")
+
+
+def deep_sizeof(obj: Any, seen: Optional[Set[int]] = None) -> int:
+    """
+    Estimate the memory held by ``obj`` and everything it references.
+
+    Shared objects are counted once.
+    """
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (str, bytes, bytearray, int, float, bool, type(None))):
+        return size
+    if isinstance(obj, dict):
+        size += sum(
+            deep_sizeof(key, seen) + deep_sizeof(value, seen)
+            for key, value in obj.items()
+        )
+    elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    if hasattr(obj, "__dict__"):
+        size += deep_sizeof(vars(obj), seen)
+    for slot in getattr(type(obj), "__slots__", ()):
+        if hasattr(obj, slot):
+            size += deep_sizeof(getattr(obj, slot), seen)
+    return size
+
+
+class Memoize:
+    """
+    Cache a function's results by its positional and keyword arguments.
+
+    Entries are evicted least recently used first once there are more than
+    ``maxsize`` of them or their estimated size exceeds ``max_bytes``, and
+    expire ``ttl`` seconds after being computed. Safe to share between
+    threads; the function itself runs outside the lock.
+    """
+
+    _KWARGS_MARK = object()
+
+    def __init__(
+        self,
+        func: Callable,
+        maxsize: Optional[int] = 1024,
+        ttl: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        self.func = func
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        # key -> (value, expires at, estimated bytes)
+        self.cache: "OrderedDict[Hashable, Tuple[Any, float, int]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._bytes = 0
+        self._lock = threading.RLock()
+        functools.update_wrapper(self, func)
+
+    def _make_key(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Hashable:
+        if not kwargs:
+            return args
+        return args + (self._KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+
+    def _discard(self, key: Hashable) -> None:
+        _value, _expires, size = self.cache.pop(key)
+        self._bytes -= size
+
+    def _evict(self) -> None:
+        while self.cache and (
+            (self.maxsize is not None and len(self.cache) > self.maxsize)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            self._discard(next(iter(self.cache)))
+            self.evictions += 1
+
+    def __call__(self, *args, **kwargs) -> Any:
+        key = self._make_key(args, kwargs)
+        try:
+            hash(key)
+        except TypeError:
+            # Unhashable arguments cannot be cached.
+            with self._lock:
+                self.misses += 1
+            return self.func(*args, **kwargs)
+
+        with self._lock:
+            entry = self.cache.get(key)
+            if entry is not None:
+                if entry[1] > time.monotonic():
+                    self.cache.move_to_end(key)
+                    self.hits += 1
+                    return entry[0]
+                self._discard(key)
+                self.expirations += 1
+            self.misses += 1
+
+        value = self.func(*args, **kwargs)
+        size = deep_sizeof(key) + deep_sizeof(value)
+        expires = time.monotonic() + self.ttl if self.ttl is not None else math.inf
+
+        with self._lock:
+            if key in self.cache:
+                self._discard(key)
+            self.cache[key] = (value, expires, size)
+            self._bytes += size
+            self._evict()
+        return value
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return hit, miss, eviction and expiration counts and the current size.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "entries": len(self.cache),
+                "bytes": self._bytes,
+            }
+
+    def memory_allocated(self) -> int:
+        return self._bytes
+
+    def memory_allocated_in_mb(self) -> int:
+        return int(self.memory_allocated() / 1024 / 1024)
+
+    def memory_allocated_for_args(self, args: Tuple[Any, ...]) -> int:
+        entry = self.cache.get(args)
+        return entry[2] if entry is not None else 0
+
+    def memory_allocated_for_args_in_mb(self, args: Tuple[Any, ...]) -> int:
+        return int(self.memory_allocated_for_args(args) / 1024 / 1024)
+
+    def memory_allocated_loop(
+        self, func: Callable, args: Tuple[Any, ...], iterations: int
+    ) -> int:
+        return sum(deep_sizeof(func(*args)) for _ in range(iterations))
+
+    def memory_allocated_loop_in_mb(
+        self, func: Callable, args: Tuple[Any, ...], iterations: int
+    ) -> int:
+        return int(self.memory_allocated_loop(func, args, iterations) / 1024 / 1024)
+
+    def clear_cache(self) -> str:
+        with self._lock:
+            cache_size = self.memory_allocated()
+            self.cache.clear()
+            self._bytes = 0
+        return f"Cleared cache. Memory allocated: {cache_size} bytes"
+
+
+def memoize(
+    maxsize: Optional[int] = 1024,
+    ttl: Optional[float] = None,
+    max_bytes: Optional[int] = None,
+) -> Callable[[Callable], Memoize]:
+    """
+    Decorator form of ``Memoize`` that takes its limits as arguments.
+    """
+
+    def decorator(func: Callable) -> Memoize:
+        return Memoize(func, maxsize=maxsize, ttl=ttl, max_bytes=max_bytes)
+
+    return decorator
+
+
+class ContactForm(BaseModel):
+    name: str
+    profession: str
+    company: str
+    email: EmailStr
+    subject: str
+    message: str
+
+
+def validate_request_body(body: Dict[str, str], schema_type: SchemaType) -> None:
+    errors = validate_rows(schema_type, [body])
+    if errors:
+        raise ValueError(errors[0][0])
+
+
+def post_function(
+    body: Dict[str, str],
+    json_body: Dict[str, List[Dict[str, str]]],
+    schema_type: SchemaType,
+) -> JSONResponse:
+    try:
+        validate_request_body(body, schema_type)
+        json_body[schema_type.value].append(body)
+        data_reader = JsonReader(f"static/json/{schema_type.value}.json")
+        data_reader.write_data(json_body[schema_type.value])
+        return json_response({"message": "Success"}), 200
+    except ValueError as e:
+        return json_response({"error": str(e)}), 400
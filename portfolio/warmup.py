@@ -0,0 +1,127 @@
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional, Set, Tuple
+
+from flask import (
+    Flask,
+    current_app,
+    has_app_context,
+    has_request_context,
+    request,
+    url_for,
+)
+
+from portfolio.cache import on_invalidate
+
+logger = logging.getLogger(__name__)
+
+# Cached public pages, rendered ahead of the first visitor.
+WARMUP_ENDPOINTS = ("index", "hobbies", "projects", "timeline", "contact")
+
+DEFAULT_WARMUP_WORKERS = 2
+
+_executor: Optional[ThreadPoolExecutor] = None
+_pending: Set[str] = set()
+_pending_lock = threading.Lock()
+
+
+def _pool(app: Flask) -> ThreadPoolExecutor:
+    global _executor  # pylint: disable=global-statement
+    with _pending_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=app.config.get(
+                    "CACHE_WARMUP_WORKERS", DEFAULT_WARMUP_WORKERS
+                ),
+                thread_name_prefix="cache-warmup",
+            )
+    return _executor
+
+
+def cache_tags(app: Flask, endpoint: str) -> Tuple[str, ...]:
+    """
+    Return the tags a cached endpoint depends on, as declared by ``cached_view``.
+    """
+    return getattr(app.view_functions.get(endpoint), "cache_tags", ())
+
+
+def _warm(app: Flask, endpoint: str, base_url: str) -> None:
+    with _pending_lock:
+        _pending.discard(endpoint)
+    try:
+        with app.test_request_context(base_url=base_url):
+            path = url_for(endpoint)
+        # Buffered so that a streamed page is read to the end and cached.
+        response = app.test_client().get(path, base_url=base_url, buffered=True)
+        logger.log(
+            logging.WARNING if response.status_code >= 500 else logging.DEBUG,
+            "Warmed %s: %s %s",
+            path,
+            response.status_code,
+            response.headers.get("X-Cache"),
+        )
+        response.close()
+    except Exception:  # pylint: disable=broad-except
+        logger.exception("Cache warmup of %s failed", endpoint)
+
+
+def warm_endpoints(
+    app: Flask, endpoints: Iterable[str], base_url: Optional[str] = None
+) -> None:
+    """
+    Render ``endpoints`` into the response cache on the warmup thread pool.
+
+    Endpoints that are already queued are skipped, so a burst of writes
+    results in one render per page.
+    """
+    base_url = base_url or app.config["CACHE_WARMUP_BASE_URL"]
+    pool = _pool(app)
+    for endpoint in endpoints:
+        with _pending_lock:
+            if endpoint in _pending:
+                continue
+            _pending.add(endpoint)
+        pool.submit(_warm, app, endpoint, base_url)
+
+
+def _warm_invalidated(tags: Set[str]) -> None:
+    if not has_app_context():
+        return
+    app = current_app._get_current_object()  # pylint: disable=protected-access
+    if not app.config.get("CACHE_WARMUP"):
+        return
+    endpoints = [
+        endpoint
+        for endpoint in WARMUP_ENDPOINTS
+        if tags.intersection(cache_tags(app, endpoint))
+    ]
+    base_url = request.host_url if has_request_context() else None
+    warm_endpoints(app, endpoints, base_url)
+
+
+def init_warmup(app: Flask) -> None:
+    """
+    Warm every cacheable page now and re-warm pages after their tables change.
+
+    Controlled by ``CACHE_WARMUP`` (on unless ``TESTING`` is set),
+    ``CACHE_WARMUP_WORKERS`` and ``CACHE_WARMUP_BASE_URL``, the address pages
+    are rendered for when no request is available to copy it from.
+    """
+    app.config.setdefault(
+        "CACHE_WARMUP",
+        os.getenv("CACHE_WARMUP", str(os.getenv("TESTING") != "True")).lower()
+        in ("1", "true", "yes"),
+    )
+    app.config.setdefault(
+        "CACHE_WARMUP_WORKERS",
+        int(os.getenv("CACHE_WARMUP_WORKERS", str(DEFAULT_WARMUP_WORKERS))),
+    )
+    app.config.setdefault(
+        "CACHE_WARMUP_BASE_URL",
+        os.getenv("CACHE_WARMUP_BASE_URL", "http://localhost:5000/"),
+    )
+    on_invalidate(_warm_invalidated)
+    if app.config["CACHE_WARMUP"]:
+        warm_endpoints(app, WARMUP_ENDPOINTS)
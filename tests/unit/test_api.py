@@ -0,0 +1,163 @@
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+
+from flask import Flask
+from peewee import SqliteDatabase
+from werkzeug.datastructures import MultiDict
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+
+from portfolio.api import APIProjects, APITimeline
+from portfolio.cache import init_cache
+from portfolio.mysql_db import Projects, Timeline, Tombstone
+
+MODELS = [Projects, Timeline, Tombstone]
+
+
+class ModelTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.database = SqliteDatabase(":memory:")
+        self.database.bind(MODELS, bind_refs=False, bind_backrefs=False)
+        self.database.create_tables(MODELS)
+        for timeline_id, day in enumerate((3, 1, 2)):
+            Timeline.create(
+                timeline_id=timeline_id,
+                title=f"t{day}",
+                description="",
+                date=datetime(2024, 1, day, 12),
+            )
+        for projects_id, language in enumerate(("Python", "Go", "Rust", "Python")):
+            Projects.create(
+                projects_id=projects_id,
+                name=f"p{projects_id}",
+                description="",
+                url="",
+                language=language,
+            )
+
+    def tearDown(self) -> None:
+        self.database.close()
+
+
+class TestQueryFilters(ModelTestCase):
+    def titles(self, args: MultiDict) -> list:
+        return [row["title"] for row in APITimeline.build_query(args).dicts()]
+
+    def test_timeline_date_order_and_range(self) -> None:
+        self.assertEqual(self.titles(MultiDict()), ["t1", "t2", "t3"])
+        self.assertEqual(self.titles(MultiDict({"order": "desc"})), ["t3", "t2", "t1"])
+        self.assertEqual(
+            self.titles(
+                MultiDict({"start_date": "2024-01-02", "end_date": "2024-01-02"})
+            ),
+            ["t2"],
+        )
+        with self.assertRaises(ValueError):
+            APITimeline.build_query(MultiDict({"start_date": "yesterday"}))
+
+    def test_timeline_dates_stored_canonically(self) -> None:
+        for timeline_id, date in (
+            (10, "2024-01-04T10:00:00"),
+            (11, "2024-01-04T23:30:00-02:00"),
+            (12, "Thu, 04 Jan 2024 11:00:00 GMT"),
+        ):
+            Timeline.create(
+                **APITimeline.prepare(
+                    {
+                        "timeline_id": timeline_id,
+                        "title": f"u{timeline_id}",
+                        "description": "",
+                        "date": date,
+                    }
+                )
+            )
+        rows = APITimeline.build_query(
+            MultiDict({"start_date": "2024-01-04", "end_date": "2024-01-04"})
+        ).dicts()
+        self.assertEqual(
+            [(row["title"], row["date"]) for row in rows],
+            [("u10", datetime(2024, 1, 4, 10)), ("u12", datetime(2024, 1, 4, 11))],
+        )
+        self.assertEqual(
+            Timeline.get(Timeline.timeline_id == 11).date, datetime(2024, 1, 5, 1, 30)
+        )
+        with self.assertRaises(ValueError):
+            APITimeline.prepare({"date": "soon"})
+
+    def test_projects_language_filter(self) -> None:
+        rows = APIProjects.build_query(
+            MultiDict([("language", "Python"), ("language", "Go")])
+        ).dicts()
+        self.assertEqual(
+            [(row["language"], row["name"]) for row in rows],
+            [("Go", "p1"), ("Python", "p0"), ("Python", "p3")],
+        )
+
+
+class TestTimelineChanges(ModelTestCase):
+    def changes(self, since: str = ""):
+        with Flask(__name__).test_request_context(query_string={"since": since}):
+            response, status = APITimeline.changes()
+        return response.get_json(), status
+
+    def test_upserts_and_deletions_since_cursor(self) -> None:
+        everything, status = self.changes()
+        self.assertEqual(status, 200)
+        self.assertEqual(len(everything["upserted"]), 3)
+        self.assertTrue(all(row["updated_at"] for row in everything["upserted"]))
+
+        Timeline.delete_by_id(1)
+        APITimeline.record_deleted([1])
+        changes, status = self.changes(everything["cursor"])
+        self.assertEqual(status, 200)
+        self.assertEqual(changes["deleted"], [1])
+
+    def test_tombstones_are_pruned_and_old_cursors_refused(self) -> None:
+        expired = datetime(2000, 1, 1)
+        Tombstone.create(table_name="timeline", row_id=9, deleted_at=expired)
+        APITimeline.record_deleted([1])
+        self.assertEqual([tombstone.row_id for tombstone in Tombstone.select()], [1])
+        self.assertEqual(self.changes(expired.isoformat())[1], 410)
+
+
+class TestTimelineCreate(ModelTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.app = Flask(__name__)
+        self.app.config["CACHE_SQLITE_PATH"] = os.path.join(
+            self.directory.name, "cache.sqlite"
+        )
+        init_cache(self.app)
+
+    def tearDown(self) -> None:
+        super().tearDown()
+        self.directory.cleanup()
+
+    def create(self, payload):
+        with self.app.test_request_context(method="POST", json=payload):
+            response, status = APITimeline.create()
+        return response.get_json(), status
+
+    def test_posts_are_validated(self) -> None:
+        event = {"timeline_id": 9, "title": "t", "description": "d"}
+        body, status = self.create(event)
+        self.assertEqual(status, 400)
+        self.assertEqual(body["errors"], {"0": ["Date cannot be None"]})
+
+        body, status = self.create([{**event, "date": "2024-01-09"}, event])
+        self.assertEqual(status, 400)
+        self.assertEqual(Timeline.select().count(), 3)
+
+        body, status = self.create({**event, "date": "2024-01-09T08:00:00"})
+        self.assertEqual(status, 201)
+        self.assertEqual(
+            Timeline.get_by_id(body["id"]).display_date, "Tue, 09 Jan 2024"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import os
+import sys
+import tempfile
+import unittest
+from typing import Any
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+
+from peewee import SqliteDatabase
+from werkzeug.test import TestResponse
+
+import portfolio
+from portfolio import create_app
+from portfolio.db import Database
+from portfolio.mysql_db import Hobbies, Projects, Timeline, Tombstone
+
+MODELS = [Hobbies, Projects, Timeline, Tombstone]
+
+
+class TestLandingPage(unittest.TestCase):
+    """
+    The landing page as served by ``create_app``: response cache, conditional
+    GETs and invalidation on writes.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(cls.directory.cleanup)
+        environ = mock.patch.dict(
+            os.environ,
+            {
+                "TOKEN": "testing",
+                "LANDING_DATABASE_PATH": os.path.join(cls.directory.name, "landing.db"),
+                "CACHE_BACKEND": "sqlite",
+                "CACHE_DIR": os.path.join(cls.directory.name, "cache"),
+                "CACHE_WARMUP": "false",
+                "JINJA_BYTECODE_CACHE_DIR": os.path.join(cls.directory.name, "jinja"),
+                "STATIC_EXPORT": "false",
+            },
+        )
+        environ.start()
+        cls.addClassCleanup(environ.stop)
+
+        database = SqliteDatabase(os.path.join(cls.directory.name, "models.db"))
+        database.bind(MODELS, bind_refs=False, bind_backrefs=False)
+        cls.addClassCleanup(database.close)
+        with mock.patch.object(portfolio, "mydb", database):
+            cls.app = create_app()
+        cls.client = cls.app.test_client()
+
+    def get(self, **kwargs: Any) -> TestResponse:
+        """
+        GET the landing page, reading the streamed body to the end.
+        """
+        with self.client.get("/", **kwargs) as response:
+            response.get_data()
+        return response
+
+    def test_cached_page_is_revalidated_without_database(self) -> None:
+        self.get()
+        response = self.get()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["X-Cache"], "HIT")
+        etag = response.headers["ETag"]
+
+        with mock.patch.object(
+            Database, "get_connection", autospec=True, wraps=Database.get_connection
+        ) as get_connection:
+            response = self.get(headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+        get_connection.assert_not_called()
+
+        response = self.client.post(
+            "/api/v1/landing",
+            headers={"Authorization": "testing"},
+            json={
+                "about": {"id": 1, "description": "Written by the test", "image": ""}
+            },
+        )
+        self.assertEqual(response.status_code, 200, response.get_data(as_text=True))
+
+        response = self.get(headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["X-Cache"], "MISS")
+        self.assertNotEqual(response.headers["ETag"], etag)
+        self.assertIn("Written by the test", response.get_data(as_text=True))
+
+
+if __name__ == "__main__":
+    unittest.main()
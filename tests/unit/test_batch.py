@@ -0,0 +1,120 @@
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from flask import Flask, request
+from peewee import SqliteDatabase
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+
+from portfolio import batch
+from portfolio.batch import BATCH_PATH, MAX_BATCH_SIZE, run_batch
+from portfolio.cache import init_cache
+from portfolio.db import Database
+from portfolio.mysql_db import Projects
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        path = os.path.join(self.directory.name, "landing.db")
+        with sqlite3.connect(path) as conn:
+            conn.execute("CREATE TABLE work (id INTEGER PRIMARY KEY, title TEXT)")
+        self.database = SqliteDatabase(":memory:")
+        self.database.bind([Projects], bind_refs=False, bind_backrefs=False)
+        self.database.create_tables([Projects])
+        patcher = mock.patch.object(batch, "mydb", self.database)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.app = Flask(__name__)
+        self.app.config["CACHE_SQLITE_PATH"] = os.path.join(
+            self.directory.name, "cache.sqlite"
+        )
+        init_cache(self.app)
+        self.db = Database(path)
+
+        @self.app.route(BATCH_PATH, methods=["POST"])
+        def batch_api():
+            return run_batch(self.db)
+
+        @self.app.route("/work", methods=["POST"])
+        def work():
+            self.db.insert_data("work", request.get_json())
+            return {"message": "created"}, 201
+
+        @self.app.route("/projects", methods=["POST"])
+        def projects():
+            Projects.create(**request.get_json())
+            return {"message": "created"}, 201
+
+        @self.app.route("/fail", methods=["POST"])
+        def fail():
+            return {"error": "invalid"}, 400
+
+        self.client = self.app.test_client()
+
+    def tearDown(self) -> None:
+        self.database.close()
+        self.directory.cleanup()
+
+    def post(self, payload):
+        return self.client.post(BATCH_PATH, json=payload)
+
+    def requests(self):
+        return [
+            {"method": "POST", "path": "/work", "body": {"id": 1, "title": "t"}},
+            {
+                "method": "POST",
+                "path": "/projects",
+                "body": {
+                    "projects_id": 1,
+                    "name": "p",
+                    "description": "",
+                    "url": "",
+                    "language": "Go",
+                },
+            },
+            {"method": "POST", "path": "/fail"},
+        ]
+
+    def rows(self):
+        with self.app.app_context():
+            work = self.db.read_data("work", ["id"])
+        return len(work), Projects.select().count()
+
+    def test_atomic_batch_rolls_back_every_write(self) -> None:
+        response = self.post({"atomic": True, "requests": self.requests()})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            [result["status"] for result in response.get_json()], [201, 201, 400]
+        )
+        self.assertEqual(self.rows(), (0, 0))
+
+    def test_plain_batch_keeps_writes(self) -> None:
+        response = self.post(self.requests())
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [result["status"] for result in response.get_json()], [201, 201, 400]
+        )
+        self.assertEqual(self.rows(), (1, 1))
+
+    def test_malformed_batches(self) -> None:
+        item = {"method": "POST", "path": "/fail"}
+        for payload in (
+            [{"method": "POST", "path": BATCH_PATH, "body": []}],
+            [{"method": "POST", "path": f"{BATCH_PATH}/?x=1"}],
+            [item] * (MAX_BATCH_SIZE + 1),
+            [{"method": "PATCH", "path": "/fail"}],
+            {"requests": "nope"},
+        ):
+            response = self.post(payload)
+            self.assertEqual(response.status_code, 400, payload)
+            self.assertIn("error", response.get_json())
+
+
+if __name__ == "__main__":
+    unittest.main()
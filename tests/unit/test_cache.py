@@ -0,0 +1,200 @@
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+
+from flask import Flask, Response, render_template_string
+
+from portfolio.cache import (
+    SQLiteCache,
+    _refresh_executor,
+    cached_view,
+    init_cache,
+    invalidate_tags,
+)
+from portfolio.templating import init_templating
+
+
+class TestSQLiteCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "cache.sqlite")
+        self.cache = SQLiteCache(self.path, default_timeout=60)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_set_get_delete(self) -> None:
+        self.assertTrue(self.cache.set("key", {"html": "<p>hi</p>"}))
+        self.assertEqual(self.cache.get("key"), {"html": "<p>hi</p>"})
+        self.assertTrue(self.cache.has("key"))
+        self.assertTrue(self.cache.delete("key"))
+        self.assertIsNone(self.cache.get("key"))
+        self.assertFalse(self.cache.delete("key"))
+
+    def test_expired_entries_are_misses(self) -> None:
+        self.cache.set("key", "value", timeout=-1)
+        self.assertIsNone(self.cache.get("key"))
+        self.assertFalse(self.cache.has("key"))
+
+    def test_add_only_when_absent_or_expired(self) -> None:
+        self.assertTrue(self.cache.add("lock", "first"))
+        self.assertFalse(self.cache.add("lock", "second"))
+        self.assertEqual(self.cache.get("lock"), "first")
+        self.cache.set("stale", "old", timeout=-1)
+        self.assertTrue(self.cache.add("stale", "new"))
+        self.assertEqual(self.cache.get("stale"), "new")
+
+    def test_inc_and_dec(self) -> None:
+        self.assertEqual(self.cache.inc("counter"), 1)
+        self.assertEqual(self.cache.inc("counter", 5), 6)
+        self.assertEqual(self.cache.dec("counter", 2), 4)
+
+    def test_add_is_a_lock_across_connections(self) -> None:
+        caches = [SQLiteCache(self.path) for _ in range(8)]
+        barrier = threading.Barrier(len(caches))
+        added = []
+
+        def take(cache: SQLiteCache) -> None:
+            barrier.wait()
+            added.append(cache.add("lock", id(cache), timeout=60))
+
+        threads = [threading.Thread(target=take, args=(c,)) for c in caches]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sorted(added), [False] * 7 + [True])
+        self.assertTrue(self.cache.add("forever", 1, timeout=0))
+        self.assertFalse(self.cache.add("forever", 2, timeout=0))
+        self.assertTrue(self.cache.delete("lock"))
+        self.assertTrue(caches[0].add("lock", "released"))
+
+    def test_shared_between_instances(self) -> None:
+        other = SQLiteCache(self.path)
+        self.cache.set("key", "value")
+        self.assertEqual(other.get("key"), "value")
+        other.clear()
+        self.assertIsNone(self.cache.get("key"))
+
+
+class TestCachedView(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.app = Flask(__name__)
+        self.app.config["CACHE_SQLITE_PATH"] = os.path.join(
+            self.directory.name, "cache.sqlite"
+        )
+        init_cache(self.app)
+        self.renders = 0
+
+        @self.app.route("/page")
+        @cached_view("things")
+        def page() -> str:
+            self.renders += 1
+            time.sleep(0.2)
+            return f"render {self.renders}"
+
+        @self.app.route("/stream")
+        @cached_view("things")
+        def stream() -> Response:
+            self.renders += 1
+            return Response(iter(["streamed ", str(self.renders)]))
+
+        self.client = self.app.test_client()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_hit_after_miss(self) -> None:
+        first = self.client.get("/page")
+        second = self.client.get("/page")
+        self.assertEqual(first.headers["X-Cache"], "MISS")
+        self.assertEqual(second.headers["X-Cache"], "HIT")
+        self.assertEqual(second.data, b"render 1")
+
+    def test_unread_query_arguments_share_the_entry(self) -> None:
+        self.client.get("/page?x=1")
+        second = self.client.get("/page?x=2")
+        self.assertEqual(second.headers["X-Cache"], "HIT")
+        self.assertEqual(second.data, b"render 1")
+
+    def test_invalidation_renders_again(self) -> None:
+        self.client.get("/page")
+        with self.app.app_context():
+            invalidate_tags("things")
+        self.assertEqual(self.client.get("/page").data, b"render 2")
+        _refresh_executor.submit(lambda: None).result()
+
+    def test_streamed_response_cached_once_sent(self) -> None:
+        first = self.client.get("/stream")
+        self.assertEqual(first.data, b"streamed 1")
+        second = self.client.get("/stream")
+        self.assertEqual(first.headers["X-Cache"], "MISS")
+        self.assertEqual(second.headers["X-Cache"], "HIT")
+        self.assertEqual(second.data, b"streamed 1")
+
+    def test_stale_entry_served_while_refreshed_once(self) -> None:
+        self.app.config["CACHE_SOFT_TIMEOUT"] = 0
+        self.assertEqual(self.client.get("/page").headers["X-Cache"], "MISS")
+        stale = [self.client.get("/page") for _ in range(3)]
+        self.assertEqual([r.headers["X-Cache"] for r in stale], ["STALE"] * 3)
+        self.assertEqual([r.data for r in stale], [b"render 1"] * 3)
+
+        # The refresh runs on a single worker thread, so this waits for it.
+        _refresh_executor.submit(lambda: None).result()
+        self.assertEqual(self.renders, 2)
+        self.assertEqual(self.client.get("/page").data, b"render 2")
+        _refresh_executor.submit(lambda: None).result()
+
+    def test_concurrent_misses_render_once(self) -> None:
+        bodies = []
+
+        def fetch() -> None:
+            bodies.append(self.app.test_client().get("/page").data)
+
+        threads = [threading.Thread(target=fetch) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.renders, 1)
+        self.assertEqual(bodies, [b"render 1"] * 8)
+
+
+class TestFragmentCache(unittest.TestCase):
+    TEMPLATE = (
+        '{% cache "a", "first" %}{{ first }}{% endcache %}|'
+        '{% cache "b", "second" %}<b>{{ second }}</b>{% endcache %}'
+    )
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.app = Flask(__name__)
+        self.app.config["CACHE_SQLITE_PATH"] = os.path.join(
+            self.directory.name, "cache.sqlite"
+        )
+        init_cache(self.app)
+        init_templating(self.app)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def render(self, first: str, second: str) -> str:
+        with self.app.app_context():
+            return render_template_string(self.TEMPLATE, first=first, second=second)
+
+    def test_fragments_are_invalidated_by_their_own_tag(self) -> None:
+        self.assertEqual(self.render("1", "1"), "1|<b>1</b>")
+        self.assertEqual(self.render("2", "2"), "1|<b>1</b>")
+        with self.app.app_context():
+            invalidate_tags("second")
+        self.assertEqual(self.render("3", "3"), "1|<b>3</b>")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import gzip
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+
+import brotli
+from flask import Flask
+
+from portfolio.compression import (
+    compress,
+    compress_static,
+    compress_variants,
+    init_compression,
+    negotiate,
+)
+
+CSS = b"body { color: black; }\n" * 100
+
+
+class TestCompression(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.app = Flask(
+            __name__, static_folder=self.directory.name, static_url_path="/static"
+        )
+        init_compression(self.app)
+        self.client = self.app.test_client()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def write(self, name: str, data: bytes) -> None:
+        with open(os.path.join(self.directory.name, name), "wb") as f:
+            f.write(data)
+
+    def test_negotiate(self) -> None:
+        cases = [
+            ("gzip, br", ["br", "gzip"], "br"),
+            ("gzip;q=1, br;q=0.5", ["br", "gzip"], "gzip"),
+            ("br", ["gzip"], None),
+            ("gzip, br;q=0", ["br", "gzip"], "gzip"),
+            ("", ["br", "gzip"], None),
+        ]
+        for header, available, expected in cases:
+            with self.app.test_request_context(headers={"Accept-Encoding": header}):
+                self.assertEqual(negotiate(available), expected, header)
+
+    def test_compress_variants(self) -> None:
+        variants = compress_variants(CSS, "text/css")
+        self.assertEqual(set(variants), {"br", "gzip"})
+        self.assertEqual(brotli.decompress(variants["br"]), CSS)
+        self.assertEqual(gzip.decompress(variants["gzip"]), CSS)
+        self.assertEqual(compress_variants(CSS[:100], "text/css"), {})
+        self.assertEqual(compress_variants(CSS, "image/png"), {})
+        self.assertEqual(compress_variants(os.urandom(1024), "text/plain"), {})
+
+    def test_dynamic_levels_are_moderate(self) -> None:
+        with mock.patch("portfolio.compression.brotli.compress") as br:
+            compress(CSS, "br")
+        self.assertEqual(br.call_args.kwargs["quality"], 5)
+        with mock.patch("portfolio.compression.brotli.compress") as br:
+            br.return_value = b""
+            self.write("main.css", CSS)
+            compress_static(self.directory.name)
+        self.assertEqual(br.call_args.kwargs["quality"], 11)
+
+    def test_send_precompressed_static(self) -> None:
+        self.write("main.css", CSS)
+        self.assertEqual(compress_static(self.directory.name), 2)
+        self.assertEqual(compress_static(self.directory.name), 0)
+
+        response = self.client.get(
+            "/static/main.css", headers={"Accept-Encoding": "gzip, br"}
+        )
+        self.assertEqual(response.headers["Content-Encoding"], "br")
+        self.assertEqual(response.mimetype, "text/css")
+        self.assertIn("Accept-Encoding", response.vary)
+        self.assertEqual(brotli.decompress(response.get_data()), CSS)
+        response.close()
+
+        response = self.client.get("/static/main.css")
+        self.assertNotIn("Content-Encoding", response.headers)
+        self.assertEqual(response.get_data(), CSS)
+        self.assertIn("Accept-Encoding", response.vary)
+        response.close()
+
+    def test_missing_sibling_serves_original(self) -> None:
+        self.write("small.css", b"a{}")
+        compress_static(self.directory.name)
+        response = self.client.get(
+            "/static/small.css", headers={"Accept-Encoding": "gzip, br"}
+        )
+        self.assertNotIn("Content-Encoding", response.headers)
+        self.assertNotIn("Accept-Encoding", response.vary)
+        self.assertEqual(response.get_data(), b"a{}")
+        response.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+
+from flask import Flask
+
+from portfolio.cache import init_cache, invalidate_tags, register_tag_loader
+from portfolio.conditional import conditional
+
+MODIFIED = datetime(2024, 1, 2, 3, 4, 5)
+
+
+class TestConditional(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.app = Flask(__name__)
+        self.app.config["CACHE_SQLITE_PATH"] = os.path.join(
+            self.directory.name, "cache.sqlite"
+        )
+        init_cache(self.app)
+        self.loads = 0
+        register_tag_loader("rows", self.load)
+        self.renders = 0
+
+        @self.app.route("/rows")
+        @conditional("rows")
+        def rows() -> str:
+            self.renders += 1
+            return f"render {self.renders}"
+
+        self.client = self.app.test_client()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def load(self) -> datetime:
+        self.loads += 1
+        return MODIFIED
+
+    def test_validators(self) -> None:
+        response = self.client.get("/rows")
+        etag, weak = response.get_etag()
+        self.assertTrue(weak)
+        self.assertEqual(response.last_modified.replace(tzinfo=None), MODIFIED)
+        self.assertTrue(response.cache_control.no_cache)
+        self.assertFalse(response.cache_control.private)
+        self.assertTrue(
+            self.client.get(
+                "/rows", headers={"Authorization": "x"}
+            ).cache_control.private
+        )
+
+        fresh = self.client.get("/rows", headers={"If-None-Match": f'W/"{etag}"'})
+        self.assertEqual(fresh.status_code, 304)
+        self.assertEqual(fresh.get_etag(), (etag, True))
+        self.assertEqual(self.renders, 2)
+
+    def test_content_coding_etags(self) -> None:
+        etag, _weak = self.client.get("/rows").get_etag()
+        for encoding in ("br", "gzip"):
+            response = self.client.get(
+                "/rows", headers={"If-None-Match": f'"{etag}-{encoding}"'}
+            )
+            self.assertEqual(response.status_code, 304)
+            self.assertEqual(response.get_etag(), (f"{etag}-{encoding}", True))
+
+    def test_if_modified_since(self) -> None:
+        self.assertEqual(
+            self.client.get(
+                "/rows", headers={"If-Modified-Since": "Tue, 02 Jan 2024 03:04:05 GMT"}
+            ).status_code,
+            304,
+        )
+        self.assertEqual(
+            self.client.get(
+                "/rows", headers={"If-Modified-Since": "Tue, 02 Jan 2024 03:04:04 GMT"}
+            ).status_code,
+            200,
+        )
+
+    def test_database_read_once_per_state(self) -> None:
+        etag, _weak = self.client.get("/rows").get_etag()
+        for headers in (
+            {"If-None-Match": f'W/"{etag}"'},
+            {"If-Modified-Since": "Tue, 02 Jan 2024 03:04:05 GMT"},
+            {},
+        ):
+            self.client.get("/rows", headers=headers)
+        self.assertEqual(self.loads, 1)
+
+    def test_invalidation_changes_the_etag(self) -> None:
+        etag, _weak = self.client.get("/rows").get_etag()
+        with self.app.app_context():
+            invalidate_tags("rows")
+        response = self.client.get("/rows", headers={"If-None-Match": f'W/"{etag}"'})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.get_etag()[0], etag)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from flask import Flask
+from peewee import MySQLDatabase, SqliteDatabase
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+
+from portfolio.db import (
+    Database,
+    connect_models_database,
+    connect_sqlite,
+    normalize_list_fields,
+)
+
+
+class TestModelsDatabase(unittest.TestCase):
+    def test_sqlite_connection_pragmas(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            database = connect_sqlite(os.path.join(directory, "models.db"))
+            with database.connection_context():
+                self.assertEqual(database.journal_mode, "wal")
+                self.assertEqual(database.synchronous, 1)
+                self.assertEqual(database.foreign_keys, 1)
+                self.assertEqual(database.pragma("temp_store"), 2)
+
+    def test_backend_selection(self) -> None:
+        for backend, expected in (
+            ("sqlite", SqliteDatabase),
+            ("SQLite", SqliteDatabase),
+            ("mysql", MySQLDatabase),
+            ("postgres", MySQLDatabase),
+        ):
+            with mock.patch.dict(
+                os.environ,
+                {"DATABASE_BACKEND": backend, "SQLITE_DATABASE_PATH": ":memory:"},
+            ):
+                self.assertIsInstance(connect_models_database(), expected, backend)
+
+
+class TestListFields(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "landing.db")
+        self.app = Flask(__name__)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_normalize_list_fields(self) -> None:
+        self.assertEqual(
+            normalize_list_fields("work", {"description": ["a", "b"], "title": "t"}),
+            {
+                "description": ["a", "b"],
+                "description_items": '["a", "b"]',
+                "title": "t",
+            },
+        )
+        self.assertEqual(
+            normalize_list_fields("about", {"description": "a"}), {"description": "a"}
+        )
+
+    def test_migrate_and_read_items(self) -> None:
+        with sqlite3.connect(self.path) as conn:
+            conn.execute(
+                "CREATE TABLE work (id INTEGER PRIMARY KEY, title TEXT, description TEXT)"
+            )
+            conn.execute("INSERT INTO work (title, description) VALUES ('old', 'x')")
+        with self.app.app_context():
+            db = Database(self.path)
+            self.assertEqual(db.migrate_list_fields("work"), 1)
+            db.insert_data("work", {"title": "new", "description": "y"})
+            rows = db.read_items("work", ["title", "description"])
+            stored = db.read_data("work", ["*"])
+        self.assertEqual(
+            [(row["title"], row["description"]) for row in rows],
+            [("old", ["x"]), ("new", ["y"])],
+        )
+        self.assertEqual([row["description"] for row in stored], ["x", "y"])
+
+    def test_track_changes(self) -> None:
+        with sqlite3.connect(self.path) as conn:
+            conn.execute("CREATE TABLE about (id INTEGER PRIMARY KEY, image TEXT)")
+            conn.execute("INSERT INTO about (image) VALUES ('a'), ('b')")
+        with self.app.app_context():
+            db = Database(self.path)
+            db.track_changes("about")
+            since = db.now()
+            db.insert_data("about", {"id": 2, "image": "c"})
+            _, cursor = db.get_connection()
+            cursor.execute(
+                "INSERT INTO landing_tombstones (table_name, row_id, deleted_at) "
+                "VALUES ('about', 9, '2000-01-01 00:00:00')"
+            )
+            db.delete_data("about", {"id": "1"})
+            rows, deleted = db.read_changes("about", ["image"], since)
+            _, everything = db.read_changes("about", ["image"], datetime(1999, 1, 1))
+        self.assertEqual([(row["id"], row["image"]) for row in rows], [(2, "c")])
+        self.assertEqual(deleted, [1])
+        self.assertEqual(everything, [1])
+
+
+if __name__ == "__main__":
+    unittest.main()
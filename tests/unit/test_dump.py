@@ -0,0 +1,140 @@
+import io
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from flask import Flask
+from peewee import SqliteDatabase
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+
+from portfolio import dump, timeline
+from portfolio.cache import init_cache
+from portfolio.db import Database
+from portfolio.dump import DumpError, import_dump, iter_batches, parse_tables
+from portfolio.filters import format_description
+from portfolio.mysql_db import Timeline
+
+
+class TestDump(unittest.TestCase):
+    def test_batches_keep_line_numbers(self) -> None:
+        stream = io.BytesIO(
+            b'{"table": "work", "row": {"id": 1}}\n'
+            b"\n"
+            b'{"table": "projects", "row": {"id": 2}}\n'
+            b'{"table": "work", "row": {"id": 3}}\n'
+        )
+        self.assertEqual(
+            list(iter_batches(stream, 2)),
+            [
+                {"work": [(1, {"id": 1})], "projects": [(3, {"id": 2})]},
+                {"work": [(4, {"id": 3})]},
+            ],
+        )
+
+    def test_malformed_lines(self) -> None:
+        for line in (b"{oops", b'{"table": "work"}', b'{"table": "x", "row": {}}'):
+            with self.assertRaises(DumpError):
+                list(
+                    iter_batches(
+                        io.BytesIO(b'{"table": "work", "row": {}}\n' + line), 5
+                    )
+                )
+
+    def test_parse_tables(self) -> None:
+        self.assertEqual(parse_tables("work,projects"), ("work", "projects"))
+        self.assertIn("timeline", parse_tables(None))
+        with self.assertRaises(DumpError):
+            parse_tables("tombstone")
+
+
+class TestImportDump(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "landing.db")
+        with sqlite3.connect(self.path) as conn:
+            conn.execute(
+                "CREATE TABLE work (id INTEGER PRIMARY KEY, title TEXT,"
+                " description TEXT, description_items TEXT)"
+            )
+        self.database = SqliteDatabase(":memory:")
+        self.database.bind([Timeline], bind_refs=False, bind_backrefs=False)
+        self.database.create_tables([Timeline])
+        self.app = Flask(__name__)
+        self.app.config["CACHE_SQLITE_PATH"] = os.path.join(
+            self.directory.name, "cache.sqlite"
+        )
+        init_cache(self.app)
+
+    def tearDown(self) -> None:
+        self.database.close()
+        self.directory.cleanup()
+
+    def test_failing_line_keeps_earlier_batches(self) -> None:
+        body = (
+            b'{"table": "work", "row": {"id": 1, "title": "w"}}\n'
+            b'{"table": "timeline", "row": {"id": 1, "timeline_id": 1, "title": "t",'
+            b' "description": "d", "date": "2024-03-07 18:00:00"}}\n'
+            b'{"table": "timeline", "row": {"id": 2, "timeline_id": 2, "title": "t"}}\n'
+            b'{"table": "work", "row": {"id": 2, "title": "never read"}}\n'
+        )
+        with (
+            mock.patch.object(dump, "IMPORT_BATCH_SIZE", 1),
+            mock.patch.object(dump, "mydb", self.database),
+            self.app.test_request_context(method="POST", data=body),
+        ):
+            db = Database(self.path)
+            response, status = import_dump(db)
+            work = db.read_data("work", ["id", "title"])
+        self.assertEqual(status, 400)
+        self.assertEqual(
+            response.get_json(),
+            {
+                "error": "Line 3: Description cannot be None, Date cannot be None",
+                "imported": {"work": 1, "timeline": 1},
+            },
+        )
+        self.assertEqual(work, [{"id": 1, "title": "w"}])
+        self.assertEqual([row.title for row in Timeline.select()], ["t"])
+
+    def test_derived_columns_are_recomputed(self) -> None:
+        body = (
+            b'{"table": "work", "row": {"id": 1, "title": "w",'
+            b' "description": "Built the site",'
+            b' "description_items": "[\\"stale\\"]"}}\n'
+            b'{"table": "timeline", "row": {"id": 1, "timeline_id": 1, "title": "t",'
+            b' "description": "Spoke at PyCon in Pittsburgh",'
+            b' "date": "2024-03-07T18:00:00"}}\n'
+        )
+        with (
+            mock.patch.object(dump, "mydb", self.database),
+            self.app.test_request_context(method="POST", data=body),
+        ):
+            db = Database(self.path)
+            response, status = import_dump(db)
+            work = db.read_data("work", ["description", "description_items"])
+        self.assertEqual(status, 200, response.get_json())
+        self.assertEqual(
+            json.loads(work[0]["description_items"]),
+            format_description(work[0]["description"]),
+        )
+        event = Timeline.get_by_id(1)
+        self.assertEqual(event.date, datetime(2024, 3, 7, 18))
+        self.assertEqual(
+            {
+                "event_type": event.event_type,
+                "location": event.location,
+                "display_date": event.display_date,
+            },
+            timeline.enrich(event.description, event.date),
+        )
+        self.assertIsNotNone(event.display_date)
+
+
+if __name__ == "__main__":
+    unittest.main()
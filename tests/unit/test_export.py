@@ -0,0 +1,104 @@
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+
+from flask import Flask, request
+
+from portfolio.cache import init_cache
+from portfolio.export import (
+    EXPORT_PAGES,
+    ExportError,
+    _swap,
+    export_site,
+    init_export,
+    schedule_publish,
+)
+
+
+class TestExportSite(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        static = os.path.join(self.directory.name, "static")
+        os.makedirs(static)
+        with open(os.path.join(static, "main.css"), "w") as f:
+            f.write("body { color: black; }\n" * 100)
+
+        self.app = Flask(__name__, static_folder=static)
+        self.app.config["CACHE_SQLITE_PATH"] = os.path.join(
+            self.directory.name, "cache.sqlite"
+        )
+        self.app.config["STATIC_EXPORT_KEEP"] = 2
+        self.output = os.path.join(self.directory.name, "site")
+        init_cache(self.app)
+        init_export(self.app)
+        self.authorization = []
+        self.status = 200
+
+        for endpoint in EXPORT_PAGES:
+            rule = "/" if endpoint == "index" else f"/{endpoint}"
+            self.app.add_url_rule(rule, endpoint, self.page)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def page(self):
+        self.authorization.append(request.headers.get("Authorization"))
+        return f"<html>{request.path}</html>" * 50, self.status
+
+    def read(self, name: str) -> str:
+        with open(os.path.join(self.output, name)) as f:
+            return f.read()
+
+    def test_publishes_pages_as_anonymous_visitor(self) -> None:
+        release = export_site(self.app, self.output)
+        self.assertEqual(os.path.realpath(self.output), release)
+        self.assertIn("<html>/projects</html>", self.read("projects/index.html"))
+        self.assertTrue(os.path.exists(os.path.join(self.output, "static/main.css.gz")))
+        self.assertFalse(os.path.exists(os.path.join(self.output, "data")))
+        self.assertEqual(self.authorization, [None] * len(EXPORT_PAGES))
+
+    def test_swaps_and_prunes_releases(self) -> None:
+        releases = [export_site(self.app, self.output) for _ in range(3)]
+        self.assertEqual(os.path.realpath(self.output), releases[-1])
+        remaining = os.listdir(os.path.join(self.directory.name, "releases"))
+        self.assertEqual(
+            sorted(remaining), sorted(os.path.basename(r) for r in releases[1:])
+        )
+
+    def test_failed_render_keeps_previous_release(self) -> None:
+        release = export_site(self.app, self.output)
+        self.status = 500
+        with self.assertRaises(ExportError):
+            export_site(self.app, self.output)
+        self.assertEqual(os.path.realpath(self.output), release)
+        self.assertEqual(
+            os.listdir(os.path.join(self.directory.name, "releases")),
+            [os.path.basename(release)],
+        )
+
+    def test_swap_refuses_a_directory(self) -> None:
+        os.makedirs(self.output)
+        with self.assertRaises(ExportError):
+            _swap(self.output, self.directory.name)
+
+
+class TestSchedulePublish(unittest.TestCase):
+    def test_writes_close_together_publish_once(self) -> None:
+        published = threading.Event()
+        with mock.patch(
+            "portfolio.export._publish", side_effect=lambda app: published.set()
+        ) as publish:
+            for _ in range(3):
+                schedule_publish(mock.sentinel.app, delay=0.05)
+            self.assertTrue(published.wait(2))
+            threading.Event().wait(0.1)
+        publish.assert_called_once_with(mock.sentinel.app)
+
+
+if __name__ == "__main__":
+    unittest.main()
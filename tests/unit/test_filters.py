@@ -0,0 +1,51 @@
+import os
+import sys
+import unittest
+
+from jinja2 import DictLoader, Environment
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+
+from portfolio.filters import (
+    FILTERS,
+    compile_pattern,
+    filter_stats,
+    precompile_patterns,
+    regex_replace,
+    reset_filter_stats,
+)
+
+
+class TestFilters(unittest.TestCase):
+    def setUp(self) -> None:
+        reset_filter_stats()
+        compile_pattern.clear_cache()
+        self.patterns = compile_pattern.stats()
+
+    def test_regex_replace_compiles_once(self) -> None:
+        self.assertEqual(regex_replace("a1b22", r"\d+", "#"), "a#b#")
+        self.assertEqual(regex_replace("c333", r"\d+", "#"), "c#")
+        stats = filter_stats()
+        self.assertEqual(stats["regex_replace"]["calls"], 2)
+        self.assertEqual(stats["patterns"]["misses"] - self.patterns["misses"], 1)
+        self.assertEqual(stats["patterns"]["hits"] - self.patterns["hits"], 1)
+
+    def test_precompile_template_patterns(self) -> None:
+        env = Environment(
+            loader=DictLoader(
+                {
+                    "page": "{{ value|regex_replace('\\\\s+', ' ') }}"
+                    "{{ value|regex_replace(pattern, '') }}"
+                }
+            )
+        )
+        env.filters.update(FILTERS)
+        self.assertEqual(precompile_patterns(env, ["page"]), 1)
+        self.assertEqual(
+            env.get_template("page").render(value="a  b", pattern="b"), "a ba  "
+        )
+        self.assertEqual(compile_pattern.stats()["entries"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import os
+import sys
+import unittest
+
+from peewee import CharField, Model, SqliteDatabase
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+
+from portfolio.migrations import copy_tables, create_missing_indexes, migrate_models
+from portfolio.mysql_db import TimestampField
+
+
+class TestCreateMissingIndexes(unittest.TestCase):
+    def test_creates_indexes_added_after_the_table(self) -> None:
+        database = SqliteDatabase(":memory:")
+
+        class Item(Model):
+            name = CharField()
+
+            class Meta:
+                table_name = "item"
+
+        class IndexedItem(Model):
+            name = CharField(index=True)
+
+            class Meta:
+                table_name = "item"
+
+        database.bind([Item, IndexedItem])
+        database.create_tables([Item])
+        created = create_missing_indexes(database, IndexedItem)
+        self.assertEqual(
+            [index.columns for index in database.get_indexes("item")], [["name"]]
+        )
+        self.assertEqual(len(created), 1)
+        self.assertEqual(create_missing_indexes(database, IndexedItem), [])
+
+
+class TestMigrateModels(unittest.TestCase):
+    def test_reports_added_columns_once(self) -> None:
+        database = SqliteDatabase(":memory:")
+
+        class Item(Model):
+            name = CharField()
+
+            class Meta:
+                table_name = "item"
+
+        class DerivedItem(Model):
+            name = CharField()
+            display_name = CharField(null=True)
+
+            class Meta:
+                table_name = "item"
+
+        database.bind([Item, DerivedItem])
+        database.create_tables([Item])
+        self.assertEqual(
+            migrate_models(database, [DerivedItem]), {"item": ["display_name"]}
+        )
+        self.assertEqual(migrate_models(database, [DerivedItem]), {"item": []})
+
+    def test_adds_timestamps_to_sqlite_tables(self) -> None:
+        database = SqliteDatabase(":memory:")
+
+        class Item(Model):
+            name = CharField()
+
+            class Meta:
+                table_name = "item"
+
+        class TrackedItem(Model):
+            name = CharField()
+            updated_at = TimestampField(auto_update=True, null=True)
+
+            class Meta:
+                table_name = "item"
+
+        database.bind([Item, TrackedItem])
+        database.create_tables([Item])
+        Item.create(name="old")
+        migrate_models(database, [TrackedItem])
+        TrackedItem.create(name="new")
+        self.assertTrue(all(item.updated_at for item in TrackedItem.select()))
+
+
+class TestCopyTables(unittest.TestCase):
+    def test_replaces_target_rows(self) -> None:
+        source = SqliteDatabase(":memory:")
+        target = SqliteDatabase(":memory:")
+
+        class Item(Model):
+            name = CharField()
+
+            class Meta:
+                table_name = "item"
+
+        with source.bind_ctx([Item]):
+            source.create_tables([Item])
+            Item.insert_many([{"name": f"n{i}"} for i in range(5)]).execute()
+        with target.bind_ctx([Item]):
+            target.create_tables([Item])
+            Item.create(name="stale")
+
+        self.assertEqual(copy_tables(source, target, [Item], batch_size=2), {"item": 5})
+        with target.bind_ctx([Item]):
+            self.assertEqual(
+                [item.name for item in Item.select().order_by(Item.id)],
+                [f"n{i}" for i in range(5)],
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
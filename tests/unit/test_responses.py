@@ -0,0 +1,33 @@
+import os
+import sys
+import unittest
+from datetime import datetime
+
+from flask import Flask
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+
+from portfolio.responses import dumps
+
+
+class TestDumps(unittest.TestCase):
+    def test_matches_jsonify(self) -> None:
+        app = Flask(__name__)
+        payload = {
+            "name": "b",
+            "id": 1,
+            "nested": {"z": [1.5, None], "a": True},
+            "updated_at": datetime(2024, 1, 2, 3, 4, 5),
+        }
+        with app.app_context():
+            expected = app.json.response(payload).get_data()
+        self.assertEqual(dumps(payload) + b"\n", expected)
+
+    def test_keys_sorted(self) -> None:
+        self.assertEqual(
+            dumps({"b": 1, "a": {"d": 2, "c": 3}}), b'{"a":{"c":3,"d":2},"b":1}'
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+
+from portfolio.schemas import (
+    LANDING_METADATA,
+    LandingSchema,
+    PlacesSchema,
+    SchemaType,
+    validate_rows,
+)
+
+
+class TestRecordSchemas(unittest.TestCase):
+    def test_dump_matches_json(self) -> None:
+        place = PlacesSchema(name="n", description="d", lat=1.0, lng=2.0, id=3)
+        self.assertEqual(PlacesSchema.dump(place.json()), place.json())
+        self.assertEqual(
+            list(place.json()), ["id", "name", "description", "lat", "lng"]
+        )
+        self.assertEqual(
+            PlacesSchema.dump({"name": "n"}),
+            {"id": None, "name": "n", "description": "", "lat": 0.0, "lng": 0.0},
+        )
+        self.assertFalse(hasattr(place, "__dict__"))
+
+    def test_landing_metadata_is_not_shared(self) -> None:
+        landing = LandingSchema(
+            education=[], places=[], work=[], about={}, metadata={"page": 2}
+        ).json()
+        self.assertEqual(landing["metadata"]["page"], 2)
+        self.assertEqual(LANDING_METADATA["page"], 0)
+        self.assertGreater(landing["metadata"]["timestamp"], 0)
+        self.assertEqual(landing["data"]["about"]["description"], "")
+
+    def test_sparse_sections_and_fields(self) -> None:
+        landing = LandingSchema(
+            work=[{"id": 1, "title": "t", "company": "c"}],
+            fields={"work": ["title"]},
+            include_metadata=False,
+        ).json()
+        self.assertEqual(landing, {"data": {"work": [{"id": 1, "title": "t"}]}})
+
+
+class TestBatchValidation(unittest.TestCase):
+    def test_errors_indexed_by_row(self) -> None:
+        rows = [
+            {"name": "a", "description": "b", "image": "c"},
+            {"name": 1, "description": "b"},
+            "not a row",
+        ]
+        self.assertEqual(
+            validate_rows(SchemaType.HOBBIES, rows),
+            {
+                1: ["Name must be a string", "Image cannot be None"],
+                2: ["Row must be an object"],
+            },
+        )
+
+    def test_timeline_dates(self) -> None:
+        rows = [
+            {"title": "a", "description": "b", "date": "2024-03-07 18:00:00"},
+            {"title": "a", "date": "yesterday"},
+        ]
+        self.assertEqual(
+            validate_rows(SchemaType.TIMELINE, rows),
+            {1: ["Description cannot be None", "Date must be an ISO 8601 date"]},
+        )
+
+    def test_unsupported_schema(self) -> None:
+        with self.assertRaises(ValueError):
+            validate_rows(SchemaType.WORK, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import os
+import sys
+import unittest
+from datetime import datetime
+
+from peewee import SqliteDatabase
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+
+from portfolio import services
+from portfolio.mysql_db import Hobbies, Projects, Timeline
+
+MODELS = [Hobbies, Projects, Timeline]
+
+
+class TestServices(unittest.TestCase):
+    def setUp(self) -> None:
+        self.database = SqliteDatabase(":memory:")
+        self.database.bind(MODELS, bind_refs=False, bind_backrefs=False)
+        self.database.create_tables(MODELS)
+        for timeline_id, day in enumerate((2, 1)):
+            Timeline.create(
+                timeline_id=timeline_id,
+                title=f"t{day}",
+                description="",
+                date=datetime(2024, 1, day),
+            )
+        Hobbies.create(hobbies_id=1, name="h", description="", image="h.png")
+        for projects_id in (1, 2):
+            Projects.create(
+                projects_id=projects_id,
+                name=f"p{projects_id}",
+                description="",
+                url="",
+                language="Python",
+            )
+
+    def tearDown(self) -> None:
+        self.database.close()
+
+    def test_lists_are_plain_rows(self) -> None:
+        hobbies = services.list_hobbies()
+        self.assertEqual([row["name"] for row in hobbies], ["h"])
+        self.assertIsInstance(hobbies[0], dict)
+        self.assertEqual(
+            [row["name"] for row in services.list_projects()], ["p1", "p2"]
+        )
+
+    def test_timeline_in_date_order(self) -> None:
+        self.assertEqual(
+            [row["title"] for row in services.list_timeline()], ["t1", "t2"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
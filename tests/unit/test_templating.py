@@ -0,0 +1,70 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+
+from flask import Flask
+from jinja2 import FileSystemBytecodeCache
+
+from portfolio.commands import precompile_templates_command
+from portfolio.templating import init_templating, precompile_templates
+
+
+class TestBytecodeCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.templates = os.path.join(self.directory.name, "templates")
+        self.bytecode = os.path.join(self.directory.name, "jinja")
+        os.makedirs(os.path.join(self.templates, "pages"))
+        for name, source in (
+            ("layout.jinja2", "<main>{% block body %}{% endblock %}</main>"),
+            (
+                "pages/home.html",
+                "{% extends 'layout.jinja2' %}{% block body %}hi{% endblock %}",
+            ),
+            ("notes.txt", "not a template"),
+        ):
+            with open(os.path.join(self.templates, name), "w") as f:
+                f.write(source)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def make_app(self, **config) -> Flask:
+        app = Flask(__name__, template_folder=self.templates)
+        app.config.update(JINJA_BYTECODE_CACHE_DIR=self.bytecode, **config)
+        init_templating(app)
+        return app
+
+    def test_precompile_fills_the_bytecode_cache(self) -> None:
+        self.assertEqual(precompile_templates(self.make_app()), 2)
+        self.assertEqual(len(os.listdir(self.bytecode)), 2)
+
+        # A new worker loads the compiled templates instead of compiling them.
+        app = self.make_app()
+        with mock.patch.object(FileSystemBytecodeCache, "dump_bytecode") as dump:
+            with app.app_context():
+                self.assertEqual(
+                    app.jinja_env.get_template("pages/home.html").render(),
+                    "<main>hi</main>",
+                )
+        dump.assert_not_called()
+
+    def test_eager_load(self) -> None:
+        app = self.make_app(JINJA_EAGER_LOAD=True)
+        self.assertEqual(len(app.jinja_env.cache), 2)
+
+    def test_command(self) -> None:
+        app = self.make_app()
+        result = app.test_cli_runner().invoke(precompile_templates_command)
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(
+            result.output.strip(), f"Compiled 2 templates into {self.bytecode}"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
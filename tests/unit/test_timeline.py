@@ -0,0 +1,43 @@
+import os
+import sys
+import unittest
+from datetime import datetime
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+
+from portfolio.timeline import enrich, extract_event, format_display_date
+
+
+class TestTimelineEnrichment(unittest.TestCase):
+    def test_event_type_and_location(self) -> None:
+        description = (
+            "Thursday, March 7\n6:00 PM Workshop / Study Group "
+            "Farmingdale State College, Lupton Hall"
+        )
+        self.assertEqual(
+            extract_event(description),
+            (["Workshop / Study Group"], "Farmingdale State College, Lupton Hall"),
+        )
+
+    def test_description_without_event(self) -> None:
+        self.assertEqual(extract_event("Just some text"), ([], None))
+
+    def test_display_date_formats(self) -> None:
+        expected = "Thu, 07 Mar 2024"
+        self.assertEqual(format_display_date(datetime(2024, 3, 7, 18)), expected)
+        self.assertEqual(format_display_date("2024-03-07T18:00:00"), expected)
+        self.assertEqual(format_display_date("Thu, 07 Mar 2024 18:00:00 GMT"), expected)
+
+    def test_enrich_columns(self) -> None:
+        self.assertEqual(
+            enrich("a b c d e Hackathon Room 5", datetime(2024, 3, 7)),
+            {
+                "event_type": "Hackathon",
+                "location": "Room 5",
+                "display_date": "Thu, 07 Mar 2024",
+            },
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
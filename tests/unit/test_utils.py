@@ -0,0 +1,68 @@
+import os
+import sys
+import time
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+
+from portfolio.utils import Memoize, deep_sizeof, memoize
+
+
+class TestMemoize(unittest.TestCase):
+    def setUp(self) -> None:
+        self.calls = 0
+
+    def double(self, value: int, scale: int = 2) -> int:
+        self.calls += 1
+        return value * scale
+
+    def test_kwargs_are_part_of_the_key(self) -> None:
+        cached = Memoize(self.double)
+        self.assertEqual(cached(3), 6)
+        self.assertEqual(cached(3), 6)
+        self.assertEqual(cached(3, scale=3), 9)
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(cached.stats()["hits"], 1)
+        self.assertEqual(cached.stats()["misses"], 2)
+
+    def test_least_recently_used_is_evicted(self) -> None:
+        cached = Memoize(self.double, maxsize=2)
+        cached(1)
+        cached(2)
+        cached(1)
+        cached(3)
+        self.assertEqual(cached.stats()["evictions"], 1)
+        cached(1)
+        self.assertEqual(self.calls, 3)
+        cached(2)
+        self.assertEqual(self.calls, 4)
+
+    def test_entries_expire(self) -> None:
+        cached = Memoize(self.double, ttl=0.05)
+        cached(1)
+        time.sleep(0.1)
+        cached(1)
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(cached.stats()["expirations"], 1)
+
+    def test_byte_budget_is_respected(self) -> None:
+        @memoize(maxsize=None, max_bytes=4096)
+        def payload(n: int) -> str:
+            return "x" * 1000 + str(n)
+
+        for n in range(20):
+            payload(n)
+        self.assertLessEqual(payload.memory_allocated(), 4096)
+        self.assertGreater(payload.stats()["evictions"], 0)
+
+    def test_unhashable_arguments_bypass_the_cache(self) -> None:
+        cached = Memoize(lambda items: len(items))
+        self.assertEqual(cached([1, 2]), 2)
+        self.assertEqual(cached.stats()["entries"], 0)
+
+    def test_deep_sizeof_counts_contents(self) -> None:
+        self.assertGreater(deep_sizeof({"key": "x" * 1000}), 1000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+
+from flask import Flask
+
+from portfolio import warmup
+from portfolio.cache import cached_view, init_cache, invalidate_tags
+from portfolio.warmup import WARMUP_ENDPOINTS, init_warmup, warm_endpoints
+
+
+class TestWarmup(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.app = Flask(__name__)
+        self.app.config["CACHE_SQLITE_PATH"] = os.path.join(
+            self.directory.name, "cache.sqlite"
+        )
+        self.app.config["CACHE_WARMUP"] = True
+        init_cache(self.app)
+        self.renders = {endpoint: 0 for endpoint in WARMUP_ENDPOINTS}
+        # Tags of their own, so the loaders of the real tables never run.
+        for endpoint in WARMUP_ENDPOINTS:
+            rule = "/" if endpoint == "index" else f"/{endpoint}"
+            self.app.add_url_rule(
+                rule, endpoint, cached_view(f"{endpoint}-rows")(self.view(endpoint))
+            )
+
+    def tearDown(self) -> None:
+        self.drain()
+        self.directory.cleanup()
+
+    def view(self, endpoint: str):
+        def render() -> str:
+            self.renders[endpoint] += 1
+            return endpoint
+
+        return render
+
+    def drain(self) -> None:
+        if warmup._executor is not None:
+            warmup._executor.shutdown(wait=True)
+            warmup._executor = None
+
+    def test_every_page_warmed_on_startup(self) -> None:
+        init_warmup(self.app)
+        self.drain()
+        self.assertEqual(self.renders, {endpoint: 1 for endpoint in WARMUP_ENDPOINTS})
+        response = self.app.test_client().get("/projects")
+        self.assertEqual(response.headers["X-Cache"], "HIT")
+
+    def test_invalidation_rewarms_only_dependent_pages(self) -> None:
+        init_warmup(self.app)
+        self.drain()
+        with self.app.test_request_context("/api"):
+            invalidate_tags("projects-rows")
+        self.drain()
+        self.assertEqual(self.renders["projects"], 2)
+        self.assertEqual(self.renders["hobbies"], 1)
+
+    def test_queued_page_is_not_queued_again(self) -> None:
+        self.app.config["CACHE_WARMUP"] = False
+        init_warmup(self.app)
+        with warmup._pending_lock:
+            warmup._pending.add("index")
+        try:
+            warm_endpoints(self.app, ["index", "contact"])
+            self.drain()
+        finally:
+            warmup._pending.discard("index")
+        self.assertEqual(self.renders["index"], 0)
+        self.assertEqual(self.renders["contact"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()